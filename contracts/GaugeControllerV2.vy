@@ -20,16 +20,16 @@ struct VotedSlope:
     power: uint256
     end: uint256
 
-struct MirroredChain:
+struct MirroredLockId:
     chain_id: uint256
-    escrow_count: uint256
+    escrow_id: uint256
 
 
 interface MirroredVotingEscrow:
     def get_last_user_slope(_addr: address, _chain: uint256, _escrow_id: uint256) -> int128: view
     def locked__end(_addr: address, _chain: uint256, _escrow_id: uint256) -> uint256: view
-    def mirrored_chains_count() -> uint256: view
-    def mirrored_chains(_idx: uint256) -> MirroredChain: view
+    def mirrored_user_lock_count(_user: address) -> uint256: view
+    def mirrored_user_locks(_user: address, _idx: uint256) -> MirroredLockId: view
     def voting_escrow_count() -> uint256: view
 
 
@@ -68,6 +68,9 @@ event NewGauge:
 
 
 MULTIPLIER: constant(uint256) = 10 ** 18
+MAX_USER_LOCKS: constant(uint256) = 500
+MAX_WEEKS: constant(uint256) = 500  # weeks filled by a regular checkpoint
+MAX_CLAMPED_TYPES: constant(int128) = 100
 
 admin: public(address)  # Can and will be a smart contract
 future_admin: public(address)  # Can and will be a smart contract
@@ -106,8 +109,17 @@ changes_sum: HashMap[int128, HashMap[uint256, uint256]]  # type_id -> time -> sl
 time_sum: public(uint256[1000000000])  # type_id -> last scheduled time (next week)
 
 points_total: public(HashMap[uint256, uint256])  # time -> total weight
+points_total_slope: public(HashMap[uint256, uint256])  # time -> sum of type sum slopes times type weights
+changes_total: HashMap[uint256, uint256]  # time -> weighted slope
 time_total: public(uint256)  # last scheduled time
 
+# A lowered gauge weight can leave its type sum with more slope than bias, so the
+# sum clamps at zero early. Such types are added to the total week by week
+# instead of through the weighted slope
+clamped_types: public(int128[MAX_CLAMPED_TYPES])
+n_clamped_types: public(int128)
+is_clamped_type: public(HashMap[int128, bool])
+
 points_type_weight: public(HashMap[int128, HashMap[uint256, uint256]])  # type_id -> time -> type weight
 time_type_weight: public(uint256[1000000000])  # type_id -> last scheduled time (next week)
 
@@ -163,22 +175,23 @@ def gauge_types(_addr: address) -> int128:
 
 
 @internal
-def _get_type_weight(gauge_type: int128) -> uint256:
+def _get_type_weight(gauge_type: int128, _max_weeks: uint256) -> uint256:
     """
     @notice Fill historic type weights week-over-week for missed checkins
             and return the type weight for the future week
     @param gauge_type Gauge type id
+    @param _max_weeks Maximum number of weeks to fill
     @return Type weight
     """
     t: uint256 = self.time_type_weight[gauge_type]
     if t > 0:
         w: uint256 = self.points_type_weight[gauge_type][t]
         for i in range(500):
-            if t > block.timestamp:
+            if t > block.timestamp or i >= _max_weeks:
                 break
             t += WEEK
             self.points_type_weight[gauge_type][t] = w
-            if t > block.timestamp:
+            if t > block.timestamp or i + 1 == _max_weeks:
                 self.time_type_weight[gauge_type] = t
         return w
     else:
@@ -186,18 +199,19 @@ def _get_type_weight(gauge_type: int128) -> uint256:
 
 
 @internal
-def _get_sum(gauge_type: int128) -> uint256:
+def _get_sum(gauge_type: int128, _max_weeks: uint256) -> uint256:
     """
     @notice Fill sum of gauge weights for the same type week-over-week for
             missed checkins and return the sum for the future week
     @param gauge_type Gauge type id
+    @param _max_weeks Maximum number of weeks to fill
     @return Sum of weights
     """
     t: uint256 = self.time_sum[gauge_type]
     if t > 0:
         pt: Point = self.points_sum[gauge_type][t]
         for i in range(500):
-            if t > block.timestamp:
+            if t > block.timestamp or i >= _max_weeks:
                 break
             t += WEEK
             d_bias: uint256 = pt.slope * WEEK
@@ -209,7 +223,7 @@ def _get_sum(gauge_type: int128) -> uint256:
                 pt.bias = 0
                 pt.slope = 0
             self.points_sum[gauge_type][t] = pt
-            if t > block.timestamp:
+            if t > block.timestamp or i + 1 == _max_weeks:
                 self.time_sum[gauge_type] = t
         return pt.bias
     else:
@@ -217,57 +231,83 @@ def _get_sum(gauge_type: int128) -> uint256:
 
 
 @internal
-def _get_total() -> uint256:
+@view
+def _clamped_total(t: uint256, n_clamped: int128) -> uint256:
+    """
+    @notice Get the weighted sum of the clamped types at time `t`
+    @param t Week to read, the type sums must be filled up to it
+    @param n_clamped Number of clamped types
+    @return Weighted sum of the clamped types
+    """
+    total: uint256 = 0
+    for i in range(MAX_CLAMPED_TYPES):
+        if i >= n_clamped:
+            break
+        gauge_type: int128 = self.clamped_types[i]
+        type_weight: uint256 = self.points_type_weight[gauge_type][min(t, self.time_type_weight[gauge_type])]
+        total += type_weight * self.points_sum[gauge_type][t].bias
+    return total
+
+
+@internal
+def _get_total(_max_weeks: uint256) -> uint256:
     """
     @notice Fill historic total weights week-over-week for missed checkins
             and return the total for the future week
+    @dev The total is kept as a weighted bias / slope of its own, so filling
+         does not depend on the number of gauge types. Clamped types are
+         added from their own sums, which clamp at zero like `_get_sum` does
+    @param _max_weeks Maximum number of weeks to fill
     @return Total weight
     """
     t: uint256 = self.time_total
-    _n_gauge_types: int128 = self.n_gauge_types
     if t > block.timestamp:
-        # If we have already checkpointed - still need to change the value
-        t -= WEEK
-    pt: uint256 = self.points_total[t]
+        return self.points_total[t]
 
-    for gauge_type in range(100):
-        if gauge_type == _n_gauge_types:
+    n_clamped: int128 = self.n_clamped_types
+    for i in range(MAX_CLAMPED_TYPES):
+        if i >= n_clamped:
             break
-        self._get_sum(gauge_type)
-        self._get_type_weight(gauge_type)
+        self._get_sum(self.clamped_types[i], _max_weeks)
 
+    total: uint256 = self.points_total[t]
+    pt: uint256 = total - self._clamped_total(t, n_clamped)
+    slope: uint256 = self.points_total_slope[t]
     for i in range(500):
-        if t > block.timestamp:
+        if t > block.timestamp or i >= _max_weeks:
             break
         t += WEEK
-        pt = 0
-        # Scales as n_types * n_unchecked_weeks (hopefully 1 at most)
-        for gauge_type in range(100):
-            if gauge_type == _n_gauge_types:
-                break
-            type_sum: uint256 = self.points_sum[gauge_type][t].bias
-            type_weight: uint256 = self.points_type_weight[gauge_type][t]
-            pt += type_sum * type_weight
-        self.points_total[t] = pt
-
-        if t > block.timestamp:
+        d_bias: uint256 = slope * WEEK
+        if pt > d_bias:
+            pt -= d_bias
+            d_slope: uint256 = self.changes_total[t]
+            slope -= min(d_slope, slope)
+        else:
+            pt = 0
+            slope = 0
+        total = pt + self._clamped_total(t, n_clamped)
+        self.points_total[t] = total
+        self.points_total_slope[t] = slope
+
+        if t > block.timestamp or i + 1 == _max_weeks:
             self.time_total = t
-    return pt
+    return total
 
 
 @internal
-def _get_weight(gauge_addr: address) -> uint256:
+def _get_weight(gauge_addr: address, _max_weeks: uint256) -> uint256:
     """
     @notice Fill historic gauge weights week-over-week for missed checkins
             and return the total for the future week
     @param gauge_addr Address of the gauge
+    @param _max_weeks Maximum number of weeks to fill
     @return Gauge weight
     """
     t: uint256 = self.time_weight[gauge_addr]
     if t > 0:
         pt: Point = self.points_weight[gauge_addr][t]
         for i in range(500):
-            if t > block.timestamp:
+            if t > block.timestamp or i >= _max_weeks:
                 break
             t += WEEK
             d_bias: uint256 = pt.slope * WEEK
@@ -279,7 +319,7 @@ def _get_weight(gauge_addr: address) -> uint256:
                 pt.bias = 0
                 pt.slope = 0
             self.points_weight[gauge_addr][t] = pt
-            if t > block.timestamp:
+            if t > block.timestamp or i + 1 == _max_weeks:
                 self.time_weight[gauge_addr] = t
         return pt.bias
     else:
@@ -306,9 +346,9 @@ def add_gauge(addr: address, gauge_type: int128, weight: uint256 = 0):
     next_time: uint256 = (block.timestamp + WEEK) / WEEK * WEEK
 
     if weight > 0:
-        _type_weight: uint256 = self._get_type_weight(gauge_type)
-        _old_sum: uint256 = self._get_sum(gauge_type)
-        _old_total: uint256 = self._get_total()
+        _type_weight: uint256 = self._get_type_weight(gauge_type, MAX_WEEKS)
+        _old_sum: uint256 = self._get_sum(gauge_type, MAX_WEEKS)
+        _old_total: uint256 = self._get_total(MAX_WEEKS)
 
         self.points_sum[gauge_type][next_time].bias = weight + _old_sum
         self.time_sum[gauge_type] = next_time
@@ -329,7 +369,7 @@ def checkpoint():
     """
     @notice Checkpoint to fill data common for all gauges
     """
-    self._get_total()
+    self._get_total(MAX_WEEKS)
 
 
 @external
@@ -338,8 +378,79 @@ def checkpoint_gauge(addr: address):
     @notice Checkpoint to fill data for both a specific gauge and common for all gauges
     @param addr Gauge address
     """
-    self._get_weight(addr)
-    self._get_total()
+    self._get_weight(addr, MAX_WEEKS)
+    self._get_total(MAX_WEEKS)
+
+
+@external
+def checkpoint_gauge_weeks(addr: address, _max_weeks: uint256):
+    """
+    @notice Fill at most `_max_weeks` missed weeks of gauge `addr` weight
+    @dev Lets keepers split a long catch-up into bounded transactions
+    @param addr Gauge address
+    @param _max_weeks Maximum number of weeks to fill
+    """
+    self._get_weight(addr, min(_max_weeks, MAX_WEEKS))
+
+
+@external
+def checkpoint_type_weeks(type_id: int128, _max_weeks: uint256):
+    """
+    @notice Fill at most `_max_weeks` missed weeks of type `type_id` weight and sum
+    @param type_id Gauge type id
+    @param _max_weeks Maximum number of weeks to fill
+    """
+    self._get_type_weight(type_id, min(_max_weeks, MAX_WEEKS))
+    self._get_sum(type_id, min(_max_weeks, MAX_WEEKS))
+
+
+@external
+def checkpoint_total_weeks(_max_weeks: uint256):
+    """
+    @notice Fill at most `_max_weeks` missed weeks of the total weight
+    @param _max_weeks Maximum number of weeks to fill
+    """
+    self._get_total(min(_max_weeks, MAX_WEEKS))
+
+
+@internal
+@view
+def _pending_weeks(t: uint256) -> uint256:
+    if t == 0 or t > block.timestamp:
+        return 0
+    return (block.timestamp - t) / WEEK + 1
+
+
+@external
+@view
+def pending_gauge_weeks(addr: address) -> uint256:
+    """
+    @notice Get the number of weeks gauge `addr` weight still has to fill
+    @param addr Gauge address
+    @return Number of weeks
+    """
+    return self._pending_weeks(self.time_weight[addr])
+
+
+@external
+@view
+def pending_type_weeks(type_id: int128) -> uint256:
+    """
+    @notice Get the number of weeks type `type_id` weight or sum still has to fill
+    @param type_id Gauge type id
+    @return Number of weeks
+    """
+    return max(self._pending_weeks(self.time_type_weight[type_id]), self._pending_weeks(self.time_sum[type_id]))
+
+
+@external
+@view
+def pending_total_weeks() -> uint256:
+    """
+    @notice Get the number of weeks the total weight still has to fill
+    @return Number of weeks
+    """
+    return self._pending_weeks(self.time_total)
 
 
 @internal
@@ -358,7 +469,8 @@ def _gauge_relative_weight(addr: address, time: uint256) -> uint256:
 
     if _total_weight > 0:
         gauge_type: int128 = self.gauge_types_[addr] - 1
-        _type_weight: uint256 = self.points_type_weight[gauge_type][t]
+        # type weights are only filled when touched, the last scheduled one holds after that
+        _type_weight: uint256 = self.points_type_weight[gauge_type][min(t, self.time_type_weight[gauge_type])]
         _gauge_weight: uint256 = self.points_weight[addr][t].bias
         return MULTIPLIER * _type_weight * _gauge_weight / _total_weight
 
@@ -390,8 +502,8 @@ def gauge_relative_weight_write(addr: address, time: uint256 = block.timestamp)
     @param time Relative weight at the specified timestamp in the past or present
     @return Value of relative weight normalized to 1e18
     """
-    self._get_weight(addr)
-    self._get_total()  # Also calculates get_sum
+    self._get_weight(addr, MAX_WEEKS)
+    self._get_total(MAX_WEEKS)
     return self._gauge_relative_weight(addr, time)
 
 
@@ -404,13 +516,26 @@ def _change_type_weight(type_id: int128, weight: uint256):
     @param type_id Type id
     @param weight New type weight
     """
-    old_weight: uint256 = self._get_type_weight(type_id)
-    old_sum: uint256 = self._get_sum(type_id)
-    _total_weight: uint256 = self._get_total()
+    old_weight: uint256 = self._get_type_weight(type_id, MAX_WEEKS)
+    old_sum: uint256 = self._get_sum(type_id, MAX_WEEKS)
+    _total_weight: uint256 = self._get_total(MAX_WEEKS)
     next_time: uint256 = (block.timestamp + WEEK) / WEEK * WEEK
+    old_sum_slope: uint256 = self.points_sum[type_id][next_time].slope
 
     _total_weight = _total_weight + old_sum * weight - old_sum * old_weight
     self.points_total[next_time] = _total_weight
+
+    if not self.is_clamped_type[type_id]:
+        self.points_total_slope[next_time] = self.points_total_slope[next_time] + old_sum_slope * weight - old_sum_slope * old_weight
+
+        # Reweight the slope changes already scheduled for this type, including
+        # the ones at `next_time` which a re-vote may still subtract
+        t: uint256 = next_time
+        for i in range(255):
+            d_slope: uint256 = self.changes_sum[type_id][t]
+            if d_slope > 0:
+                self.changes_total[t] = self.changes_total[t] + d_slope * weight - d_slope * old_weight
+            t += WEEK
     self.points_type_weight[type_id][next_time] = weight
     self.time_total = next_time
     self.time_type_weight[type_id] = next_time
@@ -445,15 +570,40 @@ def change_type_weight(type_id: int128, weight: uint256):
     self._change_type_weight(type_id, weight)
 
 
+@internal
+def _clamp_type(type_id: int128, type_weight: uint256, next_time: uint256):
+    """
+    @notice Add type `type_id` to the total from its own sum from now on
+    @dev Its weighted slope and scheduled slope changes leave the running total
+    @param type_id Type id
+    @param type_weight Current type weight
+    @param next_time Next week, up to which the total is filled
+    """
+    n: int128 = self.n_clamped_types
+    assert n < MAX_CLAMPED_TYPES  # dev: too many clamped types
+    self.clamped_types[n] = type_id
+    self.n_clamped_types = n + 1
+    self.is_clamped_type[type_id] = True
+
+    slope: uint256 = self.points_total_slope[next_time]
+    self.points_total_slope[next_time] = slope - min(self.points_sum[type_id][next_time].slope * type_weight, slope)
+    t: uint256 = next_time
+    for i in range(255):
+        d_slope: uint256 = self.changes_sum[type_id][t] * type_weight
+        if d_slope > 0:
+            self.changes_total[t] -= min(d_slope, self.changes_total[t])
+        t += WEEK
+
+
 @internal
 def _change_gauge_weight(addr: address, weight: uint256):
     # Change gauge weight
     # Only needed when testing in reality
     gauge_type: int128 = self.gauge_types_[addr] - 1
-    old_gauge_weight: uint256 = self._get_weight(addr)
-    type_weight: uint256 = self._get_type_weight(gauge_type)
-    old_sum: uint256 = self._get_sum(gauge_type)
-    _total_weight: uint256 = self._get_total()
+    old_gauge_weight: uint256 = self._get_weight(addr, MAX_WEEKS)
+    type_weight: uint256 = self._get_type_weight(gauge_type, MAX_WEEKS)
+    old_sum: uint256 = self._get_sum(gauge_type, MAX_WEEKS)
+    _total_weight: uint256 = self._get_total(MAX_WEEKS)
     next_time: uint256 = (block.timestamp + WEEK) / WEEK * WEEK
 
     self.points_weight[addr][next_time].bias = weight
@@ -467,6 +617,10 @@ def _change_gauge_weight(addr: address, weight: uint256):
     self.points_total[next_time] = _total_weight
     self.time_total = next_time
 
+    # The votes keep decaying the lowered sum, which may now reach zero early
+    if weight < old_gauge_weight and not self.is_clamped_type[gauge_type]:
+        self._clamp_type(gauge_type, type_weight, next_time)
+
     log NewGaugeWeight(addr, block.timestamp, weight, _total_weight)
 
 
@@ -482,16 +636,11 @@ def change_gauge_weight(addr: address, weight: uint256):
 
 
 @internal
-def _vote_for_chain_gauge_weights(_user: address, _chain: uint256, _escrow_id: uint256, _gauge_addr: address, _user_weight: uint256):
-    escrow: address = self.voting_escrow
-    slope: uint256 = convert(MirroredVotingEscrow(escrow).get_last_user_slope(_user, _chain, _escrow_id), uint256)
-    lock_end: uint256 = MirroredVotingEscrow(escrow).locked__end(_user, _chain, _escrow_id)
-    next_time: uint256 = (block.timestamp + WEEK) / WEEK * WEEK
-    
-    # skip if lock is expired on a given chain
-    if lock_end <= next_time:
-        return
-
+def _vote_for_chain_gauge_weights(_user: address, _chain: uint256, _escrow_id: uint256, _gauge_addr: address, _user_weight: uint256, _slope: uint256, _lock_end: uint256, next_time: uint256):
+    """
+    @notice Apply the vote of one user lock to one gauge
+    @dev The total has to be filled up to `next_time` beforehand
+    """
     gauge_type: int128 = self.gauge_types_[_gauge_addr] - 1
     assert gauge_type >= 0, "Gauge not added"
     # Prepare slopes and biases in memory
@@ -501,11 +650,11 @@ def _vote_for_chain_gauge_weights(_user: address, _chain: uint256, _escrow_id: u
         old_dt = old_slope.end - next_time
     old_bias: uint256 = old_slope.slope * old_dt
     new_slope: VotedSlope = VotedSlope({
-        slope: slope * _user_weight / 10000,
-        end: lock_end,
+        slope: _slope * _user_weight / 10000,
+        end: _lock_end,
         power: _user_weight
     })
-    new_dt: uint256 = lock_end - next_time  # dev: raises when expired
+    new_dt: uint256 = _lock_end - next_time  # dev: raises when expired
     new_bias: uint256 = new_slope.slope * new_dt
 
     # Check and update powers (weights) used
@@ -517,10 +666,11 @@ def _vote_for_chain_gauge_weights(_user: address, _chain: uint256, _escrow_id: u
     ## Remove old and schedule new slope changes
     # Remove slope changes for old slopes
     # Schedule recording of initial slope for next_time
-    old_weight_bias: uint256 = self._get_weight(_gauge_addr)
+    old_weight_bias: uint256 = self._get_weight(_gauge_addr, MAX_WEEKS)
     old_weight_slope: uint256 = self.points_weight[_gauge_addr][next_time].slope
-    old_sum_bias: uint256 = self._get_sum(gauge_type)
+    old_sum_bias: uint256 = self._get_sum(gauge_type, MAX_WEEKS)
     old_sum_slope: uint256 = self.points_sum[gauge_type][next_time].slope
+    type_weight: uint256 = self._get_type_weight(gauge_type, MAX_WEEKS)
 
     self.points_weight[_gauge_addr][next_time].bias = max(old_weight_bias + new_bias, old_bias) - old_bias
     self.points_sum[gauge_type][next_time].bias = max(old_sum_bias + new_bias, old_bias) - old_bias
@@ -538,7 +688,14 @@ def _vote_for_chain_gauge_weights(_user: address, _chain: uint256, _escrow_id: u
     self.changes_weight[_gauge_addr][new_slope.end] += new_slope.slope
     self.changes_sum[gauge_type][new_slope.end] += new_slope.slope
 
-    self._get_total()
+    # Move the total by the type sum change
+    new_sum: Point = self.points_sum[gauge_type][next_time]
+    self.points_total[next_time] = self.points_total[next_time] + new_sum.bias * type_weight - old_sum_bias * type_weight
+    if not self.is_clamped_type[gauge_type]:
+        self.points_total_slope[next_time] = self.points_total_slope[next_time] + new_sum.slope * type_weight - old_sum_slope * type_weight
+        if old_slope.end > block.timestamp:
+            self.changes_total[old_slope.end] -= old_slope.slope * type_weight
+        self.changes_total[new_slope.end] += new_slope.slope * type_weight
 
     self.vote_user_slopes[_user][_gauge_addr][_chain][_escrow_id] = new_slope
 
@@ -547,47 +704,90 @@ def _vote_for_chain_gauge_weights(_user: address, _chain: uint256, _escrow_id: u
 
 
 @internal
-def _vote_for_gauge_weights(_sender: address, _gauge_addr: address, _user_weight: uint256):
+def _vote_for_lock(_user: address, _chain: uint256, _escrow_id: uint256, _gauge_addrs: address[10], _user_weights: uint256[10], next_time: uint256):
+    """
+    @notice Apply the votes of one user lock to every gauge of the batch
+    @dev The lock slope and end are read once for all the gauges
+    """
+    escrow: address = self.voting_escrow
+    # votes end on a week boundary so that slope changes are always applied
+    lock_end: uint256 = MirroredVotingEscrow(escrow).locked__end(_user, _chain, _escrow_id) / WEEK * WEEK
+
+    # skip if lock is expired on a given chain
+    if lock_end <= next_time:
+        return
+
+    slope: uint256 = convert(MirroredVotingEscrow(escrow).get_last_user_slope(_user, _chain, _escrow_id), uint256)
+    for i in range(10):
+        if _gauge_addrs[i] == ZERO_ADDRESS:
+            break
+        self._vote_for_chain_gauge_weights(_user, _chain, _escrow_id, _gauge_addrs[i], _user_weights[i], slope, lock_end, next_time)
+
+
+@internal
+def _vote_for_gauge_weights(_sender: address, _gauge_addrs: address[10], _user_weights: uint256[10]):
     """
     @notice Allocate voting power for changing pool weights
+    @dev The escrow topology is read and the total filled once for all the gauges
     @param _sender voter address
-    @param _gauge_addr Gauge which `msg.sender` votes for
-    @param _user_weight Weight for a gauge in bps (units of 0.01%). Minimal is 0.01%. Ignored if 0
+    @param _gauge_addrs Gauges which `msg.sender` votes for, ended by the first empty address
+    @param _user_weights Weights for the gauges in bps (units of 0.01%). Minimal is 0.01%. Ignored if 0
     """
-    assert (_user_weight >= 0) and (_user_weight <= 10000), "You used all your voting power"
+    for i in range(10):
+        if _gauge_addrs[i] == ZERO_ADDRESS:
+            break
+        assert (_user_weights[i] >= 0) and (_user_weights[i] <= 10000), "You used all your voting power"
+
+    next_time: uint256 = (block.timestamp + WEEK) / WEEK * WEEK
+    self._get_total(MAX_WEEKS)
 
     _escrow_count: uint256 = MirroredVotingEscrow(self.voting_escrow).voting_escrow_count()
     for i in range(99):
         if i >= _escrow_count:
             break
-        self._vote_for_chain_gauge_weights(_sender, 0, i, _gauge_addr, _user_weight)
-    
-    _chain_count: uint256 = MirroredVotingEscrow(self.voting_escrow).mirrored_chains_count()
-    for i in range(99):
-        if i >= _chain_count:
+        self._vote_for_lock(_sender, 0, i, _gauge_addrs, _user_weights, next_time)
+
+    # Only the mirrored locks the user actually holds
+    _lock_count: uint256 = MirroredVotingEscrow(self.voting_escrow).mirrored_user_lock_count(_sender)
+    assert _lock_count <= MAX_USER_LOCKS  # dev: too many mirrored locks
+    for i in range(MAX_USER_LOCKS):
+        if i >= _lock_count:
             break
-        
-        _chain: MirroredChain = MirroredVotingEscrow(self.voting_escrow).mirrored_chains(i)
-        for j in range(99):
-            if j >= _chain.escrow_count:
-                break
-            self._vote_for_chain_gauge_weights(_sender, _chain.chain_id, j, _gauge_addr, _user_weight)
 
-    log VoteForGauge(block.timestamp, _sender, _gauge_addr, _user_weight)
+        _lock: MirroredLockId = MirroredVotingEscrow(self.voting_escrow).mirrored_user_locks(_sender, i)
+        self._vote_for_lock(_sender, _lock.chain_id, _lock.escrow_id, _gauge_addrs, _user_weights, next_time)
+
+    for i in range(10):
+        if _gauge_addrs[i] == ZERO_ADDRESS:
+            break
+        log VoteForGauge(block.timestamp, _sender, _gauge_addrs[i], _user_weights[i])
 
 
 @external
 def vote_for_gauge_weights(_gauge_addr: address, _user_weight: uint256):
-    self._vote_for_gauge_weights(msg.sender, _gauge_addr, _user_weight)
+    """
+    @notice Allocate voting power of every lock of `msg.sender` to gauge `_gauge_addr`
+    @dev Reverts if `msg.sender` holds more than `MAX_USER_LOCKS` mirrored locks,
+         rather than leaving the extra locks out of the vote
+    @param _gauge_addr Gauge which `msg.sender` votes for
+    @param _user_weight Weight for the gauge in bps (units of 0.01%). Minimal is 0.01%. Ignored if 0
+    """
+    _gauge_addrs: address[10] = empty(address[10])
+    _user_weights: uint256[10] = empty(uint256[10])
+    _gauge_addrs[0] = _gauge_addr
+    _user_weights[0] = _user_weight
+    self._vote_for_gauge_weights(msg.sender, _gauge_addrs, _user_weights)
 
 
 @external
 def vote_for_many_gauge_weights(_gauge_addr: address[10], _user_weight: uint256[10]):
-    for i in range(9):
-        if _gauge_addr[i] == ZERO_ADDRESS:
-            break
-
-        self._vote_for_gauge_weights(msg.sender, _gauge_addr[i], _user_weight[i])
+    """
+    @notice Allocate voting power of every lock of `msg.sender` to several gauges
+    @dev Reverts if `msg.sender` holds more than `MAX_USER_LOCKS` mirrored locks
+    @param _gauge_addr Gauges which `msg.sender` votes for, ended by the first empty address
+    @param _user_weight Weights for the gauges in bps (units of 0.01%)
+    """
+    self._vote_for_gauge_weights(msg.sender, _gauge_addr, _user_weight)
 
 
 @external
@@ -604,20 +804,16 @@ def user_vote_power(addr: address) -> uint256:
         if _used_power > 0:
             return _used_power
 
-    _chain_count: uint256 = MirroredVotingEscrow(self.voting_escrow).mirrored_chains_count()
-    for i in range(99):
-        if i >= _chain_count:
+    _lock_count: uint256 = MirroredVotingEscrow(self.voting_escrow).mirrored_user_lock_count(addr)
+    for i in range(MAX_USER_LOCKS):
+        if i >= _lock_count:
             break
 
-        _chain: MirroredChain = MirroredVotingEscrow(self.voting_escrow).mirrored_chains(i)
-        for j in range(99):
-            if j >= _chain.escrow_count:
-                break
+        _lock: MirroredLockId = MirroredVotingEscrow(self.voting_escrow).mirrored_user_locks(addr, i)
+        _used_power = self.vote_user_power[addr][_lock.chain_id][_lock.escrow_id]
 
-            _used_power = self.vote_user_power[addr][_chain.chain_id][j]
-
-            if _used_power > 0:
-                break
+        if _used_power > 0:
+            break
 
     return _used_power
 
@@ -636,21 +832,16 @@ def vote_user_power_for_gauge(addr: address, gauge: address) -> uint256:
         if _used_power > 0:
             return _used_power
 
-    _chain_count: uint256 = MirroredVotingEscrow(self.voting_escrow).mirrored_chains_count()
-    for i in range(99):
-        if i >= _chain_count:
+    _lock_count: uint256 = MirroredVotingEscrow(self.voting_escrow).mirrored_user_lock_count(addr)
+    for i in range(MAX_USER_LOCKS):
+        if i >= _lock_count:
             break
 
-        _chain: MirroredChain = MirroredVotingEscrow(self.voting_escrow).mirrored_chains(i)
-        for j in range(99):
-            if j >= _chain.escrow_count:
-                break
-
-            if _used_power == 0:
-                _used_power = self.vote_user_slopes[addr][gauge][_chain.chain_id][j].power
+        _lock: MirroredLockId = MirroredVotingEscrow(self.voting_escrow).mirrored_user_locks(addr, i)
+        _used_power = self.vote_user_slopes[addr][gauge][_lock.chain_id][_lock.escrow_id].power
 
-            if _used_power > 0:
-                break
+        if _used_power > 0:
+            break
 
     return _used_power
 
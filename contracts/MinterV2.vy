@@ -25,6 +25,7 @@ event Minted:
 
 
 MAX_TOKENS: constant(uint256) = 10
+MAX_MINT_GAUGES: constant(uint256) = 32
 
 token_count: public(uint256)
 tokens: public(address[MAX_TOKENS])
@@ -49,18 +50,49 @@ def __init__(_treasury: address, _controller: address):
 
 
 @internal
-def _mint_for(gauge_addr: address, _token: address, _for: address):
+def _mint_gauge(gauge_addr: address, _for: address, _to_mint: uint256[MAX_TOKENS]) -> uint256[MAX_TOKENS]:
+    """
+    @notice Record everything which `_for` can mint from `gauge_addr`
+    @dev The gauge is checkpointed once for every token, nothing is transferred yet
+    @param gauge_addr `LiquidityGauge` address to get mintable amount from
+    @param _for Address to mint to
+    @param _to_mint Amounts already due to `_for`, by index in `tokens`
+    @return `_to_mint` with the amounts from `gauge_addr` added
+    """
     assert GaugeController(self.controller).gauge_types(gauge_addr) >= 0  # dev: gauge is not added
 
     LiquidityGauge(gauge_addr).user_checkpoint(_for)
-    total_mint: uint256 = LiquidityGauge(gauge_addr).integrate_fraction(_token, _for)
-    to_mint: uint256 = total_mint - self.minted[_for][gauge_addr][_token]
+    to_mint: uint256[MAX_TOKENS] = _to_mint
+    for j in range(MAX_TOKENS):
+        _token: address = self.tokens[j]
+        if _token == ZERO_ADDRESS:
+            break
+        total_mint: uint256 = LiquidityGauge(gauge_addr).integrate_fraction(_token, _for)
+        _minted: uint256 = self.minted[_for][gauge_addr][_token]
 
-    if to_mint != 0:
-        MERC20(self.treasury).mint(_for, _token, to_mint)
-        self.minted[_for][gauge_addr][_token] = total_mint
+        if total_mint != _minted:
+            to_mint[j] += total_mint - _minted
+            self.minted[_for][gauge_addr][_token] = total_mint
 
-        log Minted(_for, gauge_addr, _token, total_mint)
+            log Minted(_for, gauge_addr, _token, total_mint)
+
+    return to_mint
+
+
+@internal
+def _transfer_minted(_for: address, _to_mint: uint256[MAX_TOKENS]):
+    """
+    @notice Send the recorded amounts to `_for` with one treasury transfer per token
+    @param _for Address to mint to
+    @param _to_mint Amounts due to `_for`, by index in `tokens`
+    """
+    _treasury: address = self.treasury
+    for j in range(MAX_TOKENS):
+        _token: address = self.tokens[j]
+        if _token == ZERO_ADDRESS:
+            break
+        if _to_mint[j] != 0:
+            MERC20(_treasury).mint(_for, _token, _to_mint[j])
 
 
 @external
@@ -70,11 +102,8 @@ def mint(gauge_addr: address):
     @notice Mint everything which belongs to `msg.sender` and send to them
     @param gauge_addr `LiquidityGauge` address to get mintable amount from
     """
-    for j in range(MAX_TOKENS):
-        _token: address = self.tokens[j]
-        if _token == ZERO_ADDRESS:
-            break
-        self._mint_for(gauge_addr, _token, msg.sender)
+    to_mint: uint256[MAX_TOKENS] = self._mint_gauge(gauge_addr, msg.sender, empty(uint256[MAX_TOKENS]))
+    self._transfer_minted(msg.sender, to_mint)
 
 
 @external
@@ -84,14 +113,29 @@ def mint_many(gauge_addrs: address[8]):
     @notice Mint everything which belongs to `msg.sender` across multiple gauges
     @param gauge_addrs List of `LiquidityGauge` addresses
     """
+    to_mint: uint256[MAX_TOKENS] = empty(uint256[MAX_TOKENS])
     for i in range(8):
         if gauge_addrs[i] == ZERO_ADDRESS:
             break
-        for j in range(MAX_TOKENS):
-            _token: address = self.tokens[j]
-            if _token == ZERO_ADDRESS:
-                break
-            self._mint_for(gauge_addrs[i], _token, msg.sender)
+        to_mint = self._mint_gauge(gauge_addrs[i], msg.sender, to_mint)
+    self._transfer_minted(msg.sender, to_mint)
+
+
+@external
+@nonreentrant('lock')
+def mint_gauges(gauge_addrs: address[MAX_MINT_GAUGES]):
+    """
+    @notice Mint everything which belongs to `msg.sender` across up to 32 gauges
+    @dev Amounts are summed over the gauges, every token is sent in a single
+         treasury transfer. The list ends at the first empty address
+    @param gauge_addrs List of `LiquidityGauge` addresses
+    """
+    to_mint: uint256[MAX_TOKENS] = empty(uint256[MAX_TOKENS])
+    for i in range(MAX_MINT_GAUGES):
+        if gauge_addrs[i] == ZERO_ADDRESS:
+            break
+        to_mint = self._mint_gauge(gauge_addrs[i], msg.sender, to_mint)
+    self._transfer_minted(msg.sender, to_mint)
 
 
 @external
@@ -104,11 +148,8 @@ def mint_for(gauge_addr: address, _for: address):
     @param _for Address to mint to
     """
     if self.allowed_to_mint_for[msg.sender][_for]:
-        for i in range(MAX_TOKENS):
-            _token: address = self.tokens[i]
-            if _token == ZERO_ADDRESS:
-                break
-            self._mint_for(gauge_addr, _token, _for)
+        to_mint: uint256[MAX_TOKENS] = self._mint_gauge(gauge_addr, _for, empty(uint256[MAX_TOKENS]))
+        self._transfer_minted(_for, to_mint)
 
 
 @external
@@ -124,6 +165,7 @@ def toggle_approve_mint(minting_user: address):
 def add_token(_token: address):
     """
     @notice Set the reward token
+    @dev Gauges pick up the new token on their next checkpoint
     """
     assert msg.sender == self.admin  # dev: only owner
 
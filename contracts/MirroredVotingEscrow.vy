@@ -28,6 +28,10 @@ struct MirroredChain:
     chain_id: uint256
     escrow_count: uint256
 
+struct MirroredLockId:
+    chain_id: uint256
+    escrow_id: uint256
+
 event MirrorLock:
     provider: indexed(address)
     chain_id: uint256
@@ -58,6 +62,7 @@ voting_escrows: public(address[100])
 
 mirrored_chains_count: public(uint256)
 mirrored_chains: public(MirroredChain[100])
+mirrored_chain_index: public(HashMap[uint256, uint256])  # chain id -> index in mirrored_chains + 1, 0 if not mirrored
 
 # user -> chain -> escrow_id -> lock
 mirrored_locks: public(HashMap[address, HashMap[uint256, HashMap[uint256, LockedBalance]]])
@@ -66,9 +71,23 @@ mirrored_locks: public(HashMap[address, HashMap[uint256, HashMap[uint256, Locked
 mirrored_user_point_history: public(HashMap[address, HashMap[uint256, HashMap[uint256, Point[1000000000]]]])
 mirrored_user_point_epoch: public(HashMap[address, HashMap[uint256, HashMap[uint256, uint256]]])
 
+# user -> list of the (chain, escrow) pairs holding a live mirrored lock
+mirrored_user_lock_count: public(HashMap[address, uint256])
+mirrored_user_locks: public(HashMap[address, HashMap[uint256, MirroredLockId]])
+mirrored_user_lock_index: HashMap[address, HashMap[uint256, HashMap[uint256, uint256]]]  # index in mirrored_user_locks + 1, 0 if absent
+
+# user -> combined Point over every mirrored lock of the user
+mirrored_user_point: public(HashMap[address, Point])
+mirrored_user_slope_changes: public(HashMap[address, HashMap[uint256, int128]])  # user -> time -> signed slope change
+
 mirrored_epoch: public(uint256)
 mirrored_point_history: public(Point[100000000000000000000000000000])  # epoch -> unsigned point
 mirrored_slope_changes: public(HashMap[uint256, int128])  # time -> signed slope change
+mirrored_week_supply: public(HashMap[uint256, uint256])  # week start -> total mirrored voting power, once in the past
+
+# total mirrored voting power, valid during `mirrored_supply_cache_block` only
+mirrored_supply_cache: public(uint256)
+mirrored_supply_cache_block: public(uint256)
 
 name: public(String[64])
 symbol: public(String[32])
@@ -78,6 +97,8 @@ decimals: public(uint256)
 WEEK: constant(uint256) = 7 * 86400  # all future times are rounded by week
 MAXTIME: constant(uint256) = 4 * 365 * 86400  # 4 years
 MULTIPLIER: constant(uint256) = 10 ** 18
+MAX_MIRROR_BATCH: constant(uint256) = 32
+MAX_BALANCE_BATCH: constant(uint256) = 100
 
 @external
 def __init__(_admin: address, _voting_escrow: address, _name: String[64], _symbol: String[32], _version: String[32]):
@@ -93,38 +114,60 @@ def __init__(_admin: address, _voting_escrow: address, _name: String[64], _symbo
 
 
 @internal
-def _checkpoint(addr: address, _chain: uint256, _escrow_id: uint256, old_locked: LockedBalance, new_locked: LockedBalance):
+@view
+def _mirrored_user_point_at(addr: address, t: uint256) -> (int128, int128):
     """
-    @notice Record global and per-user data to checkpoint
-    @param addr User's wallet address. No user checkpoint if 0x0
-    @param old_locked Pevious locked amount / end lock time for the user
-    @param new_locked New locked amount / end lock time for the user
+    @notice Move the combined mirrored point of `addr` forward to time `t`
+    @dev Only the weeks between the last user update and `t` are visited,
+         whatever the number of mirrored chains and escrows
+    @param addr User wallet address
+    @param t Time to move the point to
+    @return Combined bias (not clamped to zero) and slope at `t`
     """
-    u_old: Point = empty(Point)
-    u_new: Point = empty(Point)
-    old_dslope: int128 = 0
-    new_dslope: int128 = 0
-    _epoch: uint256 = self.mirrored_epoch
+    u_point: Point = self.mirrored_user_point[addr]
+    if u_point.ts == 0:
+        return 0, 0
+
+    t_i: uint256 = (u_point.ts / WEEK) * WEEK
+    for i in range(255):
+        if u_point.slope == 0:
+            # every mirrored lock has been retired, nothing left to decay
+            break
+        t_i += WEEK
+        d_slope: int128 = 0
+        if t_i > t:
+            t_i = t
+        else:
+            d_slope = self.mirrored_user_slope_changes[addr][t_i]
+        u_point.bias -= u_point.slope * convert(t_i - u_point.ts, int128)
+        u_point.slope += d_slope
+        u_point.ts = t_i
+        if t_i == t:
+            break
 
-    if addr != ZERO_ADDRESS:
-        # Calculate slopes and biases
-        # Kept at zero when they have to
-        if old_locked.end > block.timestamp and old_locked.amount > 0:
-            u_old.slope = old_locked.amount / MAXTIME
-            u_old.bias = u_old.slope * convert(old_locked.end - block.timestamp, int128)
-        if new_locked.end > block.timestamp and new_locked.amount > 0:
-            u_new.slope = new_locked.amount / MAXTIME
-            u_new.bias = u_new.slope * convert(new_locked.end - block.timestamp, int128)
-
-        # Read values of scheduled changes in the slope
-        # old_locked.end can be in the past and in the future
-        # new_locked.end can ONLY by in the FUTURE unless everything expired: than zeros
-        old_dslope = self.mirrored_slope_changes[old_locked.end]
-        if new_locked.end != 0:
-            if new_locked.end == old_locked.end:
-                new_dslope = old_dslope
-            else:
-                new_dslope = self.mirrored_slope_changes[new_locked.end]
+    return u_point.bias, u_point.slope
+
+
+@internal
+def _schedule_user_change(addr: address, _end: uint256, _d_slope: int128):
+    """
+    @notice Schedule a change of the combined mirrored slope of `addr`
+    @dev Mirrored lock ends are rounded down to weeks, so the change lands on
+         a week boundary where `_mirrored_user_point_at` applies it
+    @param addr User wallet address
+    @param _end Lock end time
+    @param _d_slope Signed slope change to apply at `_end`
+    """
+    self.mirrored_user_slope_changes[addr][_end] += _d_slope
+
+
+@internal
+def _checkpoint_global():
+    """
+    @notice Fill the global point history up to the current block
+    @dev The point at `mirrored_epoch` is the current one afterwards
+    """
+    _epoch: uint256 = self.mirrored_epoch
 
     last_point: Point = Point({bias: 0, slope: 0, ts: block.timestamp, blk: block.number})
     if _epoch > 0:
@@ -140,6 +183,10 @@ def _checkpoint(addr: address, _chain: uint256, _escrow_id: uint256, old_locked:
     # If last point is already recorded in this block, slope=0
     # But that's ok b/c we know the block in such case
 
+    # A point recorded exactly on a week boundary is final once time moves on
+    if last_checkpoint % WEEK == 0 and last_checkpoint < block.timestamp:
+        self.mirrored_week_supply[last_checkpoint] = convert(last_point.bias, uint256)
+
     # Go over weeks to fill history and calculate what the current point is
     t_i: uint256 = (last_checkpoint / WEEK) * WEEK
     for i in range(255):
@@ -166,90 +213,266 @@ def _checkpoint(addr: address, _chain: uint256, _escrow_id: uint256, old_locked:
             break
         else:
             self.mirrored_point_history[_epoch] = last_point
+            self.mirrored_week_supply[t_i] = convert(last_point.bias, uint256)
 
     self.mirrored_epoch = _epoch
     # Now point_history is filled until t=now
 
-    if addr != ZERO_ADDRESS:
-        # If last point was in this block, the slope change has been applied already
-        # But in such case we have 0 slope(s)
-        last_point.slope += (u_new.slope - u_old.slope)
-        last_point.bias += (u_new.bias - u_old.bias)
-        if last_point.slope < 0:
-            last_point.slope = 0
-        if last_point.bias < 0:
-            last_point.bias = 0
+    # Record the current point into history
+    self.mirrored_point_history[_epoch] = last_point
+
+    # The mirrored supply is about to change, drop the cached value
+    if self.mirrored_supply_cache_block == block.number:
+        self.mirrored_supply_cache_block = 0
+
+
+@internal
+def _checkpoint_user(addr: address, _chain: uint256, _escrow_id: uint256, old_locked: LockedBalance, new_locked: LockedBalance):
+    """
+    @notice Record per-user data to checkpoint and apply it to the current global point
+    @dev `_checkpoint_global` must have been called in the same transaction
+    @param addr User's wallet address
+    @param old_locked Pevious locked amount / end lock time for the user
+    @param new_locked New locked amount / end lock time for the user
+    """
+    u_old: Point = empty(Point)
+    u_new: Point = empty(Point)
+    old_dslope: int128 = 0
+    new_dslope: int128 = 0
+    _epoch: uint256 = self.mirrored_epoch
+
+    # Calculate slopes and biases
+    # Kept at zero when they have to
+    if old_locked.end > block.timestamp and old_locked.amount > 0:
+        u_old.slope = old_locked.amount / MAXTIME
+        u_old.bias = u_old.slope * convert(old_locked.end - block.timestamp, int128)
+    if new_locked.end > block.timestamp and new_locked.amount > 0:
+        u_new.slope = new_locked.amount / MAXTIME
+        u_new.bias = u_new.slope * convert(new_locked.end - block.timestamp, int128)
+
+    # Read values of scheduled changes in the slope
+    # old_locked.end can be in the past and in the future
+    # new_locked.end can ONLY by in the FUTURE unless everything expired: than zeros
+    old_dslope = self.mirrored_slope_changes[old_locked.end]
+    if new_locked.end != 0:
+        if new_locked.end == old_locked.end:
+            new_dslope = old_dslope
+        else:
+            new_dslope = self.mirrored_slope_changes[new_locked.end]
+
+    # If last point was in this block, the slope change has been applied already
+    # But in such case we have 0 slope(s)
+    last_point: Point = self.mirrored_point_history[_epoch]
+    last_point.slope += (u_new.slope - u_old.slope)
+    last_point.bias += (u_new.bias - u_old.bias)
+    if last_point.slope < 0:
+        last_point.slope = 0
+    if last_point.bias < 0:
+        last_point.bias = 0
 
     # Record the changed point into history
     self.mirrored_point_history[_epoch] = last_point
 
-    if addr != ZERO_ADDRESS:
-        # Schedule the slope changes (slope is going down)
-        # We subtract new_user_slope from [new_locked.end]
-        # and add old_user_slope to [old_locked.end]
-        if old_locked.end > block.timestamp:
-            # old_dslope was <something> - u_old.slope, so we cancel that
-            old_dslope += u_old.slope
-            if new_locked.end == old_locked.end:
-                old_dslope -= u_new.slope  # It was a new deposit, not extension
-            self.mirrored_slope_changes[old_locked.end] = old_dslope
+    # Schedule the slope changes (slope is going down)
+    # We subtract new_user_slope from [new_locked.end]
+    # and add old_user_slope to [old_locked.end]
+    if old_locked.end > block.timestamp:
+        # old_dslope was <something> - u_old.slope, so we cancel that
+        old_dslope += u_old.slope
+        if new_locked.end == old_locked.end:
+            old_dslope -= u_new.slope  # It was a new deposit, not extension
+        self.mirrored_slope_changes[old_locked.end] = old_dslope
+
+    if new_locked.end > block.timestamp:
+        if new_locked.end > old_locked.end:
+            new_dslope -= u_new.slope  # old slope disappeared at this point
+            self.mirrored_slope_changes[new_locked.end] = new_dslope
+        # else: we recorded it already in old_dslope
+
+    # Now handle user history
+    user_epoch: uint256 = self.mirrored_user_point_epoch[addr][_chain][_escrow_id] + 1
+
+    self.mirrored_user_point_epoch[addr][_chain][_escrow_id] = user_epoch
+    u_new.ts = block.timestamp
+    u_new.blk = block.number
+    self.mirrored_user_point_history[addr][_chain][_escrow_id][user_epoch] = u_new
+
+    # Fold the lock into the combined point of the user
+    u_point: Point = empty(Point)
+    u_point.bias, u_point.slope = self._mirrored_user_point_at(addr, block.timestamp)
+    u_point.bias += (u_new.bias - u_old.bias)
+    u_point.slope += (u_new.slope - u_old.slope)
+    u_point.ts = block.timestamp
+    u_point.blk = block.number
+    self.mirrored_user_point[addr] = u_point
+
+    if old_locked.end > block.timestamp:
+        self._schedule_user_change(addr, old_locked.end, u_old.slope)
+    if new_locked.end > block.timestamp:
+        self._schedule_user_change(addr, new_locked.end, -u_new.slope)
 
-        if new_locked.end > block.timestamp:
-            if new_locked.end > old_locked.end:
-                new_dslope -= u_new.slope  # old slope disappeared at this point
-                self.mirrored_slope_changes[new_locked.end] = new_dslope
-            # else: we recorded it already in old_dslope
 
-        # Now handle user history
-        user_epoch: uint256 = self.mirrored_user_point_epoch[addr][_chain][_escrow_id] + 1
+@internal
+def _mirror_lock(_user: address, _chain: uint256, _escrow_id: uint256, _value: uint256, _unlock_time: uint256):
+    old_locked: LockedBalance = self.mirrored_locks[_user][_chain][_escrow_id]
+
+    new_locked: LockedBalance = empty(LockedBalance)
+    new_locked.amount = convert(_value, int128)
+    new_locked.end = (_unlock_time / WEEK) * WEEK  # Locktime is rounded down to weeks
+
+    self.mirrored_locks[_user][_chain][_escrow_id] = new_locked
 
-        self.mirrored_user_point_epoch[addr][_chain][_escrow_id] = user_epoch
-        u_new.ts = block.timestamp
-        u_new.blk = block.number
-        self.mirrored_user_point_history[addr][_chain][_escrow_id][user_epoch] = u_new
+    _lock_index: uint256 = self.mirrored_user_lock_index[_user][_chain][_escrow_id]
+    if new_locked.amount > 0 or new_locked.end > block.timestamp:
+        if _lock_index == 0:
+            _lock_count: uint256 = self.mirrored_user_lock_count[_user]
+            self.mirrored_user_locks[_user][_lock_count] = MirroredLockId({chain_id: _chain, escrow_id: _escrow_id})
+            self.mirrored_user_lock_index[_user][_chain][_escrow_id] = _lock_count + 1
+            self.mirrored_user_lock_count[_user] = _lock_count + 1
+    elif _lock_index != 0:
+        # Swap the last lock into the freed slot
+        _last: uint256 = self.mirrored_user_lock_count[_user] - 1
+        if _lock_index - 1 != _last:
+            _moved: MirroredLockId = self.mirrored_user_locks[_user][_last]
+            self.mirrored_user_locks[_user][_lock_index - 1] = _moved
+            self.mirrored_user_lock_index[_user][_moved.chain_id][_moved.escrow_id] = _lock_index
+        self.mirrored_user_locks[_user][_last] = empty(MirroredLockId)
+        self.mirrored_user_lock_index[_user][_chain][_escrow_id] = 0
+        self.mirrored_user_lock_count[_user] = _last
+
+    _chain_index: uint256 = self.mirrored_chain_index[_chain]
+    if _chain_index == 0:
+        _chain_index = self.mirrored_chains_count
+        self.mirrored_chains[_chain_index] = MirroredChain({chain_id: _chain, escrow_count: _escrow_id + 1})
+        self.mirrored_chains_count = _chain_index + 1
+        self.mirrored_chain_index[_chain] = _chain_index + 1
+    else:
+        _chain_index -= 1
+        if _escrow_id >= self.mirrored_chains[_chain_index].escrow_count:
+            self.mirrored_chains[_chain_index].escrow_count = _escrow_id + 1
+
+    self._checkpoint_user(_user, _chain, _escrow_id, old_locked, new_locked)
+
+    log MirrorLock(_user, _chain, _escrow_id, _value, new_locked.end)
 
 
 @external
 def mirror_lock(_user: address, _chain: uint256, _escrow_id: uint256, _value: uint256, _unlock_time: uint256):
     assert self.whitelisted_mirrors[msg.sender] == True # dev: only whitelisted address can mirror locks
 
-    old_locked: LockedBalance = self.mirrored_locks[_user][_chain][_escrow_id]
+    self._checkpoint_global()
+    self._mirror_lock(_user, _chain, _escrow_id, _value, _unlock_time)
 
-    new_locked: LockedBalance = empty(LockedBalance)
-    new_locked.amount = convert(_value, int128)
-    new_locked.end = _unlock_time
 
-    self.mirrored_locks[_user][_chain][_escrow_id] = new_locked
+@external
+def mirror_locks(
+    _users: address[MAX_MIRROR_BATCH],
+    _chains: uint256[MAX_MIRROR_BATCH],
+    _escrow_ids: uint256[MAX_MIRROR_BATCH],
+    _values: uint256[MAX_MIRROR_BATCH],
+    _unlock_times: uint256[MAX_MIRROR_BATCH]
+):
+    """
+    @notice Mirror several locks at once
+    @dev The global history is filled once for the whole batch.
+         The batch ends at the first empty user address.
+    """
+    assert self.whitelisted_mirrors[msg.sender] == True # dev: only whitelisted address can mirror locks
 
-    chain_already_mirrored: bool = False
-    for i in range(99):
-        if i >= self.mirrored_chains_count:
+    self._checkpoint_global()
+    for i in range(MAX_MIRROR_BATCH):
+        if _users[i] == ZERO_ADDRESS:
             break
+        self._mirror_lock(_users[i], _chains[i], _escrow_ids[i], _values[i], _unlock_times[i])
+
+
+@external
+def checkpoint():
+    """
+    @notice Record global data to checkpoint
+    """
+    self._checkpoint_global()
 
-        if self.mirrored_chains[i].chain_id == _chain:
-            chain_already_mirrored = True
-            self.mirrored_chains[i].escrow_count = max(self.mirrored_chains[i].escrow_count, _escrow_id + 1)
 
+@external
+def checkpoint_weeks(_max_weeks: uint256):
+    """
+    @notice Fill the global point history by at most `_max_weeks` weeks
+    @dev Splits the catch-up after an idle period across several transactions.
+         Only past week boundaries are recorded, `checkpoint` records the current point
+    @param _max_weeks Maximum number of weeks to fill
+    """
+    _epoch: uint256 = self.mirrored_epoch
+    if _epoch == 0:
+        return
+
+    last_point: Point = self.mirrored_point_history[_epoch]
+    initial_last_point: Point = last_point
+    block_slope: uint256 = 0  # dblock/dt
+    if block.timestamp > last_point.ts:
+        block_slope = MULTIPLIER * (block.number - last_point.blk) / (block.timestamp - last_point.ts)
+
+    if last_point.ts % WEEK == 0 and last_point.ts < block.timestamp:
+        self.mirrored_week_supply[last_point.ts] = convert(last_point.bias, uint256)
+
+    t_i: uint256 = (last_point.ts / WEEK) * WEEK
+    for i in range(255):
+        if i >= _max_weeks:
             break
-    
-    if not chain_already_mirrored:
-        self.mirrored_chains[self.mirrored_chains_count] = empty(MirroredChain)
-        self.mirrored_chains[self.mirrored_chains_count].chain_id = _chain
-        self.mirrored_chains[self.mirrored_chains_count].escrow_count = _escrow_id + 1
+        t_i += WEEK
+        if t_i >= block.timestamp:
+            break
+        last_point.bias -= last_point.slope * convert(t_i - last_point.ts, int128)
+        last_point.slope += self.mirrored_slope_changes[t_i]
+        if last_point.bias < 0:
+            last_point.bias = 0
+        if last_point.slope < 0:
+            last_point.slope = 0
+        last_point.ts = t_i
+        last_point.blk = initial_last_point.blk + block_slope * (t_i - initial_last_point.ts) / MULTIPLIER
+        _epoch += 1
+        self.mirrored_point_history[_epoch] = last_point
+        self.mirrored_week_supply[t_i] = convert(last_point.bias, uint256)
 
-        self.mirrored_chains_count += 1
-    
-    self._checkpoint(_user, _chain, _escrow_id, old_locked, new_locked)
+    self.mirrored_epoch = _epoch
+
+
+@external
+@view
+def pending_weeks() -> uint256:
+    """
+    @notice Get the number of week boundaries the global point history still has to cross
+    @return Number of weeks `checkpoint_weeks` can fill
+    """
+    _epoch: uint256 = self.mirrored_epoch
+    if _epoch == 0:
+        return 0
 
-    log MirrorLock(_user, _chain, _escrow_id, _value, _unlock_time)
+    # a boundary equal to the current time is left to `checkpoint`
+    current_week: uint256 = (block.timestamp - 1) / WEEK
+    last_week: uint256 = self.mirrored_point_history[_epoch].ts / WEEK
+    if current_week <= last_week:
+        return 0
+    return current_week - last_week
 
 
 @external
-def checkpoint():
+@view
+def get_mirrored_chains() -> uint256[2][100]:
     """
-    @notice Record global data to checkpoint
+    @notice Get every mirrored chain with its escrow count in one call
+    @dev Entries past `mirrored_chains_count` are empty
+    @return [chain_id, escrow_count] pairs, by index in `mirrored_chains`
     """
-    self._checkpoint(ZERO_ADDRESS, 0, 0, empty(LockedBalance), empty(LockedBalance))
+    _chains: uint256[2][100] = empty(uint256[2][100])
+    _chain_count: uint256 = self.mirrored_chains_count
+    for i in range(100):
+        if i >= _chain_count:
+            break
+        _chain: MirroredChain = self.mirrored_chains[i]
+        _chains[i] = [_chain.chain_id, _chain.escrow_count]
+
+    return _chains
 
 
 @external
@@ -334,6 +557,24 @@ def mirrored_supply_at(point: Point, t: uint256) -> uint256:
     return convert(last_point.bias, uint256)
 
 
+@internal
+@view
+def _total_mirrored_supply(t: uint256) -> uint256:
+    """
+    @notice Calculate total mirrored voting power at time `t`
+    @dev Week boundaries before the last checkpoint are read from `mirrored_week_supply`,
+         any other time is projected forward from the last checkpoint and
+         must not be before it
+    @param t Time to calculate the total voting power at
+    @return Total mirrored voting power
+    """
+    _epoch: uint256 = self.mirrored_epoch
+    last_point: Point = self.mirrored_point_history[_epoch]
+    if t % WEEK == 0 and t < last_point.ts:
+        return self.mirrored_week_supply[t]
+    return self.mirrored_supply_at(last_point, t)
+
+
 @external
 @view
 def total_mirrored_supply(t: uint256 = block.timestamp) -> uint256:
@@ -342,14 +583,12 @@ def total_mirrored_supply(t: uint256 = block.timestamp) -> uint256:
     @dev Adheres to the ERC20 `totalSupply` interface for Aragon compatibility
     @return Total voting power
     """
-    _epoch: uint256 = self.mirrored_epoch
-    last_point: Point = self.mirrored_point_history[_epoch]
-    return self.mirrored_supply_at(last_point, t)
+    return self._total_mirrored_supply(t)
 
 
-@external
+@internal
 @view
-def totalSupply(_t: uint256 = block.timestamp) -> uint256:
+def _local_supply(_t: uint256) -> uint256:
     _local_supply: uint256 = 0
 
     for i in range(99):
@@ -358,43 +597,49 @@ def totalSupply(_t: uint256 = block.timestamp) -> uint256:
 
         _local_supply += VotingEscrow(self.voting_escrows[i]).totalSupply(_t)
 
-    _epoch: uint256 = self.mirrored_epoch
-    _last_point: Point = self.mirrored_point_history[_epoch]
-    _mirrored_supply: uint256 = self.mirrored_supply_at(_last_point, _t)
-
-    return _local_supply + _mirrored_supply
+    return _local_supply
 
 
-@internal
+@external
 @view
-def _mirrored_balance_of(addr: address, _t: uint256) -> uint256:
-    _chain_count: uint256 = self.mirrored_chains_count
-    _mirrored_balance: uint256 = 0
+def totalSupply(_t: uint256 = block.timestamp) -> uint256:
+    return self._local_supply(_t) + self._total_mirrored_supply(_t)
 
-    for i in range(99):
-        if i >= _chain_count:
-            break
 
-        _chain: MirroredChain = self.mirrored_chains[i]
+@external
+def total_supply_write() -> uint256:
+    """
+    @notice Get the current combined voting power, walking the mirrored history at most once per block
+    @dev Local escrows are always read live, only the mirrored part is cached.
+         Mirrored lock changes drop the cached value
+    @return Total voting power
+    """
+    _mirrored_supply: uint256 = 0
+    if self.mirrored_supply_cache_block == block.number:
+        _mirrored_supply = self.mirrored_supply_cache
+    else:
+        _mirrored_supply = self._total_mirrored_supply(block.timestamp)
+        self.mirrored_supply_cache = _mirrored_supply
+        self.mirrored_supply_cache_block = block.number
 
-        for j in range(499):
-            if j >= _chain.escrow_count:
-                break
+    return self._local_supply(block.timestamp) + _mirrored_supply
 
-            _escrow_epoch: uint256 = self.mirrored_user_point_epoch[addr][_chain.chain_id][j]
-            if _escrow_epoch > 0:
-                _last_point: Point = self.mirrored_user_point_history[addr][_chain.chain_id][j][_escrow_epoch]
-                _last_point.bias -= _last_point.slope * convert(_t - _last_point.ts, int128)
-                if _last_point.bias < 0:
-                    _last_point.bias = 0
-                _mirrored_balance += convert(_last_point.bias, uint256)
 
-    return _mirrored_balance
+@internal
+@view
+def _mirrored_balance_of(addr: address, _t: uint256) -> uint256:
+    _bias: int128 = 0
+    _slope: int128 = 0
+    _bias, _slope = self._mirrored_user_point_at(addr, _t)
+    if _bias < 0:
+        return 0
 
+    return convert(_bias, uint256)
 
-@external
+
+@internal
 @view
-def balanceOf(_addr: address, _t: uint256 = block.timestamp) -> uint256:
+def _balance_of(_addr: address, _t: uint256) -> uint256:
     _local_balance: uint256 = 0
     for i in range(99):
         if i >= self.voting_escrow_count:
@@ -407,6 +652,31 @@ def balanceOf(_addr: address, _t: uint256 = block.timestamp) -> uint256:
     return _local_balance + _mirrored_balance
 
 
+@external
+@view
+def balanceOf(_addr: address, _t: uint256 = block.timestamp) -> uint256:
+    return self._balance_of(_addr, _t)
+
+
+@external
+@view
+def balancesOf(_addrs: address[MAX_BALANCE_BATCH], _t: uint256 = block.timestamp) -> uint256[MAX_BALANCE_BATCH]:
+    """
+    @notice Get the local and mirrored voting power of several users in one call
+    @dev The list ends at the first empty address, later entries are 0
+    @param _addrs User wallet addresses
+    @param _t Epoch time to return voting power at
+    @return Voting power of each user, in the order of `_addrs`
+    """
+    balances: uint256[MAX_BALANCE_BATCH] = empty(uint256[MAX_BALANCE_BATCH])
+    for i in range(MAX_BALANCE_BATCH):
+        if _addrs[i] == ZERO_ADDRESS:
+            break
+        balances[i] = self._balance_of(_addrs[i], _t)
+
+    return balances
+
+
 @external
 @view
 def mirrored_balance_of(addr: address, _t: uint256) -> uint256:
@@ -423,6 +693,30 @@ def locked__end(_addr: address, _chain: uint256 = 0, _escrow_id: uint256 = 0) ->
     return self.mirrored_locks[_addr][_chain][_escrow_id].end
 
 
+@external
+@view
+def lockedOf(_addrs: address[MAX_BALANCE_BATCH], _chain: uint256, _escrow_id: uint256) -> uint256[2][MAX_BALANCE_BATCH]:
+    """
+    @notice Get the mirrored locks of several users on one escrow in one call
+    @dev Local locks are read from the voting escrow itself. The list ends at
+         the first empty address, later entries are empty
+    @param _addrs User wallet addresses
+    @param _chain Chain id of the mirrored escrow
+    @param _escrow_id Id of the escrow on `_chain`
+    @return [amount, end] of each user's lock, in the order of `_addrs`
+    """
+    assert _chain != 0  # dev: local locks are not mirrored
+
+    locks: uint256[2][MAX_BALANCE_BATCH] = empty(uint256[2][MAX_BALANCE_BATCH])
+    for i in range(MAX_BALANCE_BATCH):
+        if _addrs[i] == ZERO_ADDRESS:
+            break
+        _locked: LockedBalance = self.mirrored_locks[_addrs[i]][_chain][_escrow_id]
+        locks[i] = [convert(_locked.amount, uint256), _locked.end]
+
+    return locks
+
+
 @external
 @view
 def nearest_locked__end(_addr: address) -> uint256:
@@ -33,10 +33,20 @@ interface IMirroredVotingEscrow {
         uint256 _value,
         uint256 _unlock_time
     ) external;
+
+    function mirror_locks(
+        address[32] memory _users,
+        uint256[32] memory _chains,
+        uint256[32] memory _escrow_ids,
+        uint256[32] memory _values,
+        uint256[32] memory _unlock_times
+    ) external;
 }
 
 contract MultiChainMirrorGateV2 is Ownable, Pausable, IApp {
 
+    uint256 constant MIRROR_BATCH_SIZE = 32;
+
     uint256 immutable chainId;
 
     IMirroredVotingEscrow public mirrorEscrow;
@@ -115,14 +125,22 @@ contract MultiChainMirrorGateV2 is Ownable, Pausable, IApp {
         uint256[] memory lockEnds_) = abi.decode(_data, (address, uint256[], uint256[], uint256[], uint256[]));
 
         uint256 nbLocks = chainIds_.length;
-        for (uint256 i = 0; i < nbLocks; i++) {
-            mirrorEscrow.mirror_lock(
-                user_,
-                chainIds_[i],
-                escrowIds_[i],
-                lockAmounts_[i],
-                lockEnds_[i]
-            );
+        for (uint256 i = 0; i < nbLocks; i += MIRROR_BATCH_SIZE) {
+            address[32] memory users_;
+            uint256[32] memory batchChainIds_;
+            uint256[32] memory batchEscrowIds_;
+            uint256[32] memory batchAmounts_;
+            uint256[32] memory batchEnds_;
+
+            for (uint256 j = 0; j < MIRROR_BATCH_SIZE && i + j < nbLocks; j++) {
+                users_[j] = user_;
+                batchChainIds_[j] = chainIds_[i + j];
+                batchEscrowIds_[j] = escrowIds_[i + j];
+                batchAmounts_[j] = lockAmounts_[i + j];
+                batchEnds_[j] = lockEnds_[i + j];
+            }
+
+            mirrorEscrow.mirror_locks(users_, batchChainIds_, batchEscrowIds_, batchAmounts_, batchEnds_);
         }
 
         return (true, "");
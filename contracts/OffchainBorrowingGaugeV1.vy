@@ -10,8 +10,8 @@ from vyper.interfaces import ERC20
 interface RewardPolicyMaker:
     def future_epoch_time() -> uint256: nonpayable
     def rate_at(_timestamp: uint256, _token: address) -> uint256: view
-    def epoch_at(_timestamp: uint256) -> uint256: view
-    def epoch_start_time(_epoch: uint256) -> uint256: view
+    def first_epoch_time() -> uint256: view
+    def epoch_length() -> uint256: view
 
 interface Controller:
     def gauge_relative_weight(addr: address, time: uint256) -> uint256: view
@@ -26,6 +26,7 @@ interface Minter:
 
 interface VotingEscrow:
     def user_last_checkpoint_ts(_user: address) -> uint256: view
+    def total_supply_write() -> uint256: nonpayable
 
 interface VotingEscrowBoost:
     def adjusted_balance_of(_account: address) -> uint256: view
@@ -52,6 +53,7 @@ event ApplyOwnership:
 TOKENLESS_PRODUCTION: constant(uint256) = 40
 WEEK: constant(uint256) = 604800
 MAX_TOKENS: constant(uint256) = 10
+MAX_USER_BATCH: constant(uint256) = 32
 MAX_MEASURED_TOKENS: constant(int128) = 32
 
 minter: public(address)
@@ -60,8 +62,23 @@ voting_escrow: public(address)
 controller: public(address)
 veboost_proxy: public(address)
 
+# reward tokens, mirrored from the minter
+token_count: public(uint256)
+tokens: public(address[MAX_TOKENS])
+
+# reward epochs, mirrored from the reward policy maker
+first_epoch_time: public(uint256)
+epoch_length: public(uint256)
+
 hcontroller: public(address)
 
+# In push mode the HController sends borrow balances through `sync_borrow_balance`
+# and they are read from here instead of being aggregated by the HController
+push_mode: public(bool)
+synced_total_supply: uint256
+synced_balances: HashMap[uint256, HashMap[address, uint256]]  # round -> user -> balance
+synced_round: uint256  # bumped on every mode switch, so that pushed balances start empty
+
 name: public(String[64])
 symbol: public(String[32])
 decimals: public(uint256)
@@ -134,16 +151,30 @@ def __init__(
     self.period_timestamp[0] = block.timestamp
     self.veboost_proxy = _veboost_proxy
 
+    self.first_epoch_time = RewardPolicyMaker(_reward_policy_maker).first_epoch_time()
+    self.epoch_length = RewardPolicyMaker(_reward_policy_maker).epoch_length()
+
+    token_count: uint256 = Minter(_minter).token_count()
+    for i in range(MAX_TOKENS):
+        if i == token_count:
+            break
+        self.tokens[i] = Minter(_minter).tokens(i)
+    self.token_count = token_count
+
 
 @view
 @internal
 def total_supply() -> uint256:
+    if self.push_mode:
+        return self.synced_total_supply
     return HController(self.hcontroller).totalOutboundBorrowsForGauge(self)
 
 
 @view
 @internal
 def balance_of(user: address) -> uint256:
+    if self.push_mode:
+        return self.synced_balances[self.synced_round][user]
     return HController(self.hcontroller).accountTotalOutboundBorrowsForGauge(self, user)
 
 
@@ -165,6 +196,19 @@ def integrate_checkpoint() -> uint256:
     return self.period_timestamp[self.period]
 
 
+@view
+@internal
+def _epoch_at(_timestamp: uint256) -> uint256:
+    """
+    @notice Reward epoch number for a given time, as in the reward policy maker
+    """
+    _first_epoch_time: uint256 = self.first_epoch_time
+    if _timestamp < _first_epoch_time:
+        return 0
+
+    return (_timestamp - _first_epoch_time) / self.epoch_length
+
+
 @internal
 def _update_liquidity_limit(addr: address, l: uint256, L: uint256):
     """
@@ -177,7 +221,7 @@ def _update_liquidity_limit(addr: address, l: uint256, L: uint256):
     """
     # To be called after totalSupply is updated
     voting_balance: uint256 = VotingEscrowBoost(self.veboost_proxy).adjusted_balance_of(addr)
-    voting_total: uint256 = ERC20(self.voting_escrow).totalSupply()
+    voting_total: uint256 = VotingEscrow(self.voting_escrow).total_supply_write()
 
     lim: uint256 = l * TOKENLESS_PRODUCTION / 100
     if voting_total > 0:
@@ -193,77 +237,137 @@ def _update_liquidity_limit(addr: address, l: uint256, L: uint256):
 
 
 @internal
-def _checkpoint_token(addr: address, token: address, period: int128, period_time: uint256):
+def _sync_tokens():
     """
-    @notice Checkpoint for a user
-    @param addr User address
-    @param token Reward token
-    @param period Reward period id
-    @param period_time Reward period timestamp
+    @notice Copy the reward tokens added to the minter since the last sync
+    @dev The minter only ever appends tokens
+    """
+    _minter: address = self.minter
+    _old_count: uint256 = self.token_count
+    _token_count: uint256 = Minter(_minter).token_count()
+    if _token_count == _old_count:
+        return
+
+    for i in range(MAX_TOKENS):
+        if i == _token_count:
+            break
+        if i >= _old_count:
+            self.tokens[i] = Minter(_minter).tokens(i)
+    self.token_count = _token_count
+
+
+@view
+@internal
+def _pending_integrate_inv_supply() -> uint256[MAX_TOKENS]:
+    """
+    @notice Integrals of 1/supply advanced until now, without recording them
+    @dev Weeks are walked once, the integrals of every reward token move in the same pass
+    @return Integrals of 1/supply, by index in `tokens`
     """
-    _integrate_inv_supply: uint256 = self.integrate_inv_supply[token][period]
+    _token_count: uint256 = self.token_count
+    _period: int128 = self.period
+    _period_time: uint256 = self.period_timestamp[_period]
+    _first_epoch_time: uint256 = self.first_epoch_time
+    _epoch_length: uint256 = self.epoch_length
+
+    if _period_time == 0:
+        _period_time = _first_epoch_time + self._epoch_at(block.timestamp) * _epoch_length
 
-    _epoch: uint256 = RewardPolicyMaker(self.reward_policy_maker).epoch_at(block.timestamp)
+    _tokens: address[MAX_TOKENS] = self.tokens
+    _integrate_inv_supply: uint256[MAX_TOKENS] = empty(uint256[MAX_TOKENS])
+    for i in range(MAX_TOKENS):
+        if i == _token_count:
+            break
+        _integrate_inv_supply[i] = self.integrate_inv_supply[_tokens[i]][_period]
 
     # Update integral of 1/supply
-    if block.timestamp > period_time and not self.is_killed:
-        _working_supply: uint256 = self.working_supply
+    if block.timestamp > _period_time and not self.is_killed:
         _controller: address = self.controller
-
-        prev_week_time: uint256 = period_time
+        _working_supply: uint256 = self.working_supply
+        _reward_policy_maker: address = self.reward_policy_maker
+        prev_week_time: uint256 = _period_time
 
         for i in range(500):
-            _epoch = RewardPolicyMaker(self.reward_policy_maker).epoch_at(prev_week_time)
-            week_time: uint256 = RewardPolicyMaker(self.reward_policy_maker).epoch_start_time(_epoch + 1)
+            if _working_supply == 0:
+                break
+            week_time: uint256 = _first_epoch_time + (self._epoch_at(prev_week_time) + 1) * _epoch_length
             week_time = min(week_time, block.timestamp)
 
             dt: uint256 = week_time - prev_week_time
             w: uint256 = Controller(_controller).gauge_relative_weight(self, prev_week_time / WEEK * WEEK)
 
-            if _working_supply > 0:
-                _integrate_inv_supply += RewardPolicyMaker(self.reward_policy_maker).rate_at(prev_week_time, token) * w * dt / _working_supply
-                # On precisions of the calculation
-                # rate ~= 10e18
-                # last_weight > 0.01 * 1e18 = 1e16 (if pool weight is 1%)
-                # _working_supply ~= TVL * 1e18 ~= 1e26 ($100M for example)
-                # The largest loss is at dt = 1
-                # Loss is 1e-9 - acceptable
+            if w > 0 and dt > 0:
+                for j in range(MAX_TOKENS):
+                    if j == _token_count:
+                        break
+                    _integrate_inv_supply[j] += RewardPolicyMaker(_reward_policy_maker).rate_at(prev_week_time, _tokens[j]) * w * dt / _working_supply
+                    # On precisions of the calculation
+                    # rate ~= 10e18
+                    # last_weight > 0.01 * 1e18 = 1e16 (if pool weight is 1%)
+                    # _working_supply ~= TVL * 1e18 ~= 1e26 ($100M for example)
+                    # The largest loss is at dt = 1
+                    # Loss is 1e-9 - acceptable
 
             if week_time == block.timestamp:
                 break
 
             prev_week_time = week_time
 
-    self.integrate_inv_supply[token][period + 1] = _integrate_inv_supply
-
-    # Update user-specific integrals
-    _working_balance: uint256 = self.working_balances[addr]
-    self.integrate_fraction[token][addr] += _working_balance * (_integrate_inv_supply - self.integrate_inv_supply_of[token][addr]) / 10 ** 18
-    self.integrate_inv_supply_of[token][addr] = _integrate_inv_supply
+    return _integrate_inv_supply
 
 
 @internal
-def _checkpoint(addr: address):
-    _token_count: uint256 = Minter(self.minter).token_count()
-    _period: int128 = self.period
-    _period_time: uint256 = self.period_timestamp[_period]
-
-    if _period_time == 0:
-        _epoch: uint256 = RewardPolicyMaker(self.reward_policy_maker).epoch_at(block.timestamp)
-        _period_time = RewardPolicyMaker(self.reward_policy_maker).epoch_start_time(_epoch)
+def _checkpoint_global() -> uint256[MAX_TOKENS]:
+    """
+    @notice Advance the integrals of 1/supply until now
+    @return Integrals of 1/supply, by index in `tokens`
+    """
+    self._sync_tokens()
 
-    if block.timestamp > _period_time and not self.is_killed:
-        _controller: address = self.controller
-        Controller(_controller).checkpoint_gauge(self)
+    _period: int128 = self.period
+    if block.timestamp > self.period_timestamp[_period] and not self.is_killed:
+        Controller(self.controller).checkpoint_gauge(self)
 
+    _token_count: uint256 = self.token_count
+    _integrate_inv_supply: uint256[MAX_TOKENS] = self._pending_integrate_inv_supply()
     for i in range(MAX_TOKENS):
         if i == _token_count:
             break
-        self._checkpoint_token(addr, Minter(self.minter).tokens(i), _period, _period_time)
+        self.integrate_inv_supply[self.tokens[i]][_period + 1] = _integrate_inv_supply[i]
 
     _period += 1
     self.period = _period
     self.period_timestamp[_period] = block.timestamp
+
+    return _integrate_inv_supply
+
+
+@internal
+def _checkpoint_user(addr: address, _integrate_inv_supply: uint256[MAX_TOKENS]):
+    """
+    @notice Update user-specific integrals up to the current period
+    @dev Does not touch `integrate_checkpoint_of`, which `kick` relies on
+    @param addr User address
+    @param _integrate_inv_supply Integrals of 1/supply returned by `_checkpoint_global`
+    """
+    _token_count: uint256 = self.token_count
+    _working_balance: uint256 = self.working_balances[addr]
+    for i in range(MAX_TOKENS):
+        if i == _token_count:
+            break
+        token: address = self.tokens[i]
+        self.integrate_fraction[token][addr] += _working_balance * (_integrate_inv_supply[i] - self.integrate_inv_supply_of[token][addr]) / 10 ** 18
+        self.integrate_inv_supply_of[token][addr] = _integrate_inv_supply[i]
+
+
+@internal
+def _checkpoint(addr: address):
+    """
+    @notice Checkpoint for a user
+    @param addr User address
+    """
+    _integrate_inv_supply: uint256[MAX_TOKENS] = self._checkpoint_global()
+    self._checkpoint_user(addr, _integrate_inv_supply)
     self.integrate_checkpoint_of[addr] = block.timestamp
 
 
@@ -280,6 +384,50 @@ def user_checkpoint(addr: address) -> bool:
     return True
 
 
+@external
+def checkpoint_many(_addrs: address[MAX_USER_BATCH]):
+    """
+    @notice Record a checkpoint for each of `_addrs`
+    @dev The integrals of 1/supply are advanced once for the whole batch.
+         Anyone can advance the integrals of any address. The working balance
+         and `integrate_checkpoint_of` are only updated for the caller itself
+         or when called by a trusted contract, so this cannot block a `kick`.
+         The list ends at the first empty address
+    @param _addrs User addresses
+    """
+    _is_trusted: bool = (msg.sender == self.minter) or (msg.sender == self.hcontroller)
+    _total_supply: uint256 = self.total_supply()
+    _integrate_inv_supply: uint256[MAX_TOKENS] = self._checkpoint_global()
+    for i in range(MAX_USER_BATCH):
+        addr: address = _addrs[i]
+        if addr == ZERO_ADDRESS:
+            break
+        self._checkpoint_user(addr, _integrate_inv_supply)
+        if _is_trusted or (msg.sender == addr):
+            self.integrate_checkpoint_of[addr] = block.timestamp
+            self._update_liquidity_limit(addr, self.balance_of(addr), _total_supply)
+
+
+@external
+def sync_borrow_balance(addr: address, _balance: uint256, _total_supply: uint256) -> bool:
+    """
+    @notice Record the borrow balance of `addr` pushed by the HController
+    @dev Push mode replacement for `user_checkpoint`
+    @param addr User address
+    @param _balance Borrow balance of `addr` counted by this gauge
+    @param _total_supply Total borrows counted by this gauge
+    @return bool success
+    """
+    assert msg.sender == self.hcontroller  # dev: unauthorized
+    assert self.push_mode  # dev: push mode disabled
+
+    self.synced_balances[self.synced_round][addr] = _balance
+    self.synced_total_supply = _total_supply
+    self._checkpoint(addr)
+    self._update_liquidity_limit(addr, _balance, _total_supply)
+    return True
+
+
 @external
 def claimable_tokens(addr: address, token: address) -> uint256:
     """
@@ -291,6 +439,61 @@ def claimable_tokens(addr: address, token: address) -> uint256:
     return self.integrate_fraction[token][addr] - Minter(self.minter).minted(addr, self, token)
 
 
+@view
+@internal
+def _claimable_amounts(addr: address, _integrate_inv_supply: uint256[MAX_TOKENS]) -> uint256[MAX_TOKENS]:
+    """
+    @notice Project the claimable amount of every reward token for `addr`
+    @param addr User address
+    @param _integrate_inv_supply Integrals of 1/supply returned by `_pending_integrate_inv_supply`
+    @return Claimable amounts, by index in `tokens`
+    """
+    _minter: address = self.minter
+    _token_count: uint256 = self.token_count
+    _working_balance: uint256 = self.working_balances[addr]
+    claimable: uint256[MAX_TOKENS] = empty(uint256[MAX_TOKENS])
+    for i in range(MAX_TOKENS):
+        if i == _token_count:
+            break
+        token: address = self.tokens[i]
+        _integrate_fraction: uint256 = self.integrate_fraction[token][addr] + _working_balance * (_integrate_inv_supply[i] - self.integrate_inv_supply_of[token][addr]) / 10 ** 18
+        claimable[i] = _integrate_fraction - Minter(_minter).minted(addr, self, token)
+
+    return claimable
+
+
+@view
+@external
+def claimable_amounts(addr: address) -> uint256[MAX_TOKENS]:
+    """
+    @notice Get the number of claimable tokens of every reward token for `addr`
+    @dev Same amounts as `claimable_tokens` without writing a checkpoint, as long
+         as the gauge controller has been checkpointed for the elapsed weeks
+    @param addr User address
+    @return Claimable amounts, by index in `tokens`
+    """
+    return self._claimable_amounts(addr, self._pending_integrate_inv_supply())
+
+
+@view
+@external
+def claimable_amounts_many(_addrs: address[MAX_USER_BATCH]) -> uint256[MAX_TOKENS][MAX_USER_BATCH]:
+    """
+    @notice Get the claimable amounts of every reward token for each of `_addrs`
+    @dev The list ends at the first empty address, later entries are empty
+    @param _addrs User addresses
+    @return Claimable amounts of each user, by index in `tokens`
+    """
+    _integrate_inv_supply: uint256[MAX_TOKENS] = self._pending_integrate_inv_supply()
+    claimable: uint256[MAX_TOKENS][MAX_USER_BATCH] = empty(uint256[MAX_TOKENS][MAX_USER_BATCH])
+    for i in range(MAX_USER_BATCH):
+        if _addrs[i] == ZERO_ADDRESS:
+            break
+        claimable[i] = self._claimable_amounts(_addrs[i], _integrate_inv_supply)
+
+    return claimable
+
+
 @external
 def kick(addr: address):
     """
@@ -310,6 +513,45 @@ def kick(addr: address):
     self._update_liquidity_limit(addr, _balance, self.total_supply())
 
 
+@external
+def kick_many(_addrs: address[MAX_USER_BATCH]):
+    """
+    @notice Kick every address in `_addrs` that abuses their boost
+    @dev The integrals of 1/supply are advanced once for the whole batch.
+         Addresses that cannot be kicked are skipped and the list ends at
+         the first empty address
+    @param _addrs Addresses to kick
+    """
+    _voting_escrow: address = self.voting_escrow
+    _total_supply: uint256 = self.total_supply()
+    _integrate_inv_supply: uint256[MAX_TOKENS] = self._checkpoint_global()
+    for i in range(MAX_USER_BATCH):
+        addr: address = _addrs[i]
+        if addr == ZERO_ADDRESS:
+            break
+
+        t_last: uint256 = self.integrate_checkpoint_of[addr]
+        t_ve: uint256 = VotingEscrow(_voting_escrow).user_last_checkpoint_ts(addr)
+        _balance: uint256 = self.balance_of(addr)
+        if ERC20(_voting_escrow).balanceOf(addr) != 0 and t_ve <= t_last:
+            continue  # kick not allowed
+        if self.working_balances[addr] <= _balance * TOKENLESS_PRODUCTION / 100:
+            continue  # kick not needed
+
+        self._checkpoint_user(addr, _integrate_inv_supply)
+        self.integrate_checkpoint_of[addr] = block.timestamp
+        self._update_liquidity_limit(addr, _balance, _total_supply)
+
+
+@external
+def sync_tokens():
+    """
+    @notice Refresh the reward token list from the minter
+    @dev Checkpoints already do this, the list is only read from storage otherwise
+    """
+    self._sync_tokens()
+
+
 @external
 def set_killed(_is_killed: bool):
     """
@@ -322,6 +564,23 @@ def set_killed(_is_killed: bool):
     self.is_killed = _is_killed
 
 
+@external
+def set_push_mode(_push_mode: bool):
+    """
+    @notice Choose whether borrow balances are pushed by the HController or read from it
+    @dev Only before anyone has a working balance. Pushed balances are reset on
+         every switch, the HController pushes them again once in push mode
+    @param _push_mode Push mode status to set
+    """
+    assert msg.sender == self.admin  # dev: admin only
+    assert self.working_supply == 0  # dev: gauge in use
+
+    if _push_mode != self.push_mode:
+        self.synced_round += 1
+        self.synced_total_supply = 0
+    self.push_mode = _push_mode
+
+
 @external
 def commit_transfer_ownership(addr: address):
     """
@@ -11,6 +11,10 @@
 from vyper.interfaces import ERC20
 
 
+struct RewardGap:
+    start: uint256
+    end: uint256
+
 event SetAdmin:
     admin: address
 
@@ -22,6 +26,19 @@ epoch_length: public(uint256)
 
 rewards: public(HashMap[address, uint256[100000000000000000000000000000]])
 
+# token -> epoch -> amount emitted by all epochs before it, at the `rate_at` resolution
+cumulative_rewards: public(HashMap[address, uint256[100000000000000000000000000000]])
+# token -> number of epochs covered by `cumulative_rewards`, later epochs have no rewards
+scheduled_epochs: public(HashMap[address, uint256])
+# token -> gap -> epochs skipped without rewards, ordered by start. Their cumulative
+# totals are not written, they all equal the total at the start of the gap
+reward_gaps: public(HashMap[address, HashMap[uint256, RewardGap]])
+n_reward_gaps: public(HashMap[address, uint256])
+
+MAX_SCHEDULE_UPDATE: constant(uint256) = 520
+MAX_SCHEDULE_TOKENS: constant(uint256) = 10
+MAX_SCHEDULE_EPOCHS: constant(uint256) = 52
+
 
 @external
 def __init__(_epoch_length: uint256, _admin: address):
@@ -67,6 +84,99 @@ def _epoch_start_time() -> uint256:
     return self.first_epoch_time + self._current_epoch() * self.epoch_length
 
 
+@internal
+@view
+def _gap_at(_token: address, _epoch: uint256) -> uint256:
+    """
+    @notice Find the gap of `_token` containing epoch `_epoch`
+    @return Index of the gap, `n_reward_gaps` if the epoch is in none
+    """
+    _n: uint256 = self.n_reward_gaps[_token]
+    if _n == 0 or _epoch < self.reward_gaps[_token][0].start:
+        return _n
+
+    # Binary search for the last gap starting at or before `_epoch`
+    _min: uint256 = 0
+    _max: uint256 = _n - 1
+    for i in range(128):  # Will be always enough for 128-bit numbers
+        if _min >= _max:
+            break
+        _mid: uint256 = (_min + _max + 1) / 2
+        if self.reward_gaps[_token][_mid].start <= _epoch:
+            _min = _mid
+        else:
+            _max = _mid - 1
+
+    if _epoch < self.reward_gaps[_token][_min].end:
+        return _min
+    return _n
+
+
+@internal
+@view
+def _cumulative_at(_timestamp: uint256, _token: address) -> uint256:
+    """
+    @notice Amount emitted from the first epoch up to `_timestamp`
+    """
+    _first_epoch_time: uint256 = self.first_epoch_time
+    if _timestamp < _first_epoch_time:
+        return 0
+
+    _epoch_length: uint256 = self.epoch_length
+    _epoch: uint256 = (_timestamp - _first_epoch_time) / _epoch_length
+    _epoch_start: uint256 = _first_epoch_time + _epoch * _epoch_length
+
+    _index: uint256 = min(_epoch, self.scheduled_epochs[_token])
+    _gap: uint256 = self._gap_at(_token, _index)
+    if _gap < self.n_reward_gaps[_token]:
+        _index = self.reward_gaps[_token][_gap].start
+
+    _total: uint256 = self.cumulative_rewards[_token][_index]
+    return _total + self.rewards[_token][_epoch] / _epoch_length * (_timestamp - _epoch_start)
+
+
+@internal
+def _refresh_cumulative(_token: address, _from_epoch: uint256, _to_epoch: uint256):
+    """
+    @notice Recompute the cumulative totals after the rewards of epochs
+            `_from_epoch` to `_to_epoch` (excluded) were set
+    @dev Epochs skipped before `_from_epoch` have no rewards, the total is
+         carried over them in one step and only the rewritten epochs count
+         towards `MAX_SCHEDULE_UPDATE`
+    """
+    _scheduled: uint256 = self.scheduled_epochs[_token]
+    _total: uint256 = 0
+    if _from_epoch > _scheduled:
+        _total = self.cumulative_rewards[_token][_scheduled]
+        if _total > 0:
+            # unwritten totals already read zero, only a carried total needs a gap
+            _n: uint256 = self.n_reward_gaps[_token]
+            self.reward_gaps[_token][_n] = RewardGap({start: _scheduled, end: _from_epoch})
+            self.n_reward_gaps[_token] = _n + 1
+        self.cumulative_rewards[_token][_from_epoch] = _total
+    else:
+        _gap: uint256 = self._gap_at(_token, _from_epoch)
+        if _gap < self.n_reward_gaps[_token]:
+            # the gap now ends where the new rewards start
+            _total = self.cumulative_rewards[_token][self.reward_gaps[_token][_gap].start]
+            self.reward_gaps[_token][_gap].end = _from_epoch
+            self.cumulative_rewards[_token][_from_epoch] = _total
+        else:
+            _total = self.cumulative_rewards[_token][_from_epoch]
+
+    _end: uint256 = max(_to_epoch, _scheduled)
+    assert _end - _from_epoch <= MAX_SCHEDULE_UPDATE  # dev: schedule update too long
+
+    _epoch_length: uint256 = self.epoch_length
+    for i in range(_from_epoch, _from_epoch + MAX_SCHEDULE_UPDATE):
+        if i == _end:
+            break
+        _total += self.rewards[_token][i] / _epoch_length * _epoch_length
+        self.cumulative_rewards[_token][i + 1] = _total
+
+    self.scheduled_epochs[_token] = _end
+
+
 @external
 @view
 def epoch_at(_timestamp: uint256) -> uint256:
@@ -100,6 +210,22 @@ def rate_at(_timestamp: uint256, _token: address) -> uint256:
     return self.rewards[_token][self._epoch_at(_timestamp)] / self.epoch_length
 
 
+@external
+@view
+def integral_between(_t0: uint256, _t1: uint256, _token: address) -> uint256:
+    """
+    @notice Amount of `_token` emitted between two timestamps
+    @dev Equals the sum of `rate_at` over the span, without walking the epochs
+    @param _t0 Start of the span
+    @param _t1 End of the span
+    @param _token Reward token
+    @return uint256 emitted amount
+    """
+    assert _t0 <= _t1  # dev: invalid span
+
+    return self._cumulative_at(_t1, _token) - self._cumulative_at(_t0, _token)
+
+
 @external
 @view
 def current_epoch() -> uint256:
@@ -150,6 +276,7 @@ def set_rewards_at(_epoch: uint256, _token: address, _reward: uint256):
     assert _epoch > self._current_epoch()  # dev: can only modify future rates
 
     self.rewards[_token][_epoch] = _reward
+    self._refresh_cumulative(_token, _epoch, _epoch + 1)
 
 
 @external
@@ -161,4 +288,34 @@ def set_rewards_starting_at(_epoch: uint256, _token: address, _rewards: uint256[
     assert _epoch > self._current_epoch()  # dev: can only modify future rewards
 
     for index in range(10):
-        self.rewards[_token][_epoch + index] = _rewards[index]
\ No newline at end of file
+        self.rewards[_token][_epoch + index] = _rewards[index]
+    self._refresh_cumulative(_token, _epoch, _epoch + 10)
+
+
+@external
+def set_rewards_schedule(
+    _epoch: uint256,
+    _epochs: uint256,
+    _tokens: address[MAX_SCHEDULE_TOKENS],
+    _rewards: uint256[MAX_SCHEDULE_EPOCHS][MAX_SCHEDULE_TOKENS]
+):
+    """
+    @notice set future rewards of several tokens starting at epoch _epoch
+    @param _epoch First epoch of the schedule
+    @param _epochs Number of epochs to set, up to a year of weekly epochs
+    @param _tokens Reward tokens, the list ends at the first empty address
+    @param _rewards Rewards of each token, one row per token
+    """
+    assert msg.sender == self.admin  # dev: admin only
+    assert _epoch > self._current_epoch()  # dev: can only modify future rewards
+    assert _epochs <= MAX_SCHEDULE_EPOCHS  # dev: too many epochs
+
+    for i in range(MAX_SCHEDULE_TOKENS):
+        _token: address = _tokens[i]
+        if _token == ZERO_ADDRESS:
+            break
+        for j in range(MAX_SCHEDULE_EPOCHS):
+            if j == _epochs:
+                break
+            self.rewards[_token][_epoch + j] = _rewards[i][j]
+        self._refresh_cumulative(_token, _epoch, _epoch + _epochs)
\ No newline at end of file
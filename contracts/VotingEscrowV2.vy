@@ -31,6 +31,11 @@ struct Point:
 # and per block could be fairly bad b/c Ethereum changes blocktimes.
 # What we can do is to extrapolate ***At functions
 
+# Point as it is stored: two slots instead of four
+struct PackedPoint:
+    bias_slope: uint256  # [bias uint128][slope uint128]
+    ts_blk: uint256  # [ts uint128][blk uint128]
+
 struct LockedBalance:
     amount: int128
     end: uint256
@@ -84,6 +89,8 @@ event Supply:
 WEEK: constant(uint256) = 7 * 86400  # all future times are rounded by week
 MAXTIME: constant(uint256) = 4 * 365 * 86400  # 4 years
 MULTIPLIER: constant(uint256) = 10 ** 18
+MAX_LOCK_BATCH: constant(uint256) = 32
+MAX_BALANCE_BATCH: constant(uint256) = 100
 
 token: public(address)
 supply: public(uint256)
@@ -91,10 +98,11 @@ supply: public(uint256)
 locked: public(HashMap[address, LockedBalance])
 
 epoch: public(uint256)
-point_history: public(Point[100000000000000000000000000000])  # epoch -> unsigned point
-user_point_history: public(HashMap[address, Point[1000000000]])  # user -> Point[user_epoch]
+packed_point_history: PackedPoint[100000000000000000000000000000]  # epoch -> unsigned point
+packed_user_point_history: HashMap[address, PackedPoint[1000000000]]  # user -> Point[user_epoch]
 user_point_epoch: public(HashMap[address, uint256])
 slope_changes: public(HashMap[uint256, int128])  # time -> signed slope change
+week_supply: public(HashMap[uint256, uint256])  # week start -> total voting power, once in the past
 
 # Aragon's view methods for compatibility
 controller: public(address)
@@ -137,8 +145,7 @@ def __init__(
     """
     self.admin = _admin
     self.token = token_addr
-    self.point_history[0].blk = block.number
-    self.point_history[0].ts = block.timestamp
+    self.packed_point_history[0].ts_blk = shift(block.timestamp, 128) + block.number
     self.controller = msg.sender
     self.transfersEnabled = True
     self.smart_wallet_checker = _smart_wallet_checker
@@ -241,6 +248,58 @@ def assert_lock_creator(addr: address):
     raise "Lock creator not allowed"
 
 
+@internal
+@pure
+def pack_point(_point: Point) -> PackedPoint:
+    """
+    @notice Pack a point into two storage slots
+    @dev Stored points never have a negative bias or slope
+    """
+    return PackedPoint({
+        bias_slope: shift(convert(_point.bias, uint256), 128) + convert(_point.slope, uint256),
+        ts_blk: shift(_point.ts, 128) + _point.blk
+    })
+
+
+@internal
+@pure
+def unpack_point(_packed: PackedPoint) -> Point:
+    """
+    @notice Unpack a point stored by `pack_point`
+    """
+    return Point({
+        bias: convert(shift(_packed.bias_slope, -128), int128),
+        slope: convert(_packed.bias_slope % 2 ** 128, int128),
+        ts: shift(_packed.ts_blk, -128),
+        blk: _packed.ts_blk % 2 ** 128
+    })
+
+
+@external
+@view
+def point_history(_epoch: uint256) -> (int128, int128, uint256, uint256):
+    """
+    @notice Get the global point recorded at `_epoch`
+    @param _epoch Global epoch number
+    @return bias, slope, ts and blk of the point
+    """
+    point: Point = self.unpack_point(self.packed_point_history[_epoch])
+    return point.bias, point.slope, point.ts, point.blk
+
+
+@external
+@view
+def user_point_history(_addr: address, _idx: uint256) -> (int128, int128, uint256, uint256):
+    """
+    @notice Get the point recorded at checkpoint `_idx` for `_addr`
+    @param _addr User wallet address
+    @param _idx User epoch number
+    @return bias, slope, ts and blk of the point
+    """
+    point: Point = self.unpack_point(self.packed_user_point_history[_addr][_idx])
+    return point.bias, point.slope, point.ts, point.blk
+
+
 @external
 @view
 def get_last_user_slope(addr: address) -> int128:
@@ -250,7 +309,7 @@ def get_last_user_slope(addr: address) -> int128:
     @return Value of the slope
     """
     uepoch: uint256 = self.user_point_epoch[addr]
-    return self.user_point_history[addr][uepoch].slope
+    return convert(self.packed_user_point_history[addr][uepoch].bias_slope % 2 ** 128, int128)
 
 
 @external
@@ -262,7 +321,7 @@ def user_point_history__ts(_addr: address, _idx: uint256) -> uint256:
     @param _idx User epoch number
     @return Epoch time of the checkpoint
     """
-    return self.user_point_history[_addr][_idx].ts
+    return shift(self.packed_user_point_history[_addr][_idx].ts_blk, -128)
 
 
 @external
@@ -276,43 +335,99 @@ def locked__end(_addr: address) -> uint256:
     return self.locked[_addr].end
 
 
+@external
+@view
+def lockedOf(_addrs: address[MAX_BALANCE_BATCH]) -> uint256[2][MAX_BALANCE_BATCH]:
+    """
+    @notice Get the locks of several users in one call
+    @dev The list ends at the first empty address, later entries are empty
+    @param _addrs User wallet addresses
+    @return [amount, end] of each user's lock, in the order of `_addrs`
+    """
+    locks: uint256[2][MAX_BALANCE_BATCH] = empty(uint256[2][MAX_BALANCE_BATCH])
+    for i in range(MAX_BALANCE_BATCH):
+        if _addrs[i] == ZERO_ADDRESS:
+            break
+        _locked: LockedBalance = self.locked[_addrs[i]]
+        locks[i] = [convert(_locked.amount, uint256), _locked.end]
+
+    return locks
+
+
 @internal
-def _checkpoint(addr: address, old_locked: LockedBalance, new_locked: LockedBalance):
+def _checkpoint_user(addr: address, old_locked: LockedBalance, new_locked: LockedBalance) -> (int128, int128):
     """
-    @notice Record global and per-user data to checkpoint
-    @param addr User's wallet address. No user checkpoint if 0x0
+    @notice Record per-user data to checkpoint
+    @dev The caller applies the returned change to the current global point
+    @param addr User's wallet address
     @param old_locked Pevious locked amount / end lock time for the user
     @param new_locked New locked amount / end lock time for the user
+    @return Change of the global bias and slope
     """
     u_old: Point = empty(Point)
     u_new: Point = empty(Point)
     old_dslope: int128 = 0
     new_dslope: int128 = 0
-    _epoch: uint256 = self.epoch
 
-    if addr != ZERO_ADDRESS:
-        # Calculate slopes and biases
-        # Kept at zero when they have to
-        if old_locked.end > block.timestamp and old_locked.amount > 0:
-            u_old.slope = old_locked.amount / MAXTIME
-            u_old.bias = u_old.slope * convert(old_locked.end - block.timestamp, int128)
-        if new_locked.end > block.timestamp and new_locked.amount > 0:
-            u_new.slope = new_locked.amount / MAXTIME
-            u_new.bias = u_new.slope * convert(new_locked.end - block.timestamp, int128)
-
-        # Read values of scheduled changes in the slope
-        # old_locked.end can be in the past and in the future
-        # new_locked.end can ONLY by in the FUTURE unless everything expired: than zeros
-        old_dslope = self.slope_changes[old_locked.end]
-        if new_locked.end != 0:
-            if new_locked.end == old_locked.end:
-                new_dslope = old_dslope
-            else:
-                new_dslope = self.slope_changes[new_locked.end]
+    # Calculate slopes and biases
+    # Kept at zero when they have to
+    if old_locked.end > block.timestamp and old_locked.amount > 0:
+        u_old.slope = old_locked.amount / MAXTIME
+        u_old.bias = u_old.slope * convert(old_locked.end - block.timestamp, int128)
+    if new_locked.end > block.timestamp and new_locked.amount > 0:
+        u_new.slope = new_locked.amount / MAXTIME
+        u_new.bias = u_new.slope * convert(new_locked.end - block.timestamp, int128)
+
+    # Read values of scheduled changes in the slope
+    # old_locked.end can be in the past and in the future
+    # new_locked.end can ONLY by in the FUTURE unless everything expired: than zeros
+    old_dslope = self.slope_changes[old_locked.end]
+    if new_locked.end != 0:
+        if new_locked.end == old_locked.end:
+            new_dslope = old_dslope
+        else:
+            new_dslope = self.slope_changes[new_locked.end]
+
+    # Schedule the slope changes (slope is going down)
+    # We subtract new_user_slope from [new_locked.end]
+    # and add old_user_slope to [old_locked.end]
+    if old_locked.end > block.timestamp:
+        # old_dslope was <something> - u_old.slope, so we cancel that
+        old_dslope += u_old.slope
+        if new_locked.end == old_locked.end:
+            old_dslope -= u_new.slope  # It was a new deposit, not extension
+        self.slope_changes[old_locked.end] = old_dslope
+
+    if new_locked.end > block.timestamp:
+        if new_locked.end > old_locked.end:
+            new_dslope -= u_new.slope  # old slope disappeared at this point
+            self.slope_changes[new_locked.end] = new_dslope
+        # else: we recorded it already in old_dslope
+
+    # Now handle user history
+    user_epoch: uint256 = self.user_point_epoch[addr] + 1
+
+    self.user_point_epoch[addr] = user_epoch
+    u_new.ts = block.timestamp
+    u_new.blk = block.number
+    self.packed_user_point_history[addr][user_epoch] = self.pack_point(u_new)
+
+    return u_new.bias - u_old.bias, u_new.slope - u_old.slope
+
+
+@internal
+def _checkpoint(addr: address, old_locked: LockedBalance, new_locked: LockedBalance):
+    """
+    @notice Record global and per-user data to checkpoint
+    @param addr User's wallet address. No user checkpoint if 0x0
+    @param old_locked Pevious locked amount / end lock time for the user
+    @param new_locked New locked amount / end lock time for the user
+    """
+    _epoch: uint256 = self.epoch
 
     last_point: Point = Point({bias: 0, slope: 0, ts: block.timestamp, blk: block.number})
     if _epoch > 0:
-        last_point = self.point_history[_epoch]
+        last_point = self.unpack_point(self.packed_point_history[_epoch])
     last_checkpoint: uint256 = last_point.ts
     # initial_last_point is used for extrapolation to calculate block number
     # (approximately, for *At methods) and save them
@@ -324,6 +439,10 @@ def _checkpoint(addr: address, old_locked: LockedBalance, new_locked: LockedBala
     # If last point is already recorded in this block, slope=0
     # But that's ok b/c we know the block in such case
 
+    # A point recorded exactly on a week boundary is final once time moves on
+    if last_checkpoint % WEEK == 0 and last_checkpoint < block.timestamp:
+        self.week_supply[last_checkpoint] = convert(last_point.bias, uint256)
+
     # Go over weeks to fill history and calculate what the current point is
     t_i: uint256 = (last_checkpoint / WEEK) * WEEK
     for i in range(255):
@@ -349,7 +468,8 @@ def _checkpoint(addr: address, old_locked: LockedBalance, new_locked: LockedBala
             last_point.blk = block.number
             break
         else:
-            self.point_history[_epoch] = last_point
+            self.packed_point_history[_epoch] = self.pack_point(last_point)
+            self.week_supply[t_i] = convert(last_point.bias, uint256)
 
     self.epoch = _epoch
     # Now point_history is filled until t=now
@@ -357,40 +477,18 @@ def _checkpoint(addr: address, old_locked: LockedBalance, new_locked: LockedBala
     if addr != ZERO_ADDRESS:
         # If last point was in this block, the slope change has been applied already
         # But in such case we have 0 slope(s)
-        last_point.slope += (u_new.slope - u_old.slope)
-        last_point.bias += (u_new.bias - u_old.bias)
+        d_bias: int128 = 0
+        d_slope: int128 = 0
+        d_bias, d_slope = self._checkpoint_user(addr, old_locked, new_locked)
+        last_point.slope += d_slope
+        last_point.bias += d_bias
         if last_point.slope < 0:
             last_point.slope = 0
         if last_point.bias < 0:
             last_point.bias = 0
 
     # Record the changed point into history
-    self.point_history[_epoch] = last_point
-
-    if addr != ZERO_ADDRESS:
-        # Schedule the slope changes (slope is going down)
-        # We subtract new_user_slope from [new_locked.end]
-        # and add old_user_slope to [old_locked.end]
-        if old_locked.end > block.timestamp:
-            # old_dslope was <something> - u_old.slope, so we cancel that
-            old_dslope += u_old.slope
-            if new_locked.end == old_locked.end:
-                old_dslope -= u_new.slope  # It was a new deposit, not extension
-            self.slope_changes[old_locked.end] = old_dslope
-
-        if new_locked.end > block.timestamp:
-            if new_locked.end > old_locked.end:
-                new_dslope -= u_new.slope  # old slope disappeared at this point
-                self.slope_changes[new_locked.end] = new_dslope
-            # else: we recorded it already in old_dslope
-
-        # Now handle user history
-        user_epoch: uint256 = self.user_point_epoch[addr] + 1
-
-        self.user_point_epoch[addr] = user_epoch
-        u_new.ts = block.timestamp
-        u_new.blk = block.number
-        self.user_point_history[addr][user_epoch] = u_new
+    self.packed_point_history[_epoch] = self.pack_point(last_point)
 
 
 @internal
@@ -435,6 +533,68 @@ def checkpoint():
     self._checkpoint(ZERO_ADDRESS, empty(LockedBalance), empty(LockedBalance))
 
 
+@external
+def checkpoint_weeks(_max_weeks: uint256):
+    """
+    @notice Fill the global point history by at most `_max_weeks` weeks
+    @dev Splits the catch-up after an idle period across several transactions.
+         Only past week boundaries are recorded, `checkpoint` records the current point
+    @param _max_weeks Maximum number of weeks to fill
+    """
+    _epoch: uint256 = self.epoch
+    if _epoch == 0:
+        return
+
+    last_point: Point = self.unpack_point(self.packed_point_history[_epoch])
+    initial_last_point: Point = last_point
+    block_slope: uint256 = 0  # dblock/dt
+    if block.timestamp > last_point.ts:
+        block_slope = MULTIPLIER * (block.number - last_point.blk) / (block.timestamp - last_point.ts)
+
+    if last_point.ts % WEEK == 0 and last_point.ts < block.timestamp:
+        self.week_supply[last_point.ts] = convert(last_point.bias, uint256)
+
+    t_i: uint256 = (last_point.ts / WEEK) * WEEK
+    for i in range(255):
+        if i >= _max_weeks:
+            break
+        t_i += WEEK
+        if t_i >= block.timestamp:
+            break
+        last_point.bias -= last_point.slope * convert(t_i - last_point.ts, int128)
+        last_point.slope += self.slope_changes[t_i]
+        if last_point.bias < 0:
+            last_point.bias = 0
+        if last_point.slope < 0:
+            last_point.slope = 0
+        last_point.ts = t_i
+        last_point.blk = initial_last_point.blk + block_slope * (t_i - initial_last_point.ts) / MULTIPLIER
+        _epoch += 1
+        self.packed_point_history[_epoch] = self.pack_point(last_point)
+        self.week_supply[t_i] = convert(last_point.bias, uint256)
+
+    self.epoch = _epoch
+
+
+@external
+@view
+def pending_weeks() -> uint256:
+    """
+    @notice Get the number of week boundaries the global point history still has to cross
+    @return Number of weeks `checkpoint_weeks` can fill
+    """
+    _epoch: uint256 = self.epoch
+    if _epoch == 0:
+        return 0
+
+    # a boundary equal to the current time is left to `checkpoint`
+    current_week: uint256 = (block.timestamp - 1) / WEEK
+    last_week: uint256 = shift(self.packed_point_history[_epoch].ts_blk, -128) / WEEK
+    if current_week <= last_week:
+        return 0
+    return current_week - last_week
+
+
 @external
 @nonreentrant('lock')
 def deposit_for(_addr: address, _value: uint256):
@@ -474,6 +634,69 @@ def create_lock_for(_addr: address, _value: uint256, _unlock_time: uint256):
     self._deposit_for(msg.sender, _addr, _value, unlock_time, _locked, CREATE_LOCK_TYPE)
 
 
+@external
+@nonreentrant('lock')
+def create_locks_for(
+    _addrs: address[MAX_LOCK_BATCH],
+    _values: uint256[MAX_LOCK_BATCH],
+    _unlock_times: uint256[MAX_LOCK_BATCH]
+):
+    """
+    @notice Deposit `_values` tokens for each of `_addrs` and lock until `_unlock_times`
+    @dev The global history is filled once for the whole batch and the tokens
+         are pulled from the caller in a single transfer. The batch ends at the
+         first empty address.
+    @param _addrs User wallet addresses
+    @param _values Amounts to deposit
+    @param _unlock_times Epoch times when tokens unlock, rounded down to whole weeks
+    """
+    self.assert_lock_creator(msg.sender)
+    self._checkpoint(ZERO_ADDRESS, empty(LockedBalance), empty(LockedBalance))
+
+    _epoch: uint256 = self.epoch
+    last_point: Point = self.unpack_point(self.packed_point_history[_epoch])
+    supply_before: uint256 = self.supply
+    total: uint256 = 0
+
+    for i in range(MAX_LOCK_BATCH):
+        _addr: address = _addrs[i]
+        if _addr == ZERO_ADDRESS:
+            break
+
+        _value: uint256 = _values[i]
+        unlock_time: uint256 = (_unlock_times[i] / WEEK) * WEEK  # Locktime is rounded down to weeks
+        old_locked: LockedBalance = self.locked[_addr]
+
+        assert _value > 0  # dev: need non-zero value
+        assert old_locked.amount == 0, "Withdraw old tokens first"
+        assert unlock_time > block.timestamp, "Can only lock until time in the future"
+        assert unlock_time <= block.timestamp + MAXTIME, "Voting lock can be 4 years max"
+
+        _locked: LockedBalance = LockedBalance({amount: convert(_value, int128), end: unlock_time})
+        self.locked[_addr] = _locked
+
+        d_bias: int128 = 0
+        d_slope: int128 = 0
+        d_bias, d_slope = self._checkpoint_user(_addr, old_locked, _locked)
+        last_point.slope += d_slope
+        last_point.bias += d_bias
+        if last_point.slope < 0:
+            last_point.slope = 0
+        if last_point.bias < 0:
+            last_point.bias = 0
+
+        total += _value
+        log Deposit(_addr, _value, unlock_time, CREATE_LOCK_TYPE, block.timestamp)
+
+    self.packed_point_history[_epoch] = self.pack_point(last_point)
+    self.supply = supply_before + total
+
+    if total != 0:
+        assert ERC20(self.token).transferFrom(msg.sender, self, total)
+
+    log Supply(supply_before, supply_before + total)
+
+
 @external
 @nonreentrant('lock')
 def create_lock(_value: uint256, _unlock_time: uint256):
@@ -580,19 +803,76 @@ def find_block_epoch(_block: uint256, max_epoch: uint256) -> uint256:
         if _min >= _max:
             break
         _mid: uint256 = (_min + _max + 1) / 2
-        if self.point_history[_mid].blk <= _block:
+        if self.packed_point_history[_mid].ts_blk % 2 ** 128 <= _block:
             _min = _mid
         else:
             _max = _mid - 1
     return _min
 
 
-@external
+@internal
 @view
-def balanceOf(addr: address, _t: uint256 = block.timestamp) -> uint256:
+def find_user_block_epoch(addr: address, _block: uint256, max_epoch: uint256) -> uint256:
     """
-    @notice Get the current voting power for `msg.sender`
-    @dev Adheres to the ERC20 `balanceOf` interface for Aragon compatibility
+    @notice Binary search for the last user epoch of `addr` at or before block `_block`
+    @param addr User's wallet address
+    @param _block Block to find
+    @param max_epoch Don't go beyond this epoch
+    @return User epoch number
+    """
+    _min: uint256 = 0
+    _max: uint256 = max_epoch
+    for i in range(128):  # Will be always enough for 128-bit numbers
+        if _min >= _max:
+            break
+        _mid: uint256 = (_min + _max + 1) / 2
+        if self.packed_user_point_history[addr][_mid].ts_blk % 2 ** 128 <= _block:
+            _min = _mid
+        else:
+            _max = _mid - 1
+    return _min
+
+
+@internal
+@view
+def find_block_epoch_hint(_block: uint256, max_epoch: uint256, _hint: uint256) -> uint256:
+    """
+    @notice Check that `_hint` is the epoch `find_block_epoch` would return
+    @dev Two storage reads when the hint is right, a binary search otherwise
+    @param _block Block to find
+    @param max_epoch Don't go beyond this epoch
+    @param _hint Expected epoch
+    @return Last epoch at or before block `_block`
+    """
+    if _hint <= max_epoch and self.packed_point_history[_hint].ts_blk % 2 ** 128 <= _block:
+        if _hint == max_epoch or self.packed_point_history[_hint + 1].ts_blk % 2 ** 128 > _block:
+            return _hint
+    return self.find_block_epoch(_block, max_epoch)
+
+
+@internal
+@view
+def find_user_block_epoch_hint(addr: address, _block: uint256, max_epoch: uint256, _hint: uint256) -> uint256:
+    """
+    @notice Check that `_hint` is the epoch `find_user_block_epoch` would return
+    @dev Two storage reads when the hint is right, a binary search otherwise
+    @param addr User's wallet address
+    @param _block Block to find
+    @param max_epoch Don't go beyond this epoch
+    @param _hint Expected user epoch
+    @return Last user epoch of `addr` at or before block `_block`
+    """
+    if _hint <= max_epoch and self.packed_user_point_history[addr][_hint].ts_blk % 2 ** 128 <= _block:
+        if _hint == max_epoch or self.packed_user_point_history[addr][_hint + 1].ts_blk % 2 ** 128 > _block:
+            return _hint
+    return self.find_user_block_epoch(addr, _block, max_epoch)
+
+
+@internal
+@view
+def _balance_of(addr: address, _t: uint256) -> uint256:
+    """
+    @notice Get the voting power of `addr` at time `_t`
     @param addr User wallet address
     @param _t Epoch time to return voting power at
     @return User voting power
@@ -601,7 +881,7 @@ def balanceOf(addr: address, _t: uint256 = block.timestamp) -> uint256:
     if _epoch == 0:
         return 0
     else:
-        last_point: Point = self.user_point_history[addr][_epoch]
+        last_point: Point = self.unpack_point(self.packed_user_point_history[addr][_epoch])
         last_point.bias -= last_point.slope * convert(_t - last_point.ts, int128)
         if last_point.bias < 0:
             last_point.bias = 0
@@ -610,39 +890,55 @@ def balanceOf(addr: address, _t: uint256 = block.timestamp) -> uint256:
 
 @external
 @view
-def balanceOfAt(addr: address, _block: uint256) -> uint256:
+def balanceOf(addr: address, _t: uint256 = block.timestamp) -> uint256:
+    """
+    @notice Get the current voting power for `msg.sender`
+    @dev Adheres to the ERC20 `balanceOf` interface for Aragon compatibility
+    @param addr User wallet address
+    @param _t Epoch time to return voting power at
+    @return User voting power
+    """
+    return self._balance_of(addr, _t)
+
+
+@external
+@view
+def balancesOf(_addrs: address[MAX_BALANCE_BATCH], _t: uint256 = block.timestamp) -> uint256[MAX_BALANCE_BATCH]:
+    """
+    @notice Get the voting power of several users in one call
+    @dev The list ends at the first empty address, later entries are 0
+    @param _addrs User wallet addresses
+    @param _t Epoch time to return voting power at
+    @return Voting power of each user, in the order of `_addrs`
+    """
+    balances: uint256[MAX_BALANCE_BATCH] = empty(uint256[MAX_BALANCE_BATCH])
+    for i in range(MAX_BALANCE_BATCH):
+        if _addrs[i] == ZERO_ADDRESS:
+            break
+        balances[i] = self._balance_of(_addrs[i], _t)
+
+    return balances
+
+
+@internal
+@view
+def balance_of_at(addr: address, _block: uint256, _user_epoch: uint256, _epoch: uint256, max_epoch: uint256) -> uint256:
     """
     @notice Measure voting power of `addr` at block height `_block`
-    @dev Adheres to MiniMe `balanceOfAt` interface: https://github.com/Giveth/minime
     @param addr User's wallet address
     @param _block Block to calculate the voting power at
+    @param _user_epoch Last user epoch of `addr` at or before `_block`
+    @param _epoch Last global epoch at or before `_block`
+    @param max_epoch Current global epoch
     @return Voting power
     """
-    # Copying and pasting totalSupply code because Vyper cannot pass by
-    # reference yet
-    assert _block <= block.number
-
-    # Binary search
-    _min: uint256 = 0
-    _max: uint256 = self.user_point_epoch[addr]
-    for i in range(128):  # Will be always enough for 128-bit numbers
-        if _min >= _max:
-            break
-        _mid: uint256 = (_min + _max + 1) / 2
-        if self.user_point_history[addr][_mid].blk <= _block:
-            _min = _mid
-        else:
-            _max = _mid - 1
+    upoint: Point = self.unpack_point(self.packed_user_point_history[addr][_user_epoch])
 
-    upoint: Point = self.user_point_history[addr][_min]
-
-    max_epoch: uint256 = self.epoch
-    _epoch: uint256 = self.find_block_epoch(_block, max_epoch)
-    point_0: Point = self.point_history[_epoch]
+    point_0: Point = self.unpack_point(self.packed_point_history[_epoch])
     d_block: uint256 = 0
     d_t: uint256 = 0
     if _epoch < max_epoch:
-        point_1: Point = self.point_history[_epoch + 1]
+        point_1: Point = self.unpack_point(self.packed_point_history[_epoch + 1])
         d_block = point_1.blk - point_0.blk
         d_t = point_1.ts - point_0.ts
     else:
@@ -659,6 +955,53 @@ def balanceOfAt(addr: address, _block: uint256) -> uint256:
         return 0
 
 
+@external
+@view
+def balanceOfAt(addr: address, _block: uint256) -> uint256:
+    """
+    @notice Measure voting power of `addr` at block height `_block`
+    @dev Adheres to MiniMe `balanceOfAt` interface: https://github.com/Giveth/minime
+    @param addr User's wallet address
+    @param _block Block to calculate the voting power at
+    @return Voting power
+    """
+    assert _block <= block.number
+
+    max_epoch: uint256 = self.epoch
+    return self.balance_of_at(
+        addr,
+        _block,
+        self.find_user_block_epoch(addr, _block, self.user_point_epoch[addr]),
+        self.find_block_epoch(_block, max_epoch),
+        max_epoch
+    )
+
+
+@external
+@view
+def balanceOfAtHint(addr: address, _block: uint256, _user_epoch_hint: uint256, _global_epoch_hint: uint256) -> uint256:
+    """
+    @notice Measure voting power of `addr` at block height `_block` from known epochs
+    @dev Same result as `balanceOfAt`. Each hint is checked in constant time
+         and only searched for when it is wrong
+    @param addr User's wallet address
+    @param _block Block to calculate the voting power at
+    @param _user_epoch_hint Last user epoch of `addr` at or before `_block`
+    @param _global_epoch_hint Last global epoch at or before `_block`
+    @return Voting power
+    """
+    assert _block <= block.number
+
+    max_epoch: uint256 = self.epoch
+    return self.balance_of_at(
+        addr,
+        _block,
+        self.find_user_block_epoch_hint(addr, _block, self.user_point_epoch[addr], _user_epoch_hint),
+        self.find_block_epoch_hint(_block, max_epoch, _global_epoch_hint),
+        max_epoch
+    )
+
+
 @internal
 @view
 def supply_at(point: Point, t: uint256) -> uint256:
@@ -693,30 +1036,33 @@ def supply_at(point: Point, t: uint256) -> uint256:
 def totalSupply(t: uint256 = block.timestamp) -> uint256:
     """
     @notice Calculate total voting power
-    @dev Adheres to the ERC20 `totalSupply` interface for Aragon compatibility
+    @dev Adheres to the ERC20 `totalSupply` interface for Aragon compatibility.
+         Week boundaries before the last checkpoint are read from `week_supply`,
+         any other time is projected forward from the last checkpoint and
+         must not be before it
     @return Total voting power
     """
     _epoch: uint256 = self.epoch
-    last_point: Point = self.point_history[_epoch]
-    return self.supply_at(last_point, t)
+    packed: PackedPoint = self.packed_point_history[_epoch]
+    if t % WEEK == 0 and t < shift(packed.ts_blk, -128):
+        return self.week_supply[t]
+    return self.supply_at(self.unpack_point(packed), t)
 
 
-@external
+@internal
 @view
-def totalSupplyAt(_block: uint256) -> uint256:
+def total_supply_at(_block: uint256, target_epoch: uint256, _epoch: uint256) -> uint256:
     """
-    @notice Calculate total voting power at some point in the past
+    @notice Calculate total voting power at block height `_block`
     @param _block Block to calculate the total voting power at
+    @param target_epoch Last global epoch at or before `_block`
+    @param _epoch Current global epoch
     @return Total voting power at `_block`
     """
-    assert _block <= block.number
-    _epoch: uint256 = self.epoch
-    target_epoch: uint256 = self.find_block_epoch(_block, _epoch)
-
-    point: Point = self.point_history[target_epoch]
+    point: Point = self.unpack_point(self.packed_point_history[target_epoch])
     dt: uint256 = 0
     if target_epoch < _epoch:
-        point_next: Point = self.point_history[target_epoch + 1]
+        point_next: Point = self.unpack_point(self.packed_point_history[target_epoch + 1])
         if point.blk != point_next.blk:
             dt = (_block - point.blk) * (point_next.ts - point.ts) / (point_next.blk - point.blk)
     else:
@@ -727,6 +1073,35 @@ def totalSupplyAt(_block: uint256) -> uint256:
     return self.supply_at(point, point.ts + dt)
 
 
+@external
+@view
+def totalSupplyAt(_block: uint256) -> uint256:
+    """
+    @notice Calculate total voting power at some point in the past
+    @param _block Block to calculate the total voting power at
+    @return Total voting power at `_block`
+    """
+    assert _block <= block.number
+    _epoch: uint256 = self.epoch
+    return self.total_supply_at(_block, self.find_block_epoch(_block, _epoch), _epoch)
+
+
+@external
+@view
+def totalSupplyAtHint(_block: uint256, _epoch_hint: uint256) -> uint256:
+    """
+    @notice Calculate total voting power at some point in the past from a known epoch
+    @dev Same result as `totalSupplyAt`. The hint is checked in constant time
+         and only searched for when it is wrong
+    @param _block Block to calculate the total voting power at
+    @param _epoch_hint Last global epoch at or before `_block`
+    @return Total voting power at `_block`
+    """
+    assert _block <= block.number
+    _epoch: uint256 = self.epoch
+    return self.total_supply_at(_block, self.find_block_epoch_hint(_block, _epoch, _epoch_hint), _epoch)
+
+
 # Dummy methods for compatibility with Aragon
 
 @external
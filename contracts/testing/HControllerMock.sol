@@ -4,6 +4,7 @@ pragma solidity ^0.8.0;
 
 interface OffchainBorrowingGauge {
     function user_checkpoint(address borrower) external;
+    function sync_borrow_balance(address borrower, uint256 balance, uint256 totalSupply) external;
 }
 
 
@@ -22,6 +23,11 @@ contract HControllerMock {
     mapping(uint => mapping(address => uint256)) public totalOutboundBorrows;
     mapping(address => uint) public totalOutboundBorrowsForGauge;
     mapping(uint => mapping(address => address)) public borrowGauges;
+    bool public pushMode;
+
+    function _setPushMode(bool _pushMode) public {
+        pushMode = _pushMode;
+    }
 
     function _registerBorrowGauge(uint borrowChainId, address cToken, address gauge) public {
         require(totalOutboundBorrows[borrowChainId][cToken] == 0);
@@ -64,7 +70,7 @@ contract HControllerMock {
         address borrowGaugeForToken = borrowGauges[borrowChainId][cToken];
         if (borrowGaugeForToken != address(0)) {
             totalOutboundBorrowsForGauge[borrowGaugeForToken] += borrowAmount;
-            OffchainBorrowingGauge(borrowGaugeForToken).user_checkpoint(borrower);
+            notifyGauge(borrowGaugeForToken, borrower);
         }
     }
 
@@ -93,7 +99,19 @@ contract HControllerMock {
         address borrowGaugeForToken = borrowGauges[borrowChainId][cToken];
         if (borrowGaugeForToken != address(0)) {
             totalOutboundBorrowsForGauge[borrowGaugeForToken] -= repayAmount;
-            OffchainBorrowingGauge(borrowGaugeForToken).user_checkpoint(borrower);
+            notifyGauge(borrowGaugeForToken, borrower);
+        }
+    }
+
+    function notifyGauge(address gauge, address borrower) internal {
+        if (pushMode) {
+            OffchainBorrowingGauge(gauge).sync_borrow_balance(
+                borrower,
+                accountTotalOutboundBorrowsForGauge(gauge, borrower),
+                totalOutboundBorrowsForGauge[gauge]
+            );
+        } else {
+            OffchainBorrowingGauge(gauge).user_checkpoint(borrower);
         }
     }
 
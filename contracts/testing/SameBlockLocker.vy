@@ -0,0 +1,27 @@
+# @version 0.2.15
+"""
+@notice Reads the combined voting supply around a local lock within one transaction
+"""
+
+from vyper.interfaces import ERC20
+
+interface MirroredVotingEscrow:
+    def total_supply_write() -> uint256: nonpayable
+
+interface VotingEscrow:
+    def create_lock(_value: uint256, _unlock_time: uint256): nonpayable
+
+
+@external
+def lock_between_reads(
+    _mirrored_escrow: address,
+    _voting_escrow: address,
+    _token: address,
+    _value: uint256,
+    _unlock_time: uint256
+) -> uint256[2]:
+    before: uint256 = MirroredVotingEscrow(_mirrored_escrow).total_supply_write()
+    ERC20(_token).approve(_voting_escrow, _value)
+    VotingEscrow(_voting_escrow).create_lock(_value, _unlock_time)
+    after: uint256 = MirroredVotingEscrow(_mirrored_escrow).total_supply_write()
+    return [before, after]
@@ -24,6 +24,8 @@ event DelegationSet:
     delegation: address
 
 
+MAX_BALANCE_BATCH: constant(uint256) = 100
+
 voting_escrow: public(address)
 delegation: public(address)
 
@@ -58,6 +60,30 @@ def adjusted_balance_of(_account: address) -> uint256:
     return VeDelegation(_delegation).adjusted_balance_of(_account)
 
 
+@view
+@external
+def adjusted_balances_of(_accounts: address[MAX_BALANCE_BATCH]) -> uint256[MAX_BALANCE_BATCH]:
+    """
+    @notice Get the adjusted veCRV balances of several accounts in one call
+    @dev The list ends at the first empty address, later entries are 0
+    @param _accounts The accounts to query the adjusted veCRV balance of
+    @return veCRV balance of each account, in the order of `_accounts`
+    """
+    balances: uint256[MAX_BALANCE_BATCH] = empty(uint256[MAX_BALANCE_BATCH])
+    _delegation: address = self.delegation
+    _voting_escrow: address = self.voting_escrow
+    for i in range(MAX_BALANCE_BATCH):
+        _account: address = _accounts[i]
+        if _account == ZERO_ADDRESS:
+            break
+        if _delegation == ZERO_ADDRESS:
+            balances[i] = ERC20(_voting_escrow).balanceOf(_account)
+        else:
+            balances[i] = VeDelegation(_delegation).adjusted_balance_of(_account)
+
+    return balances
+
+
 @external
 def kill_delegation():
     """
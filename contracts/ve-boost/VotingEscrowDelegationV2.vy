@@ -90,6 +90,8 @@ struct Point:
 IDENTITY_PRECOMPILE: constant(address) = 0x0000000000000000000000000000000000000004
 MAX_PCT: constant(uint256) = 10_000
 WEEK: constant(uint256) = 86400 * 7
+MAX_SETTLE_WEEKS: constant(uint256) = 128
+MAX_BOOST_BATCH: constant(uint256) = 32
 
 voting_escrow: public(address)
 
@@ -116,6 +118,13 @@ token_of_delegator_by_index: public(HashMap[address, uint256[MAX_UINT256]])
 total_minted: public(HashMap[address, uint256])
 # address => timestamp => # of delegations expiring
 account_expiries: public(HashMap[address, HashMap[uint256, uint256]])
+# address => week number / 256 => bitmap of the weeks with delegations expiring
+expiry_weeks: public(HashMap[address, HashMap[uint256, uint256]])
+# address => timestamp => [bias uint128][slope int128] of the delegations expiring
+delegated_expiries: public(HashMap[address, HashMap[uint256, uint256]])
+# address => [bias uint128][slope int128] of the delegations expired by `settled_time`
+expired_delegated: public(HashMap[address, uint256])
+settled_time: public(HashMap[address, uint256])
 
 admin: public(address)  # Can and will be a smart contract
 future_admin: public(address)
@@ -270,6 +279,110 @@ def _mint(_to: address, _token_id: uint256):
     log Transfer(ZERO_ADDRESS, _to, _token_id)
 
 
+@pure
+@internal
+def _lowest_bit(_word: uint256) -> uint256:
+    """
+    @dev Position of the lowest set bit of a non-zero word
+    """
+    # isolate the lowest set bit, then binary search its position
+    bit: uint256 = bitwise_and(_word, MAX_UINT256 - _word + 1)
+    position: int128 = 0
+    step: int128 = 128
+    for i in range(8):
+        if shift(bit, -step) != 0:
+            bit = shift(bit, -step)
+            position += step
+        step /= 2
+    return convert(position, uint256)
+
+
+@internal
+def _toggle_expiry_week(_account: address, _expire_time: uint256):
+    week: uint256 = _expire_time / WEEK
+    self.expiry_weeks[_account][week / 256] = bitwise_xor(
+        self.expiry_weeks[_account][week / 256], shift(1, convert(week % 256, int128))
+    )
+
+
+@view
+@internal
+def _find_next_expiry(_account: address, _expire_time: uint256) -> uint256:
+    """
+    @dev First week with delegations expiring after `_expire_time`, found
+        by scanning the expiry bitmap a word (256 weeks) at a time
+    """
+    week: uint256 = _expire_time / WEEK + 1
+    index: uint256 = week / 256
+    offset: int128 = convert(week % 256, int128)
+    # drop the bits of the weeks before `week`
+    word: uint256 = shift(shift(self.expiry_weeks[_account][index], -offset), offset)
+
+    # we essentially allow for a boost token be expired for up to 6 years
+    # 10 yrs - 4 yrs (max vecRV lock time) = ~ 6 yrs
+    for i in range(3):  # at least 512 weeks, ~10 years
+        if word != 0:
+            return (index * 256 + self._lowest_bit(word)) * WEEK
+        index += 1
+        word = self.expiry_weeks[_account][index]
+
+    raise "Failed to find next expiry"
+
+
+@view
+@internal
+def _expired_delegations(_account: address) -> (uint256, uint256):
+    """
+    @dev Delegations of `_account` expired by now, and the time they are settled
+        to. The expiry weeks since the last settlement are walked on the expiry
+        bitmap MAX_SETTLE_WEEKS steps at a time, so the time can lag behind now.
+    """
+    expired: uint256 = self.expired_delegated[_account]
+    settled_time: uint256 = self.settled_time[_account]
+    current_week: uint256 = block.timestamp / WEEK
+
+    if settled_time == 0:
+        # no delegations yet
+        return 0, current_week * WEEK
+
+    week: uint256 = settled_time / WEEK + 1
+    index: uint256 = week / 256
+    offset: int128 = convert(week % 256, int128)
+    # drop the bits of the weeks already settled
+    word: uint256 = shift(shift(self.expiry_weeks[_account][index], -offset), offset)
+
+    for i in range(MAX_SETTLE_WEEKS):
+        if word == 0:
+            if (index + 1) * 256 > current_week:
+                settled_time = current_week * WEEK
+                break
+            index += 1
+            word = self.expiry_weeks[_account][index]
+            continue
+
+        week = index * 256 + self._lowest_bit(word)
+        if week > current_week:
+            settled_time = current_week * WEEK
+            break
+
+        settled_time = week * WEEK
+        expired += self.delegated_expiries[_account][settled_time]
+        # clear the lowest set bit
+        word = bitwise_and(word, word - 1)
+
+    return expired, settled_time
+
+
+@internal
+def _settle_expired(_account: address):
+    expired: uint256 = 0
+    settled_time: uint256 = 0
+    expired, settled_time = self._expired_delegations(_account)
+
+    self.expired_delegated[_account] = expired
+    self.settled_time[_account] = settled_time
+
+
 @internal
 def _mint_boost(_token_id: uint256, _delegator: address, _receiver: address, _bias: int256, _slope: int256, _cancel_time: uint256, _expire_time: uint256):
     is_whitelist: uint256 = convert(self.grey_list[_receiver][ZERO_ADDRESS], uint256)
@@ -280,6 +393,22 @@ def _mint_boost(_token_id: uint256, _delegator: address, _receiver: address, _bi
     self.boost[_delegator].delegated += data
     self.boost[_receiver].received += data
 
+    # schedule the expiry of the delegation, it can't be settled yet
+    self._settle_expired(_delegator)
+    self.delegated_expiries[_delegator][_expire_time] += data
+
+    # increase the number of expiries for the delegator
+    expiry_data: uint256 = self.boost[_delegator].expiry_data
+    next_expiry: uint256 = expiry_data % 2 ** 128
+    if next_expiry == 0 or _expire_time < next_expiry:
+        next_expiry = _expire_time
+
+    expiries: uint256 = self.account_expiries[_delegator][_expire_time]
+    if expiries == 0:
+        self._toggle_expiry_week(_delegator, _expire_time)
+    self.account_expiries[_delegator][_expire_time] = expiries + 1
+    self.boost[_delegator].expiry_data = shift(shift(expiry_data, -128) + 1, 128) + next_expiry
+
     token: Token = self.boost_tokens[_token_id]
     token.data = data
     token.dinfo = token.dinfo + _cancel_time
@@ -288,7 +417,7 @@ def _mint_boost(_token_id: uint256, _delegator: address, _receiver: address, _bi
 
 
 @internal
-def _burn_boost(_token_id: uint256, _delegator: address, _receiver: address, _bias: int256, _slope: int256):
+def _burn_boost(_token_id: uint256, _delegator: address, _receiver: address):
     token: Token = self.boost_tokens[_token_id]
     expire_time: uint256 = token.expire_time
 
@@ -297,6 +426,10 @@ def _burn_boost(_token_id: uint256, _delegator: address, _receiver: address, _bi
 
     self.boost[_delegator].delegated -= token.data
     self.boost[_receiver].received -= token.data
+    if expire_time <= self.settled_time[_delegator]:
+        self.expired_delegated[_delegator] -= token.data
+    else:
+        self.delegated_expiries[_delegator][expire_time] -= token.data
 
     token.data = 0
     # maintain the same position in the delegator array, but remove the cancel time
@@ -309,36 +442,25 @@ def _burn_boost(_token_id: uint256, _delegator: address, _receiver: address, _bi
     next_expiry: uint256 = expiry_data % 2 ** 128
     active_delegations: uint256 = shift(expiry_data, -128) - 1
 
-    expiries: uint256 = self.account_expiries[_delegator][expire_time]
-
-    if active_delegations != 0 and expire_time == next_expiry and expiries == 0:
-        # Will be passed if
-        # active_delegations == 0, no more active boost tokens
-        # or
-        # expire_time != next_expiry, the cancelled boost token isn't the next expiring boost token
-        # or
-        # expiries != 0, the cancelled boost token isn't the only one expiring at expire_time
-        for i in range(1, 513):  # ~10 years
-            # we essentially allow for a boost token be expired for up to 6 years
-            # 10 yrs - 4 yrs (max vecRV lock time) = ~ 6 yrs
-            if i == 512:
-                raise "Failed to find next expiry"
-            week_ts: uint256 = expire_time + WEEK * (i + 1)
-            if self.account_expiries[_delegator][week_ts] > 0:
-                next_expiry = week_ts
-                break
-    elif active_delegations == 0:
+    expiries: uint256 = self.account_expiries[_delegator][expire_time] - 1
+    self.account_expiries[_delegator][expire_time] = expiries
+
+    if expiries == 0:
+        self._toggle_expiry_week(_delegator, expire_time)
+
+    if active_delegations == 0:
         next_expiry = 0
+    elif expire_time == next_expiry and expiries == 0:
+        # the cancelled boost token was the only one expiring at next_expiry
+        next_expiry = self._find_next_expiry(_delegator, expire_time)
 
     self.boost[_delegator].expiry_data = shift(active_delegations, 128) + next_expiry
-    self.account_expiries[_delegator][expire_time] = expiries - 1
 
 
 @internal
-def _transfer_boost(_from: address, _to: address, _bias: int256, _slope: int256):
-    data: uint256 = shift(convert(_bias, uint256), 128) + convert(abs(_slope), uint256)
-    self.boost[_from].received -= data
-    self.boost[_to].received += data
+def _transfer_boost(_from: address, _to: address, _data: uint256):
+    self.boost[_from].received -= _data
+    self.boost[_to].received += _data
 
 
 @pure
@@ -374,17 +496,18 @@ def _transfer(_from: address, _to: address, _token_id: uint256):
     self.balanceOf[_to] += 1
     self.ownerOf[_token_id] = _to
 
-    tpoint: Point = self._deconstruct_bias_slope(self.boost_tokens[_token_id].data)
+    tdata: uint256 = self.boost_tokens[_token_id].data
+    tpoint: Point = self._deconstruct_bias_slope(tdata)
     tvalue: int256 = tpoint.slope * convert(block.timestamp, int256) + tpoint.bias
 
     # if the boost value is negative, reset the slope and bias
     if tvalue > 0:
-        self._transfer_boost(_from, _to, tpoint.bias, tpoint.slope)
+        self._transfer_boost(_from, _to, tdata)
         # y = mx + b -> y - b = mx -> (y - b)/m = x -> -b / m = x (x-intercept)
         expiry: uint256 = convert(-tpoint.bias / tpoint.slope, uint256)
         log TransferBoost(_from, _to, _token_id, convert(tvalue, uint256), expiry)
     else:
-        self._burn_boost(_token_id, delegator, _from, tpoint.bias, tpoint.slope)
+        self._burn_boost(_token_id, delegator, _from)
         log BurnBoost(delegator, _from, _token_id)
 
     log Transfer(_from, _to, _token_id)
@@ -408,7 +531,7 @@ def _cancel_boost(_token_id: uint256, _caller: address):
         else:
             # All others are disallowed
             raise "Not allowed!"
-    self._burn_boost(_token_id, delegator, receiver, tpoint.bias, tpoint.slope)
+    self._burn_boost(_token_id, delegator, receiver)
 
     log BurnBoost(delegator, receiver, _token_id)
 
@@ -419,6 +542,117 @@ def _set_delegation_status(_receiver: address, _delegator: address, _status: boo
     log GreyListUpdated(_receiver, _delegator, _status)
 
 
+@view
+@internal
+def _token_boost(_token_id: uint256) -> int256:
+    tpoint: Point = self._deconstruct_bias_slope(self.boost_tokens[_token_id].data)
+    return tpoint.slope * convert(block.timestamp, int256) + tpoint.bias
+
+
+@view
+@internal
+def _delegable_boost(_delegator: address) -> int256:
+    # delegated slope and bias
+    point: Point = self._deconstruct_bias_slope(self.boost[_delegator].delegated)
+
+    # delegated boost will be positive, if any of circulating boosts are negative
+    # the caller reverts
+    delegated_boost: int256 = point.slope * convert(block.timestamp, int256) + point.bias
+    return VotingEscrow(self.voting_escrow).balanceOf(_delegator) - delegated_boost
+
+
+@internal
+def _create_boost(
+    _delegator: address,
+    _receiver: address,
+    _percentage: int256,
+    _delegable: int256,
+    _cancel_time: uint256,
+    _expire_time: uint256,
+    _id: uint256,
+):
+    assert _percentage > 0  # dev: percentage must be greater than 0 bps
+    assert _percentage <= MAX_PCT  # dev: percentage must be less than 10_000 bps
+
+    expire_time: uint256 = (_expire_time / WEEK) * WEEK
+
+    assert _cancel_time <= expire_time  # dev: cancel time is after expiry
+    assert expire_time >= block.timestamp + WEEK  # dev: boost duration must be atleast WEEK
+    assert expire_time <= VotingEscrow(self.voting_escrow).nearest_locked__end(_delegator)  # dev: boost expiration is past voting escrow lock expiry
+    assert _id < 2 ** 96  # dev: id out of bounds
+
+    # [delegator address 160][cancel_time uint40][id uint56]
+    token_id: uint256 = shift(convert(_delegator, uint256), 96) + _id
+    # check if the token exists here before we expend more gas by minting it
+    self._mint(_receiver, token_id)
+
+    y: int256 = _percentage * _delegable / MAX_PCT
+    assert y > 0  # dev: no boost
+
+    point: Point = self._calc_bias_slope(convert(block.timestamp, int256), y, convert(expire_time, int256))
+    assert point.slope < 0  # dev: invalid slope
+
+    self._mint_boost(token_id, _delegator, _receiver, point.bias, point.slope, _cancel_time, expire_time)
+
+    log DelegateBoost(_delegator, _receiver, token_id, convert(y, uint256), _cancel_time, _expire_time)
+
+
+@internal
+def _extend_boost(
+    _token_id: uint256,
+    _delegator: address,
+    _percentage: int256,
+    _delegable: int256,
+    _expire_time: uint256,
+    _cancel_time: uint256,
+):
+    receiver: address = self.ownerOf[_token_id]
+
+    assert receiver != ZERO_ADDRESS  # dev: boost token does not exist
+    assert _percentage > 0  # dev: percentage must be greater than 0 bps
+    assert _percentage <= MAX_PCT  # dev: percentage must be less than 10_000 bps
+
+    # timestamp when delegating account's voting escrow ends - also our second point (lock_expiry, 0)
+    token: Token = self.boost_tokens[_token_id]
+
+    expire_time: uint256 = (_expire_time / WEEK) * WEEK
+
+    assert _cancel_time <= expire_time  # dev: cancel time is after expiry
+    assert expire_time >= block.timestamp + WEEK  # dev: boost duration must be atleast one day
+    assert expire_time <= VotingEscrow(self.voting_escrow).nearest_locked__end(_delegator) # dev: boost expiration is past voting escrow lock expiry
+
+    point: Point = self._deconstruct_bias_slope(token.data)
+
+    time: int256 = convert(block.timestamp, int256)
+    tvalue: int256 = point.slope * time + point.bias
+
+    # Can extend a token by increasing it's amount but not it's expiry time
+    assert expire_time >= token.expire_time  # dev: new expiration must be greater than old token expiry
+
+    # if we are extending an unexpired boost, the cancel time must the same or greater
+    # else we can adjust the cancel time to our preference
+    if _cancel_time < (token.dinfo % 2 ** 128):
+        assert block.timestamp >= token.expire_time  # dev: cancel time reduction disallowed
+
+    # storage variables have been updated: next_expiry + active_delegations
+    self._burn_boost(_token_id, _delegator, receiver)
+
+    y: int256 = _percentage * _delegable / MAX_PCT
+    # a delegator can snipe the exact moment a token expires and create a boost
+    # with 10_000 or some percentage of their boost, which is perfectly fine.
+    # this check is here so the user can't extend a boost unless they actually
+    # have any to give
+    assert y > 0  # dev: no boost
+    assert y >= tvalue  # dev: cannot reduce value of boost
+
+    point = self._calc_bias_slope(time, y, convert(expire_time, int256))
+    assert point.slope < 0  # dev: invalid slope
+
+    self._mint_boost(_token_id, _delegator, receiver, point.bias, point.slope, _cancel_time, expire_time)
+
+    log ExtendBoost(_delegator, receiver, _token_id, convert(y, uint256), expire_time, _cancel_time)
+
+
 @pure
 @internal
 def _uint_to_string(_value: uint256) -> String[78]:
@@ -541,12 +775,10 @@ def burn(_token_id: uint256):
 
     tdata: uint256 = self.boost_tokens[_token_id].data
     if tdata != 0:
-        tpoint: Point = self._deconstruct_bias_slope(tdata)
-
         delegator: address = convert(shift(_token_id, -96), address)
         owner: address = self.ownerOf[_token_id]
 
-        self._burn_boost(_token_id, delegator, owner, tpoint.bias, tpoint.slope)
+        self._burn_boost(_token_id, delegator, owner)
 
         log BurnBoost(delegator, owner, _token_id)
 
@@ -593,53 +825,52 @@ def create_boost(
     """
     assert msg.sender == _delegator or self.isApprovedForAll[_delegator][msg.sender]  # dev: only delegator or operator
 
-    expire_time: uint256 = (_expire_time / WEEK) * WEEK
-
-    expiry_data: uint256 = self.boost[_delegator].expiry_data
-    next_expiry: uint256 = expiry_data % 2 ** 128
-
-    if next_expiry == 0:
-        next_expiry = MAX_UINT256
-
-    assert block.timestamp < next_expiry  # dev: negative boost token is in circulation
-    assert _percentage > 0  # dev: percentage must be greater than 0 bps
-    assert _percentage <= MAX_PCT  # dev: percentage must be less than 10_000 bps
-    assert _cancel_time <= expire_time  # dev: cancel time is after expiry
-
-    assert expire_time >= block.timestamp + WEEK  # dev: boost duration must be atleast WEEK
-    assert expire_time <= VotingEscrow(self.voting_escrow).nearest_locked__end(_delegator)  # dev: boost expiration is past voting escrow lock expiry
-    assert _id < 2 ** 96  # dev: id out of bounds
+    next_expiry: uint256 = self.boost[_delegator].expiry_data % 2 ** 128
+    assert next_expiry == 0 or block.timestamp < next_expiry  # dev: negative boost token is in circulation
 
-    # [delegator address 160][cancel_time uint40][id uint56]
-    token_id: uint256 = shift(convert(_delegator, uint256), 96) + _id
-    # check if the token exists here before we expend more gas by minting it
-    self._mint(_receiver, token_id)
-
-    # delegated slope and bias
-    point: Point = self._deconstruct_bias_slope(self.boost[_delegator].delegated)
-
-    time: int256 = convert(block.timestamp, int256)
-
-    # delegated boost will be positive, if any of circulating boosts are negative
-    # we have already reverted
-    delegated_boost: int256 = point.slope * time + point.bias
-    y: int256 = _percentage * (VotingEscrow(self.voting_escrow).balanceOf(_delegator) - delegated_boost) / MAX_PCT
-    assert y > 0  # dev: no boost
+    self._create_boost(
+        _delegator, _receiver, _percentage, self._delegable_boost(_delegator), _cancel_time, _expire_time, _id
+    )
 
-    point = self._calc_bias_slope(time, y, convert(expire_time, int256))
-    assert point.slope < 0  # dev: invalid slope
 
-    self._mint_boost(token_id, _delegator, _receiver, point.bias, point.slope, _cancel_time, expire_time)
+@external
+def create_boosts(
+    _delegator: address,
+    _receivers: address[MAX_BOOST_BATCH],
+    _percentages: int256[MAX_BOOST_BATCH],
+    _cancel_times: uint256[MAX_BOOST_BATCH],
+    _expire_times: uint256[MAX_BOOST_BATCH],
+    _ids: uint256[MAX_BOOST_BATCH],
+):
+    """
+    @notice Create many boosts from one delegator
+    @dev The delegable boost of the delegator is read once, before any of the
+        boosts are created, and every percentage is taken of that amount. The
+        percentages can therefore add up to at most 10_000 bps. The lists end at
+        the first ZERO_ADDRESS receiver and must be padded with 0 values.
+    @param _delegator The account to delegate boost from
+    @param _receivers The accounts to receive the delegated boosts
+    @param _percentages The percentages of the delegable boost to give each receiver
+    @param _cancel_times The cancel time of each boost
+    @param _expire_times The expire time of each boost, rounded down to the nearest WEEK
+    @param _ids The token id of each boost, within the range of [0, 2 ** 96)
+    """
+    assert msg.sender == _delegator or self.isApprovedForAll[_delegator][msg.sender]  # dev: only delegator or operator
 
-    # increase the number of expiries for the user
-    if expire_time < next_expiry:
-        next_expiry = expire_time
+    next_expiry: uint256 = self.boost[_delegator].expiry_data % 2 ** 128
+    assert next_expiry == 0 or block.timestamp < next_expiry  # dev: negative boost token is in circulation
 
-    active_delegations: uint256 = shift(expiry_data, -128)
-    self.account_expiries[_delegator][expire_time] += 1
-    self.boost[_delegator].expiry_data = shift(active_delegations + 1, 128) + next_expiry
+    delegable: int256 = self._delegable_boost(_delegator)
+    total: int256 = 0
+    for i in range(MAX_BOOST_BATCH):
+        if _receivers[i] == ZERO_ADDRESS:
+            break
+        total += _percentages[i]
+        assert total <= MAX_PCT  # dev: percentage must be less than 10_000 bps
 
-    log DelegateBoost(_delegator, _receiver, token_id, convert(y, uint256), _cancel_time, _expire_time)
+        self._create_boost(
+            _delegator, _receivers[i], _percentages[i], delegable, _cancel_times[i], _expire_times[i], _ids[i]
+        )
 
 
 @external
@@ -658,73 +889,62 @@ def extend_boost(_token_id: uint256, _percentage: int256, _expire_time: uint256,
         delegator's account. This value is rounded down to the nearest WEEK.
     """
     delegator: address = convert(shift(_token_id, -96), address)
-    receiver: address = self.ownerOf[_token_id]
-
     assert msg.sender == delegator or self.isApprovedForAll[delegator][msg.sender]  # dev: only delegator or operator
-    assert receiver != ZERO_ADDRESS  # dev: boost token does not exist
-    assert _percentage > 0  # dev: percentage must be greater than 0 bps
-    assert _percentage <= MAX_PCT  # dev: percentage must be less than 10_000 bps
-
-    # timestamp when delegating account's voting escrow ends - also our second point (lock_expiry, 0)
-    token: Token = self.boost_tokens[_token_id]
-
-    expire_time: uint256 = (_expire_time / WEEK) * WEEK
-
-    assert _cancel_time <= expire_time  # dev: cancel time is after expiry
-    assert expire_time >= block.timestamp + WEEK  # dev: boost duration must be atleast one day
-    assert expire_time <= VotingEscrow(self.voting_escrow).nearest_locked__end(delegator) # dev: boost expiration is past voting escrow lock expiry
-
-    point: Point = self._deconstruct_bias_slope(token.data)
-
-    time: int256 = convert(block.timestamp, int256)
-    tvalue: int256 = point.slope * time + point.bias
-
-    # Can extend a token by increasing it's amount but not it's expiry time
-    assert expire_time >= token.expire_time  # dev: new expiration must be greater than old token expiry
-
-    # if we are extending an unexpired boost, the cancel time must the same or greater
-    # else we can adjust the cancel time to our preference
-    if _cancel_time < (token.dinfo % 2 ** 128):
-        assert block.timestamp >= token.expire_time  # dev: cancel time reduction disallowed
 
-    # storage variables have been updated: next_expiry + active_delegations
-    self._burn_boost(_token_id, delegator, receiver, point.bias, point.slope)
+    # burning the boost gives its current value back to the delegator
+    delegable: int256 = self._delegable_boost(delegator) + self._token_boost(_token_id)
+    self._extend_boost(_token_id, delegator, _percentage, delegable, _expire_time, _cancel_time)
 
-    expiry_data: uint256 = self.boost[delegator].expiry_data
-    next_expiry: uint256 = expiry_data % 2 ** 128
-
-    if next_expiry == 0:
-        next_expiry = MAX_UINT256
-
-    assert block.timestamp < next_expiry  # dev: negative outstanding boosts
-
-    # delegated slope and bias
-    point = self._deconstruct_bias_slope(self.boost[delegator].delegated)
-
-    # verify delegated boost isn't negative, else it'll inflate out vecrv balance
-    delegated_boost: int256 = point.slope * time + point.bias
-    y: int256 = _percentage * (VotingEscrow(self.voting_escrow).balanceOf(delegator) - delegated_boost) / MAX_PCT
-    # a delegator can snipe the exact moment a token expires and create a boost
-    # with 10_000 or some percentage of their boost, which is perfectly fine.
-    # this check is here so the user can't extend a boost unless they actually
-    # have any to give
-    assert y > 0  # dev: no boost
-    assert y >= tvalue  # dev: cannot reduce value of boost
+    next_expiry: uint256 = self.boost[delegator].expiry_data % 2 ** 128
+    assert next_expiry == 0 or block.timestamp < next_expiry  # dev: negative outstanding boosts
 
-    point = self._calc_bias_slope(time, y, convert(expire_time, int256))
-    assert point.slope < 0  # dev: invalid slope
 
-    self._mint_boost(_token_id, delegator, receiver, point.bias, point.slope, _cancel_time, expire_time)
+@external
+def extend_boosts(
+    _token_ids: uint256[MAX_BOOST_BATCH],
+    _percentages: int256[MAX_BOOST_BATCH],
+    _expire_times: uint256[MAX_BOOST_BATCH],
+    _cancel_times: uint256[MAX_BOOST_BATCH],
+):
+    """
+    @notice Extend many boosts of one delegator
+    @dev The delegable boost of the delegator is read once, as it will be
+        after burning every boost in the batch, and every percentage is taken
+        of that amount. The percentages can therefore add up to at most 10_000 bps.
+        The lists end at the first 0 token id and must be padded with 0 values.
+    @param _token_ids The tokens to extend, all delegated by the same account
+        and sorted in ascending order
+    @param _percentages The percentages of delegable boost to delegate
+        AFTER burning the tokens' current boosts
+    @param _expire_times The new expire time of each boost, rounded down to the nearest WEEK
+    @param _cancel_times The new cancel time of each boost
+    """
+    delegator: address = convert(shift(_token_ids[0], -96), address)
+    assert msg.sender == delegator or self.isApprovedForAll[delegator][msg.sender]  # dev: only delegator or operator
 
-    # increase the number of expiries for the user
-    if expire_time < next_expiry:
-        next_expiry = expire_time
+    # burning the boosts gives their current value back to the delegator
+    delegable: int256 = self._delegable_boost(delegator)
+    last_id: uint256 = 0
+    for token_id in _token_ids:
+        if token_id == 0:
+            break
+        assert token_id > last_id  # dev: token ids must be sorted
+        assert convert(shift(token_id, -96), address) == delegator  # dev: boosts of multiple delegators
+        delegable += self._token_boost(token_id)
+        last_id = token_id
+
+    total: int256 = 0
+    for i in range(MAX_BOOST_BATCH):
+        if _token_ids[i] == 0:
+            break
+        total += _percentages[i]
+        assert total <= MAX_PCT  # dev: percentage must be less than 10_000 bps
 
-    active_delegations: uint256 = shift(expiry_data, -128)
-    self.account_expiries[delegator][expire_time] += 1
-    self.boost[delegator].expiry_data = shift(active_delegations + 1, 128) + next_expiry
+        self._extend_boost(_token_ids[i], delegator, _percentages[i], delegable, _expire_times[i], _cancel_times[i])
 
-    log ExtendBoost(delegator, receiver, _token_id, convert(y, uint256), expire_time, _cancel_time)
+    # any expired boost left outside of the batch keeps the next expiry in the past
+    next_expiry: uint256 = self.boost[delegator].expiry_data % 2 ** 128
+    assert next_expiry == 0 or block.timestamp < next_expiry  # dev: negative outstanding boosts
 
 
 @external
@@ -758,6 +978,21 @@ def batch_cancel_boosts(_token_ids: uint256[256]):
         self._cancel_boost(_token_id, msg.sender)
 
 
+@external
+def cancel_boosts(_token_ids: uint256[MAX_BOOST_BATCH]):
+    """
+    @notice Cancel up to 32 outstanding boosts
+    @dev Same as `batch_cancel_boosts` with a shorter list, which is cheaper
+        to send when only a few boosts are cancelled at once.
+    @param _token_ids A list of 32 token ids to nullify. The list must
+        be padded with 0 values if less than 32 token ids are provided.
+    """
+    for _token_id in _token_ids:
+        if _token_id == 0:
+            break
+        self._cancel_boost(_token_id, msg.sender)
+
+
 @external
 def set_delegation_status(_receiver: address, _delegator: address, _status: bool):
     """
@@ -802,12 +1037,12 @@ def adjusted_balance_of(_account: address) -> uint256:
     @dev If boosts/delegations have a negative value, they're effective value is 0
     @param _account The account to query the adjusted balance of
     """
-    next_expiry: uint256 = self.boost[_account].expiry_data % 2 ** 128
-    if next_expiry != 0 and next_expiry < block.timestamp:
-        # if the account has a negative boost in circulation
-        # we over penalize by setting their adjusted balance to 0
-        # this is because we don't want to iterate to find the real
-        # value
+    expired_delegated: uint256 = 0
+    settled_time: uint256 = 0
+    expired_delegated, settled_time = self._expired_delegations(_account)
+    if settled_time < block.timestamp / WEEK * WEEK:
+        # too many expiry weeks to walk in a single call, until `settle_expired`
+        # catches up we over penalize by setting the adjusted balance to 0
         return 0
 
     adjusted_balance: int256 = VotingEscrow(self.voting_escrow).balanceOf(_account)
@@ -816,14 +1051,15 @@ def adjusted_balance_of(_account: address) -> uint256:
     time: int256 = convert(block.timestamp, int256)
 
     if boost.delegated != 0:
-        dpoint: Point = self._deconstruct_bias_slope(boost.delegated)
+        dpoint: Point = self._deconstruct_bias_slope(boost.delegated - expired_delegated)
+        epoint: Point = self._deconstruct_bias_slope(expired_delegated)
 
-        # we take the absolute value, since delegated boost can be negative
-        # if any outstanding negative boosts are in circulation
-        # this can inflate the vecrv balance of a user
-        # taking the absolute value has the effect that it costs
-        # a user to negatively impact another's vecrv balance
-        adjusted_balance -= abs(dpoint.slope * time + dpoint.bias)
+        # boosts which haven't expired yet are worth their value, expired boosts
+        # are negative and we take their absolute value: this can inflate the vecrv
+        # balance of a user otherwise, and has the effect that it costs a user
+        # to negatively impact another's vecrv balance
+        adjusted_balance -= dpoint.slope * time + dpoint.bias
+        adjusted_balance += epoint.slope * time + epoint.bias
 
     if boost.received != 0:
         rpoint: Point = self._deconstruct_bias_slope(boost.received)
@@ -846,6 +1082,16 @@ def adjusted_balance_of(_account: address) -> uint256:
     return convert(max(adjusted_balance, empty(int256)), uint256)
 
 
+@external
+def settle_expired(_account: address):
+    """
+    @notice Move the expired delegations of an account into its settled total
+    @dev Anyone can call this, at most MAX_SETTLE_WEEKS steps are walked per call
+    @param _account The account to settle
+    """
+    self._settle_expired(_account)
+
+
 @view
 @external
 def delegated_boost(_account: address) -> uint256:
@@ -884,9 +1130,7 @@ def token_boost(_token_id: uint256) -> int256:
         date.
     @param _token_id The token id to query
     """
-    tpoint: Point = self._deconstruct_bias_slope(self.boost_tokens[_token_id].data)
-    time: int256 = convert(block.timestamp, int256)
-    return tpoint.slope * time + tpoint.bias
+    return self._token_boost(_token_id)
 
 
 @view
@@ -0,0 +1,82 @@
+import pytest
+
+WEEK = 86400 * 7
+YEAR = 86400 * 365
+LIQUIDITY_TYPE_WEIGHT = 5 * 10 ** 17  # set up by the GaugeController conftest
+
+
+@pytest.fixture(scope="module")
+def controllers(
+    GaugeControllerV2,
+    accounts,
+    chain,
+    gauge_controller,
+    mirrored_voting_escrow,
+    voting_escrow,
+    token,
+    three_gauges,
+):
+    other = GaugeControllerV2.deploy(mirrored_voting_escrow, accounts[0], {"from": accounts[0]})
+    other.add_type(b"Liquidity", LIQUIDITY_TYPE_WEIGHT, {"from": accounts[0]})
+
+    token.mint(accounts[0], 10 ** 24)
+    token.approve(voting_escrow, 10 ** 24, {"from": accounts[0]})
+    voting_escrow.create_lock(10 ** 24, chain.time() + YEAR, {"from": accounts[0]})
+
+    for controller in (gauge_controller, other):
+        controller.add_gauge(three_gauges[0], 0, {"from": accounts[0]})
+        controller.add_gauge(three_gauges[1], 0, 10 ** 18, {"from": accounts[0]})
+        controller.vote_for_gauge_weights(three_gauges[0], 10000, {"from": accounts[0]})
+    yield gauge_controller, other
+
+
+def test_pending_weeks(accounts, chain, controllers, three_gauges):
+    paginated, _ = controllers
+    assert paginated.pending_gauge_weeks(three_gauges[0]) == 0
+    assert paginated.pending_type_weeks(0) == 0
+    assert paginated.pending_total_weeks() == 0
+
+    chain.sleep(10 * WEEK)
+    chain.mine()
+
+    assert paginated.pending_gauge_weeks(three_gauges[0]) == 10
+    assert paginated.pending_type_weeks(0) == 10
+    assert paginated.pending_total_weeks() == 10
+
+    paginated.checkpoint_gauge_weeks(three_gauges[0], 4, {"from": accounts[1]})
+    paginated.checkpoint_type_weeks(0, 3, {"from": accounts[1]})
+    paginated.checkpoint_total_weeks(2, {"from": accounts[1]})
+
+    assert paginated.pending_gauge_weeks(three_gauges[0]) == 6
+    assert paginated.pending_type_weeks(0) == 7
+    assert paginated.pending_total_weeks() == 8
+
+
+def test_paginated_matches_full_fill(accounts, chain, controllers, three_gauges):
+    paginated, full = controllers
+    chain.sleep(20 * WEEK)
+    chain.mine()
+
+    for _ in range(5):
+        for gauge in three_gauges[:2]:
+            paginated.checkpoint_gauge_weeks(gauge, 5, {"from": accounts[1]})
+        paginated.checkpoint_type_weeks(0, 5, {"from": accounts[1]})
+        paginated.checkpoint_total_weeks(5, {"from": accounts[1]})
+
+    assert paginated.pending_gauge_weeks(three_gauges[0]) == 0
+    assert paginated.pending_type_weeks(0) == 0
+    assert paginated.pending_total_weeks() == 0
+
+    for gauge in three_gauges[:2]:
+        full.checkpoint_gauge(gauge, {"from": accounts[1]})
+
+    t = chain.time() // WEEK * WEEK
+    for week in range(22):
+        assert paginated.points_total(t - week * WEEK) == full.points_total(t - week * WEEK)
+        for gauge in three_gauges[:2]:
+            assert paginated.gauge_relative_weight(
+                gauge, t - week * WEEK
+            ) == full.gauge_relative_weight(gauge, t - week * WEEK)
+
+    full.checkpoint_type_weeks(0, 100, {"from": accounts[1]})
+    assert paginated.get_weights_sum_per_type(0) == full.get_weights_sum_per_type(0)
@@ -37,3 +37,99 @@ def test_multiple(accounts, chain, gauge_controller, three_gauges):
     )
 
     assert gauge_controller.get_total_weight() == expected
+
+
+def test_total_follows_votes(accounts, chain, gauge_controller, three_gauges, voting_escrow, token):
+    gauge_controller.add_type(b"Insurance", TYPE_WEIGHTS[1], {"from": accounts[0]})
+    gauge_controller.add_gauge(three_gauges[0], 0, {"from": accounts[0]})
+    gauge_controller.add_gauge(three_gauges[1], 0, {"from": accounts[0]})
+    gauge_controller.add_gauge(three_gauges[2], 1, {"from": accounts[0]})
+    types = [0, 0, 1]
+
+    for i, weeks in enumerate((10, 30)):
+        token.mint(accounts[i], 10 ** 24)
+        token.approve(voting_escrow, 10 ** 24, {"from": accounts[i]})
+        voting_escrow.create_lock(10 ** 24, chain.time() + weeks * 86400 * 7, {"from": accounts[i]})
+    gauge_controller.vote_for_gauge_weights(three_gauges[0], 4000, {"from": accounts[0]})
+    gauge_controller.vote_for_gauge_weights(three_gauges[2], 6000, {"from": accounts[0]})
+    gauge_controller.vote_for_gauge_weights(three_gauges[1], 10000, {"from": accounts[1]})
+
+    for week in range(35):
+        chain.sleep(86400 * 7)
+        if week == 5:
+            gauge_controller.change_type_weight(1, 3 * 10 ** 18, {"from": accounts[0]})
+        for gauge in three_gauges:
+            gauge_controller.checkpoint_gauge(gauge, {"from": accounts[0]})
+
+        expected = sum(
+            gauge_controller.get_gauge_weight(gauge) * gauge_controller.get_type_weight(types[i])
+            for i, gauge in enumerate(three_gauges)
+        )
+        assert gauge_controller.get_total_weight() == expected
+        relative_weights = [gauge_controller.gauge_relative_weight(gauge) for gauge in three_gauges]
+        assert sum(relative_weights) <= 10 ** 18
+
+
+def test_revote_ending_at_type_weight_change(
+    accounts, chain, gauge_controller, three_gauges, voting_escrow, token
+):
+    WEEK = 86400 * 7
+    gauge_controller.add_gauge(three_gauges[0], 0, {"from": accounts[0]})
+
+    token.mint(accounts[0], 10 ** 24)
+    token.approve(voting_escrow, 10 ** 24, {"from": accounts[0]})
+    lock_end = (chain.time() + 3 * WEEK) // WEEK * WEEK
+    voting_escrow.create_lock(10 ** 24, lock_end, {"from": accounts[0]})
+    gauge_controller.vote_for_gauge_weights(three_gauges[0], 10000, {"from": accounts[0]})
+
+    # move into the week just before the vote ends, so that it ends at `next_time`
+    chain.sleep(lock_end - WEEK - chain.time() + 3600)
+    voting_escrow.increase_unlock_time(lock_end + 4 * WEEK, {"from": accounts[0]})
+    gauge_controller.change_type_weight(0, 4 * TYPE_WEIGHTS[0], {"from": accounts[0]})
+    gauge_controller.vote_for_gauge_weights(three_gauges[0], 10000, {"from": accounts[0]})
+
+    for _ in range(6):
+        chain.sleep(WEEK)
+        gauge_controller.checkpoint_gauge(three_gauges[0], {"from": accounts[0]})
+        gauge_weight = gauge_controller.get_gauge_weight(three_gauges[0])
+        expected = gauge_weight * gauge_controller.get_type_weight(0)
+        assert gauge_controller.get_total_weight() == expected
+
+
+def test_lowered_gauge_weight_with_votes(
+    accounts, chain, gauge_controller, three_gauges, voting_escrow, token
+):
+    gauge_controller.add_type(b"Insurance", TYPE_WEIGHTS[1], {"from": accounts[0]})
+    gauge_controller.add_gauge(three_gauges[0], 0, {"from": accounts[0]})
+    gauge_controller.add_gauge(three_gauges[1], 0, {"from": accounts[0]})
+    gauge_controller.add_gauge(three_gauges[2], 1, {"from": accounts[0]})
+    types = [0, 0, 1]
+
+    for i, weeks in enumerate((30, 20)):
+        token.mint(accounts[i], 10 ** 24)
+        token.approve(voting_escrow, 10 ** 24, {"from": accounts[i]})
+        voting_escrow.create_lock(10 ** 24, chain.time() + weeks * 86400 * 7, {"from": accounts[i]})
+    gauge_controller.vote_for_gauge_weights(three_gauges[0], 4000, {"from": accounts[0]})
+    gauge_controller.vote_for_gauge_weights(three_gauges[2], 6000, {"from": accounts[0]})
+
+    for week in range(35):
+        chain.sleep(86400 * 7)
+        if week == 2:
+            # far below what the vote still decays by, so the type sum clamps at zero
+            weight = gauge_controller.get_gauge_weight(three_gauges[0]) // 10
+            gauge_controller.change_gauge_weight(three_gauges[0], weight, {"from": accounts[0]})
+        if week == 4:
+            gauge_controller.vote_for_gauge_weights(three_gauges[2], 10000, {"from": accounts[1]})
+        for gauge in three_gauges:
+            gauge_controller.checkpoint_gauge(gauge, {"from": accounts[0]})
+
+        expected = sum(
+            gauge_controller.get_gauge_weight(gauge) * gauge_controller.get_type_weight(types[i])
+            for i, gauge in enumerate(three_gauges)
+        )
+        assert gauge_controller.get_total_weight() == expected
+        relative_weights = [gauge_controller.gauge_relative_weight(gauge) for gauge in three_gauges]
+        assert sum(relative_weights) <= 10 ** 18
+
+    assert gauge_controller.is_clamped_type(0)
+    assert not gauge_controller.is_clamped_type(1)
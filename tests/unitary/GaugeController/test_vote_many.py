@@ -0,0 +1,82 @@
+import brownie
+import pytest
+from brownie import ZERO_ADDRESS
+
+WEEK = 86400 * 7
+YEAR = 86400 * 365
+LIQUIDITY_TYPE_WEIGHT = 5 * 10 ** 17  # set up by the GaugeController conftest
+
+
+def pad(values, filler):
+    return values + [filler] * (10 - len(values))
+
+
+@pytest.fixture(scope="module")
+def controllers(
+    GaugeControllerV2, accounts, gauge_controller, mirrored_voting_escrow, three_gauges
+):
+    other = GaugeControllerV2.deploy(mirrored_voting_escrow, accounts[0], {"from": accounts[0]})
+    other.add_type(b"Liquidity", LIQUIDITY_TYPE_WEIGHT, {"from": accounts[0]})
+    for controller in (gauge_controller, other):
+        controller.add_type(b"Insurance", 2 * 10 ** 18, {"from": accounts[0]})
+        controller.add_gauge(three_gauges[0], 0, {"from": accounts[0]})
+        controller.add_gauge(three_gauges[1], 1, {"from": accounts[0]})
+        controller.add_gauge(three_gauges[2], 0, {"from": accounts[0]})
+    yield gauge_controller, other
+
+
+@pytest.fixture(scope="module", autouse=True)
+def setup(accounts, chain, voting_escrow, mirrored_voting_escrow, token):
+    mirrored_voting_escrow.set_mirror_whitelist(accounts[0], True, {"from": accounts[0]})
+
+    token.mint(accounts[0], 10 ** 24)
+    token.approve(voting_escrow, 10 ** 24, {"from": accounts[0]})
+    voting_escrow.create_lock(10 ** 24, chain.time() + YEAR, {"from": accounts[0]})
+    mirrored_voting_escrow.mirror_lock(
+        accounts[0], 250, 0, 5 * 10 ** 23, chain.time() + 2 * YEAR, {"from": accounts[0]}
+    )
+    mirrored_voting_escrow.mirror_lock(
+        accounts[0], 1, 1, 3 * 10 ** 23, chain.time() + YEAR // 2, {"from": accounts[0]}
+    )
+
+
+def test_many_matches_single_votes(accounts, chain, controllers, three_gauges):
+    many, single = controllers
+    weights = [5000, 1500, 3500]
+
+    many.vote_for_many_gauge_weights(
+        pad(list(three_gauges), ZERO_ADDRESS), pad(weights, 0), {"from": accounts[0]}
+    )
+    for gauge, weight in zip(three_gauges, weights):
+        single.vote_for_gauge_weights(gauge, weight, {"from": accounts[0]})
+
+    for chain_id, escrow_id in ((0, 0), (250, 0), (1, 1)):
+        assert many.vote_user_power(accounts[0], chain_id, escrow_id) == 10000
+    assert many.get_total_weight() == single.get_total_weight()
+    for gauge in three_gauges:
+        assert many.get_gauge_weight(gauge) == single.get_gauge_weight(gauge)
+
+    for _ in range(3):
+        chain.sleep(WEEK)
+        for controller in controllers:
+            controller.checkpoint({"from": accounts[0]})
+        for gauge in three_gauges:
+            assert many.gauge_relative_weight(gauge) == single.gauge_relative_weight(gauge)
+
+
+def test_many_logs_every_gauge(accounts, controllers, three_gauges):
+    many, _ = controllers
+    tx = many.vote_for_many_gauge_weights(
+        pad(list(three_gauges[:2]), ZERO_ADDRESS), pad([4000, 6000], 0), {"from": accounts[0]}
+    )
+
+    assert [e["gauge_addr"] for e in tx.events["VoteForGauge"]] == list(three_gauges[:2])
+    assert many.vote_user_power(accounts[0], 250, 0) == 10000
+
+
+def test_many_over_power(accounts, controllers, three_gauges):
+    many, _ = controllers
+    with brownie.reverts("Used too much power"):
+        many.vote_for_many_gauge_weights(
+            pad(list(three_gauges[:2]), ZERO_ADDRESS), pad([6000, 6000], 0), {"from": accounts[0]}
+        )
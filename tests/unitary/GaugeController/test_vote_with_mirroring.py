@@ -1,5 +1,6 @@
 import brownie
 import pytest
+from brownie import ZERO_ADDRESS
 
 YEAR = 86400 * 365
 
@@ -85,3 +86,40 @@ def test_over_weight_adjust_existing(chain, accounts, gauge_controller, three_ga
     chain.sleep(10 * 86400)
     with brownie.reverts("Used too much power"):
         gauge_controller.vote_for_gauge_weights(three_gauges[0], 8000, {"from": accounts[0]})
+
+
+def test_vote_skips_chains_without_lock(
+    accounts, chain, gauge_controller, three_gauges, mirrored_voting_escrow
+):
+    # other users spread the mirror topology, accounts[0] only holds the chain 250 lock
+    for chain_id in (1, 10, 137):
+        mirrored_voting_escrow.mirror_lock(
+            accounts[1], chain_id, 3, 10 ** 21, chain.time() + YEAR, {"from": accounts[0]}
+        )
+
+    gauge_controller.vote_for_gauge_weights(three_gauges[0], 10000, {"from": accounts[0]})
+
+    assert gauge_controller.vote_user_power(accounts[0], 250, 0) == 10000
+    assert gauge_controller.vote_user_power(accounts[0], 1, 3) == 0
+    assert gauge_controller.vote_user_power_for_gauge(accounts[0], three_gauges[0]) == 10000
+
+
+def test_vote_too_many_locks(
+    accounts, chain, gauge_controller, three_gauges, mirrored_voting_escrow
+):
+    end = chain.time() + YEAR
+    for first in range(0, 501, 32):
+        ids = list(range(first, min(first + 32, 501)))
+        pad = 32 - len(ids)
+        mirrored_voting_escrow.mirror_locks(
+            [accounts[1]] * len(ids) + [ZERO_ADDRESS] * pad,
+            [250] * 32,
+            ids + [0] * pad,
+            [10 ** 18] * 32,
+            [end] * 32,
+            {"from": accounts[0]},
+        )
+    assert mirrored_voting_escrow.mirrored_user_lock_count(accounts[1]) == 501
+
+    with brownie.reverts("dev: too many mirrored locks"):
+        gauge_controller.vote_for_gauge_weights(three_gauges[0], 10000, {"from": accounts[1]})
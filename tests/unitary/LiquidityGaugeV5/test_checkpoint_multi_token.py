@@ -0,0 +1,86 @@
+import pytest
+
+WEEK = 7 * 86400
+REWARD = 10 * 10 ** 18
+
+
+@pytest.fixture(scope="module", autouse=True)
+def setup(
+    accounts,
+    chain,
+    gauge_controller,
+    gauge_v5,
+    minter,
+    token2,
+    treasury,
+    reward_policy_maker,
+    mock_lp_token,
+):
+    gauge_controller.add_type(b"Liquidity", 10 ** 18, {"from": accounts[0]})
+    gauge_controller.add_gauge(gauge_v5, 0, 10 ** 18, {"from": accounts[0]})
+
+    minter.add_token(token2, {"from": accounts[0]})
+    token2.mint(treasury, 100_000_000 * 10 ** 18, {"from": accounts[0]})
+    reward_policy_maker.set_rewards_starting_at(
+        reward_policy_maker.current_epoch() + 1, token2, [REWARD] * 10
+    )
+
+    mock_lp_token.approve(gauge_v5, 2 ** 256 - 1, {"from": accounts[0]})
+
+
+def expected_inv_supply(
+    gauge_controller, gauge, reward_policy_maker, token, t0, t1, working_supply
+):
+    inv_supply = 0
+    prev = t0
+    while prev < t1:
+        epoch = reward_policy_maker.epoch_at(prev)
+        week_time = min(reward_policy_maker.epoch_start_time(epoch + 1), t1)
+        w = gauge_controller.gauge_relative_weight(gauge, prev // WEEK * WEEK)
+        inv_supply += (
+            reward_policy_maker.rate_at(prev, token) * w * (week_time - prev) // working_supply
+        )
+        prev = week_time
+    return inv_supply
+
+
+def test_all_tokens_follow_the_week_walk(
+    accounts, chain, gauge_controller, gauge_v5, reward_policy_maker, token, token2
+):
+    gauge_v5.deposit(10 ** 21, {"from": accounts[0]})
+    t0 = gauge_v5.period_timestamp(gauge_v5.period())
+    working_supply = gauge_v5.working_supply()
+
+    chain.sleep(3 * WEEK + 12345)
+    tx = gauge_v5.user_checkpoint(accounts[0], {"from": accounts[0]})
+    t1 = tx.timestamp
+    period = gauge_v5.period()
+
+    for coin in (token, token2):
+        expected = expected_inv_supply(
+            gauge_controller, gauge_v5, reward_policy_maker, coin, t0, t1, working_supply
+        )
+        assert expected > 0
+        assert (
+            gauge_v5.integrate_inv_supply(coin, period)
+            - gauge_v5.integrate_inv_supply(coin, period - 1)
+            == expected
+        )
+        assert gauge_v5.integrate_inv_supply_of(coin, accounts[0]) == gauge_v5.integrate_inv_supply(
+            coin, period
+        )
+        assert (
+            gauge_v5.integrate_fraction(coin, accounts[0])
+            == working_supply * gauge_v5.integrate_inv_supply(coin, period) // 10 ** 18
+        )
+
+
+def test_empty_gauge_keeps_integrals(accounts, chain, gauge_v5, token, token2):
+    gauge_v5.user_checkpoint(accounts[0], {"from": accounts[0]})
+    chain.sleep(2 * WEEK)
+    gauge_v5.user_checkpoint(accounts[0], {"from": accounts[0]})
+
+    period = gauge_v5.period()
+    for coin in (token, token2):
+        assert gauge_v5.integrate_inv_supply(coin, period) == 0
+        assert gauge_v5.integrate_fraction(coin, accounts[0]) == 0
@@ -0,0 +1,71 @@
+import pytest
+from brownie import ZERO_ADDRESS
+
+WEEK = 7 * 86400
+BATCH = 32
+
+
+@pytest.fixture(scope="module", autouse=True)
+def setup(
+    accounts,
+    gauge_controller,
+    gauge_v5,
+    minter,
+    token2,
+    treasury,
+    reward_policy_maker,
+    mock_lp_token,
+):
+    gauge_controller.add_type(b"Liquidity", 10 ** 18, {"from": accounts[0]})
+    gauge_controller.add_gauge(gauge_v5, 0, 10 ** 18, {"from": accounts[0]})
+
+    minter.add_token(token2, {"from": accounts[0]})
+    token2.mint(treasury, 100_000_000 * 10 ** 18, {"from": accounts[0]})
+    reward_policy_maker.set_rewards_starting_at(
+        reward_policy_maker.current_epoch() + 1, token2, [10 ** 19] * 10
+    )
+
+    for i, acct in enumerate(accounts[:3]):
+        if i:
+            mock_lp_token.transfer(acct, 10 ** 21, {"from": accounts[0]})
+        mock_lp_token.approve(gauge_v5, 2 ** 256 - 1, {"from": acct})
+        gauge_v5.deposit(10 ** 20 * (i + 1), {"from": acct})
+
+
+def test_matches_claimable_tokens(accounts, chain, gauge_controller, gauge_v5, token, token2):
+    chain.sleep(3 * WEEK + 1234)
+    gauge_controller.checkpoint_gauge(gauge_v5, {"from": accounts[0]})
+
+    period = gauge_v5.period()
+    for acct in accounts[:3]:
+        amounts = gauge_v5.claimable_amounts(acct)
+        assert amounts[0] > 0
+        assert amounts[:2] == [
+            gauge_v5.claimable_tokens.call(acct, coin) for coin in (token, token2)
+        ]
+        assert amounts[2:] == [0] * 8
+    assert gauge_v5.period() == period
+
+
+def test_after_mint(accounts, chain, gauge_controller, gauge_v5, minter, token, token2):
+    chain.sleep(2 * WEEK)
+    minter.mint(gauge_v5, {"from": accounts[1]})
+    chain.sleep(WEEK)
+    gauge_controller.checkpoint_gauge(gauge_v5, {"from": accounts[0]})
+
+    amounts = gauge_v5.claimable_amounts(accounts[1])
+    assert amounts[:2] == [
+        gauge_v5.claimable_tokens.call(accounts[1], coin) for coin in (token, token2)
+    ]
+
+
+def test_claimable_amounts_many(accounts, chain, gauge_controller, gauge_v5):
+    chain.sleep(2 * WEEK)
+    gauge_controller.checkpoint_gauge(gauge_v5, {"from": accounts[0]})
+    users = list(accounts[:4])
+
+    amounts = gauge_v5.claimable_amounts_many(users + [ZERO_ADDRESS] * (BATCH - len(users)))
+
+    assert amounts[:4] == [gauge_v5.claimable_amounts(acct) for acct in users]
+    assert amounts[3] == [0] * 10
+    assert amounts[4:] == [[0] * 10] * (BATCH - 4)
@@ -0,0 +1,105 @@
+from brownie import ZERO_ADDRESS
+
+MAX_UINT256 = 2 ** 256 - 1
+WEEK = 7 * 86400
+BATCH = 32
+
+
+def pad(values):
+    return values + [ZERO_ADDRESS] * (BATCH - len(values))
+
+
+def setup_users(chain, accounts, gauge_v5, voting_escrow, token, mock_lp_token):
+    users = accounts[:3]
+    chain.sleep(2 * WEEK + 5)
+    for i, acct in enumerate(users):
+        token.mint(acct, 10 ** 24)
+        token.approve(voting_escrow, MAX_UINT256, {"from": acct})
+        unlock_time = chain.time() + (4 + 10 * (i // 2)) * WEEK
+        voting_escrow.create_lock(10 ** 20, unlock_time, {"from": acct})
+
+        if acct != accounts[0]:
+            mock_lp_token.transfer(acct, 10 ** 21, {"from": accounts[0]})
+        mock_lp_token.approve(gauge_v5, MAX_UINT256, {"from": acct})
+        gauge_v5.deposit(10 ** 21, {"from": acct})
+
+    return users
+
+
+def test_kick_many(chain, accounts, gauge_v5, voting_escrow, token, mock_lp_token):
+    alice, bob, charlie = setup_users(
+        chain, accounts, gauge_v5, voting_escrow, token, mock_lp_token
+    )
+    chain.sleep(5 * WEEK)
+
+    period = gauge_v5.period()
+    gauge_v5.kick_many(pad([alice, bob, charlie]), {"from": accounts[3]})
+
+    # charlie's lock has not expired, so he is skipped
+    assert gauge_v5.working_balances(alice) == 4 * 10 ** 20
+    assert gauge_v5.working_balances(bob) == 4 * 10 ** 20
+    assert gauge_v5.working_balances(charlie) == 10 ** 21
+    assert gauge_v5.period() == period + 1
+
+    t = chain[-1].timestamp
+    assert gauge_v5.integrate_checkpoint_of(alice) == t
+    assert gauge_v5.integrate_checkpoint_of(charlie) < t
+
+
+def test_kick_many_matches_kick(
+    chain, accounts, gauge_controller, gauge_v5, voting_escrow, token, mock_lp_token
+):
+    gauge_controller.add_type(b"Liquidity", 10 ** 18, {"from": accounts[0]})
+    gauge_controller.add_gauge(gauge_v5, 0, 10 ** 18, {"from": accounts[0]})
+    alice, bob, _ = setup_users(chain, accounts, gauge_v5, voting_escrow, token, mock_lp_token)
+    chain.sleep(5 * WEEK)
+    chain.mine()
+    snapshot_time = chain.time()
+
+    gauge_v5.kick(alice, {"from": accounts[3]})
+    gauge_v5.kick(bob, {"from": accounts[3]})
+    hnd = gauge_v5.tokens(0)
+    expected = [gauge_v5.integrate_fraction(hnd, acct) for acct in (alice, bob)]
+    chain.undo(2)
+
+    chain.mine(timestamp=snapshot_time)
+    gauge_v5.kick_many(pad([alice, bob]), {"from": accounts[3]})
+    assert expected[0] > 0
+    assert [gauge_v5.integrate_fraction(hnd, acct) for acct in (alice, bob)] == expected
+
+
+def test_checkpoint_many(chain, accounts, gauge_v5, voting_escrow, token, mock_lp_token):
+    setup_users(chain, accounts, gauge_v5, voting_escrow, token, mock_lp_token)
+    chain.sleep(WEEK)
+
+    period = gauge_v5.period()
+    gauge_v5.checkpoint_many(pad([accounts[1], accounts[1]]), {"from": accounts[1]})
+
+    assert gauge_v5.period() == period + 1
+    assert gauge_v5.integrate_checkpoint_of(accounts[1]) == chain[-1].timestamp
+
+
+def test_checkpoint_many_others_keeps_kick(
+    chain, accounts, gauge_v5, voting_escrow, token, mock_lp_token
+):
+    alice, bob, charlie = setup_users(
+        chain, accounts, gauge_v5, voting_escrow, token, mock_lp_token
+    )
+    chain.sleep(5 * WEEK)
+    t_last = [gauge_v5.integrate_checkpoint_of(acct) for acct in (alice, bob, charlie)]
+
+    gauge_v5.checkpoint_many(pad([alice, bob, charlie]), {"from": accounts[3]})
+
+    # integrals move for everyone, working balances and kick eligibility are left alone
+    hnd = gauge_v5.tokens(0)
+    inv_supply = gauge_v5.integrate_inv_supply(hnd, gauge_v5.period())
+    for acct in (alice, bob, charlie):
+        assert gauge_v5.integrate_inv_supply_of(hnd, acct) == inv_supply
+        assert gauge_v5.working_balances(acct) == 10 ** 21
+    assert [gauge_v5.integrate_checkpoint_of(acct) for acct in (alice, bob, charlie)] == t_last
+
+    # alice's and bob's locks have expired, they can still be kicked
+    tx = gauge_v5.kick_many(pad([alice, bob, charlie]), {"from": accounts[3]})
+    assert gauge_v5.working_balances(alice) == 4 * 10 ** 20
+    assert gauge_v5.working_balances(bob) == 4 * 10 ** 20
+    assert gauge_v5.integrate_checkpoint_of(alice) == tx.timestamp
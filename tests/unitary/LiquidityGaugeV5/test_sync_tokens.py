@@ -0,0 +1,38 @@
+def test_copied_on_deploy(gauge_v5, minter, reward_policy_maker, token):
+    assert gauge_v5.token_count() == 1
+    assert gauge_v5.tokens(0) == token
+    assert gauge_v5.first_epoch_time() == reward_policy_maker.first_epoch_time()
+    assert gauge_v5.epoch_length() == reward_policy_maker.epoch_length()
+
+
+def test_add_token_does_not_call_gauges(accounts, gauge_controller, minter, token2):
+    # a controller gauge without `sync_tokens` must not block new tokens
+    gauge_controller.add_type(b"Liquidity", 10 ** 18, {"from": accounts[0]})
+    gauge_controller.add_gauge(accounts[5], 0, 10 ** 18, {"from": accounts[0]})
+
+    minter.add_token(token2, {"from": accounts[0]})
+
+    assert minter.token_count() == 2
+    assert minter.tokens(1) == token2
+
+
+def test_checkpoint_syncs_tokens(accounts, three_gauges, minter, token, token2):
+    minter.add_token(token2, {"from": accounts[0]})
+    assert three_gauges[0].token_count() == 1
+
+    three_gauges[0].user_checkpoint(accounts[1], {"from": accounts[1]})
+
+    assert three_gauges[0].token_count() == 2
+    assert three_gauges[0].tokens(0) == token
+    assert three_gauges[0].tokens(1) == token2
+
+
+def test_sync_on_demand(accounts, three_gauges, minter, token, token2):
+    minter.add_token(token2, {"from": accounts[0]})
+    assert three_gauges[1].token_count() == 1
+
+    three_gauges[1].sync_tokens({"from": accounts[1]})
+
+    assert three_gauges[1].token_count() == 2
+    assert three_gauges[1].tokens(0) == token
+    assert three_gauges[1].tokens(1) == token2
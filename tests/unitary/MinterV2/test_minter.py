@@ -180,3 +180,73 @@ def test_mint_with_two_reward_tokens(accounts, chain, three_gauges, minter, toke
     assert minter.minted(accounts[1], three_gauges[0], token2) == balance2
 
 
+def pad_gauges(gauges):
+    return list(gauges) + [brownie.ZERO_ADDRESS] * (32 - len(gauges))
+
+
+def test_mint_gauges(accounts, chain, three_gauges, minter, token):
+    for i in range(3):
+        three_gauges[i].deposit((i + 1) * 10 ** 17, {"from": accounts[1]})
+
+    chain.sleep(MONTH)
+    tx = minter.mint_gauges(pad_gauges(three_gauges), {"from": accounts[1]})
+
+    total_minted = 0
+    for gauge in three_gauges:
+        minted = minter.minted(accounts[1], gauge, token)
+        assert minted == gauge.integrate_fraction(token, accounts[1])
+        total_minted += minted
+
+    assert total_minted > 0
+    assert token.balanceOf(accounts[1]) == total_minted
+    assert len(tx.events["Minted"]) == 3
+    assert len(tx.events["Transfer"]) == 1
+
+
+def test_mint_gauges_with_two_reward_tokens(
+    accounts, chain, three_gauges, minter, token, token2, reward_policy_maker, treasury
+):
+    minter.add_token(token2)
+    token2.mint(treasury, 100_000_000 * 10 ** 18, {"from": accounts[0]})
+    reward_policy_maker.set_rewards_starting_at(
+        reward_policy_maker.current_epoch() + 1, token2, [10 ** 19] * 10
+    )
+
+    for i in range(2):
+        three_gauges[i].deposit(5 * 10 ** 17, {"from": accounts[1]})
+
+    chain.sleep(MONTH)
+    tx = minter.mint_gauges(pad_gauges(three_gauges[:2]), {"from": accounts[1]})
+
+    for coin in (token, token2):
+        expected = sum(gauge.integrate_fraction(coin, accounts[1]) for gauge in three_gauges[:2])
+        assert expected > 0
+        assert coin.balanceOf(accounts[1]) == expected
+    assert len(tx.events["Transfer"]) == 2
+
+
+def test_mint_gauges_repeated_gauge(accounts, chain, three_gauges, minter, token):
+    three_gauges[0].deposit(1e18, {"from": accounts[1]})
+
+    chain.sleep(MONTH)
+    minter.mint_gauges(pad_gauges([three_gauges[0], three_gauges[0]]), {"from": accounts[1]})
+
+    expected = three_gauges[0].integrate_fraction(token, accounts[1])
+    assert token.balanceOf(accounts[1]) == expected
+    assert minter.minted(accounts[1], three_gauges[0], token) == expected
+
+
+def test_mint_gauges_stops_at_empty_address(accounts, chain, three_gauges, minter, token):
+    three_gauges[1].deposit(1e18, {"from": accounts[1]})
+
+    chain.sleep(MONTH)
+    gauges = pad_gauges([three_gauges[0], brownie.ZERO_ADDRESS, three_gauges[1]])
+    minter.mint_gauges(gauges, {"from": accounts[1]})
+
+    assert token.balanceOf(accounts[1]) == 0
+    assert minter.minted(accounts[1], three_gauges[1], token) == 0
+
+
+def test_mint_gauges_not_a_gauge(accounts, three_gauges, minter):
+    with brownie.reverts("dev: gauge is not added"):
+        minter.mint_gauges(pad_gauges([three_gauges[0], accounts[1]]), {"from": accounts[0]})
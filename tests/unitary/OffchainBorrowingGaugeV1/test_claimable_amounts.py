@@ -0,0 +1,25 @@
+from brownie import ZERO_ADDRESS
+
+WEEK = 7 * 86400
+BATCH = 32
+
+
+def test_claimable_amounts(
+    accounts, chain, gauge_controller, ocb_gauge_v1, mock_hcontroller, token
+):
+    gauge_controller.add_type(b"Borrowing", 10 ** 18, {"from": accounts[0]})
+    gauge_controller.add_gauge(ocb_gauge_v1, 0, 10 ** 18, {"from": accounts[0]})
+    mock_hcontroller._registerBorrowGauge(1, token, ocb_gauge_v1)
+    for i, acct in enumerate(accounts[:2]):
+        mock_hcontroller.increaseBorrowPosition(1, acct, token, 10 ** 21 * (i + 1))
+
+    chain.sleep(2 * WEEK + 123)
+    gauge_controller.checkpoint_gauge(ocb_gauge_v1, {"from": accounts[0]})
+    users = list(accounts[:2])
+
+    amounts = ocb_gauge_v1.claimable_amounts_many(users + [ZERO_ADDRESS] * (BATCH - len(users)))
+
+    for acct, claimable in zip(users, amounts):
+        assert claimable[0] > 0
+        assert claimable == ocb_gauge_v1.claimable_amounts(acct)
+        assert claimable[0] == ocb_gauge_v1.claimable_tokens.call(acct, token)
@@ -0,0 +1,76 @@
+from brownie import ZERO_ADDRESS
+
+MAX_UINT256 = 2 ** 256 - 1
+WEEK = 7 * 86400
+BATCH = 32
+
+
+def pad(values):
+    return values + [ZERO_ADDRESS] * (BATCH - len(values))
+
+
+def test_kick_many(chain, accounts, ocb_gauge_v1, mock_hcontroller, voting_escrow, token):
+    users = accounts[:3]
+    chain.sleep(2 * WEEK + 5)
+
+    mock_hcontroller._registerBorrowGauge(1, token, ocb_gauge_v1)
+    for i, acct in enumerate(users):
+        token.mint(acct, 10 ** 24)
+        token.approve(voting_escrow, MAX_UINT256, {"from": acct})
+        unlock_time = chain.time() + (4 + 10 * (i // 2)) * WEEK
+        voting_escrow.create_lock(10 ** 20, unlock_time, {"from": acct})
+        mock_hcontroller.increaseBorrowPosition(1, acct, token, 10 ** 21, {"from": acct})
+
+    chain.sleep(5 * WEEK)
+
+    period = ocb_gauge_v1.period()
+    ocb_gauge_v1.kick_many(pad(users), {"from": accounts[3]})
+
+    assert ocb_gauge_v1.working_balances(users[0]) == 4 * 10 ** 20
+    assert ocb_gauge_v1.working_balances(users[1]) == 4 * 10 ** 20
+    assert ocb_gauge_v1.working_balances(users[2]) == 10 ** 21
+    assert ocb_gauge_v1.period() == period + 1
+
+
+def test_checkpoint_many(chain, accounts, ocb_gauge_v1):
+    period = ocb_gauge_v1.period()
+    chain.sleep(WEEK)
+
+    ocb_gauge_v1.checkpoint_many(pad([accounts[1]]), {"from": accounts[1]})
+
+    assert ocb_gauge_v1.period() == period + 1
+    assert ocb_gauge_v1.integrate_checkpoint_of(accounts[1]) == chain[-1].timestamp
+
+
+def test_checkpoint_many_others_keeps_kick(
+    chain, accounts, ocb_gauge_v1, mock_hcontroller, voting_escrow, token
+):
+    alice, bob, charlie = accounts[:3]
+    chain.sleep(2 * WEEK + 5)
+
+    mock_hcontroller._registerBorrowGauge(1, token, ocb_gauge_v1)
+    for i, acct in enumerate((alice, bob, charlie)):
+        token.mint(acct, 10 ** 24)
+        token.approve(voting_escrow, MAX_UINT256, {"from": acct})
+        unlock_time = chain.time() + (4 + 10 * (i // 2)) * WEEK
+        voting_escrow.create_lock(10 ** 20, unlock_time, {"from": acct})
+        mock_hcontroller.increaseBorrowPosition(1, acct, token, 10 ** 21, {"from": acct})
+
+    chain.sleep(5 * WEEK)
+    t_last = [ocb_gauge_v1.integrate_checkpoint_of(acct) for acct in (alice, bob, charlie)]
+
+    ocb_gauge_v1.checkpoint_many(pad([alice, bob, charlie]), {"from": accounts[3]})
+
+    # integrals move for everyone, working balances and kick eligibility are left alone
+    hnd = ocb_gauge_v1.tokens(0)
+    inv_supply = ocb_gauge_v1.integrate_inv_supply(hnd, ocb_gauge_v1.period())
+    for acct in (alice, bob, charlie):
+        assert ocb_gauge_v1.integrate_inv_supply_of(hnd, acct) == inv_supply
+        assert ocb_gauge_v1.working_balances(acct) == 10 ** 21
+    assert [ocb_gauge_v1.integrate_checkpoint_of(acct) for acct in (alice, bob, charlie)] == t_last
+
+    # alice's and bob's locks have expired, they can still be kicked
+    tx = ocb_gauge_v1.kick_many(pad([alice, bob, charlie]), {"from": accounts[3]})
+    assert ocb_gauge_v1.working_balances(alice) == 4 * 10 ** 20
+    assert ocb_gauge_v1.working_balances(bob) == 4 * 10 ** 20
+    assert ocb_gauge_v1.integrate_checkpoint_of(alice) == tx.timestamp
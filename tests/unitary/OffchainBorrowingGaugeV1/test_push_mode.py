@@ -0,0 +1,91 @@
+import brownie
+import pytest
+
+WEEK = 7 * 86400
+
+
+@pytest.fixture(autouse=True)
+def setup(accounts, ocb_gauge_v1, mock_hcontroller, token, token2):
+    mock_hcontroller._registerBorrowGauge(1, token, ocb_gauge_v1)
+    mock_hcontroller._registerBorrowGauge(1, token2, ocb_gauge_v1)
+    mock_hcontroller._setPushMode(True)
+    ocb_gauge_v1.set_push_mode(True, {"from": accounts[0]})
+
+
+def test_balances_follow_pushes(accounts, ocb_gauge_v1, mock_hcontroller, token, token2):
+    mock_hcontroller.increaseBorrowPosition(1, accounts[1], token, 10 ** 23)
+    mock_hcontroller.increaseBorrowPosition(1, accounts[1], token2, 10 ** 23)
+    mock_hcontroller.increaseBorrowPosition(1, accounts[2], token, 10 ** 22)
+    mock_hcontroller.reduceBorrowPosition(1, accounts[1], token, 5 * 10 ** 22)
+
+    for acct in accounts[1:3]:
+        assert ocb_gauge_v1.balanceOf(acct) == mock_hcontroller.accountTotalOutboundBorrowsForGauge(
+            ocb_gauge_v1, acct
+        )
+        assert ocb_gauge_v1.working_balances(acct) == ocb_gauge_v1.balanceOf(acct) * 40 // 100
+    assert ocb_gauge_v1.balanceOf(accounts[1]) == 15 * 10 ** 22
+    assert ocb_gauge_v1.totalSupply() == mock_hcontroller.totalOutboundBorrowsForGauge(ocb_gauge_v1)
+    assert ocb_gauge_v1.working_supply() == 16 * 10 ** 22 * 40 // 100
+
+
+def test_push_advances_period(chain, accounts, ocb_gauge_v1, mock_hcontroller, token):
+    chain.sleep(WEEK)
+    period = ocb_gauge_v1.period()
+
+    tx = mock_hcontroller.increaseBorrowPosition(1, accounts[1], token, 10 ** 23)
+
+    assert ocb_gauge_v1.period() == period + 1
+    assert ocb_gauge_v1.integrate_checkpoint_of(accounts[1]) == tx.timestamp
+
+
+def test_sync_only_hcontroller(accounts, ocb_gauge_v1):
+    with brownie.reverts("dev: unauthorized"):
+        ocb_gauge_v1.sync_borrow_balance(accounts[1], 10 ** 23, 10 ** 23, {"from": accounts[1]})
+
+
+def test_sync_requires_push_mode(accounts, ocb_gauge_v1, mock_hcontroller, token):
+    ocb_gauge_v1.set_push_mode(False, {"from": accounts[0]})
+
+    with brownie.reverts("dev: push mode disabled"):
+        mock_hcontroller.increaseBorrowPosition(1, accounts[1], token, 10 ** 23)
+
+
+def test_set_push_mode_admin_only(accounts, ocb_gauge_v1):
+    with brownie.reverts("dev: admin only"):
+        ocb_gauge_v1.set_push_mode(False, {"from": accounts[1]})
+
+
+def test_set_push_mode_gauge_in_use(accounts, ocb_gauge_v1, mock_hcontroller, token):
+    mock_hcontroller.increaseBorrowPosition(1, accounts[1], token, 10 ** 23)
+
+    with brownie.reverts("dev: gauge in use"):
+        ocb_gauge_v1.set_push_mode(False, {"from": accounts[0]})
+
+
+def test_switch_resets_pushed_balances(accounts, ocb_gauge_v1, mock_hcontroller, token):
+    # a borrow the gauge is not told about, only counted in the pushed total
+    mock_hcontroller._setPushMode(False)
+    mock_hcontroller.increaseBorrowPosition(1, accounts[2], token, 5 * 10 ** 22)
+    mock_hcontroller._setPushMode(True)
+    mock_hcontroller.increaseBorrowPosition(1, accounts[1], token, 10 ** 23)
+    mock_hcontroller.reduceBorrowPosition(1, accounts[1], token, 10 ** 23)
+    assert ocb_gauge_v1.working_supply() == 0
+    assert ocb_gauge_v1.totalSupply() == 5 * 10 ** 22
+
+    ocb_gauge_v1.set_push_mode(False, {"from": accounts[0]})
+    mock_hcontroller._setPushMode(False)
+    mock_hcontroller.increaseBorrowPosition(1, accounts[1], token, 2 * 10 ** 22)
+    assert ocb_gauge_v1.balanceOf(accounts[1]) == 2 * 10 ** 22
+    assert ocb_gauge_v1.totalSupply() == 7 * 10 ** 22
+    mock_hcontroller.reduceBorrowPosition(1, accounts[1], token, 2 * 10 ** 22)
+    mock_hcontroller.reduceBorrowPosition(1, accounts[2], token, 5 * 10 ** 22)
+
+    ocb_gauge_v1.set_push_mode(True, {"from": accounts[0]})
+    mock_hcontroller._setPushMode(True)
+    assert ocb_gauge_v1.totalSupply() == 0
+
+    # the next push seeds the balances again
+    mock_hcontroller.increaseBorrowPosition(1, accounts[1], token, 10 ** 22)
+    assert ocb_gauge_v1.balanceOf(accounts[1]) == 10 ** 22
+    assert ocb_gauge_v1.totalSupply() == 10 ** 22
+    assert ocb_gauge_v1.working_balances(accounts[1]) == 10 ** 22 * 40 // 100
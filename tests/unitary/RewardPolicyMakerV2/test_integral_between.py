@@ -0,0 +1,99 @@
+import brownie
+import pytest
+
+WEEK = 86400 * 7
+REWARD = 100 * 10 ** 18
+
+
+@pytest.fixture(scope="module")
+def policy_maker(RewardPolicyMakerV2, accounts, token):
+    contract = RewardPolicyMakerV2.deploy(WEEK, accounts[0], {"from": accounts[0]})
+    start = contract.current_epoch() + 1
+    contract.set_rewards_starting_at(start, token, [REWARD * (i + 1) + 12345 for i in range(10)])
+    contract.set_rewards_at(start + 14, token, 3 * REWARD)
+    yield contract
+
+
+def walk_rates(policy_maker, token, t0, t1):
+    total = 0
+    prev = t0
+    while prev < t1:
+        epoch = policy_maker.epoch_at(prev)
+        end = min(policy_maker.epoch_start_time(epoch + 1), t1)
+        total += policy_maker.rate_at(prev, token) * (end - prev)
+        prev = end
+    return total
+
+
+def test_matches_rate_walk(policy_maker, token):
+    first = policy_maker.first_epoch_time()
+    spans = [
+        (0, first + 20 * WEEK),
+        (first + 3 * WEEK + 17, first + 3 * WEEK + 5000),
+        (first + WEEK - 1, first + 9 * WEEK + 1),
+        (first + 5 * WEEK, first + 16 * WEEK + 321),
+        (first + 30 * WEEK, first + 40 * WEEK),
+    ]
+    for t0, t1 in spans:
+        assert policy_maker.integral_between(t0, t1, token) == walk_rates(
+            policy_maker, token, t0, t1
+        )
+
+
+def test_update_shifts_later_totals(policy_maker, accounts, token):
+    start = policy_maker.current_epoch() + 1
+    first = policy_maker.first_epoch_time()
+    t1 = first + 20 * WEEK
+
+    before = policy_maker.integral_between(0, t1, token)
+    policy_maker.set_rewards_at(start + 2, token, 0, {"from": accounts[0]})
+
+    assert (
+        policy_maker.integral_between(0, t1, token) == before - (REWARD * 3 + 12345) // WEEK * WEEK
+    )
+    assert policy_maker.integral_between(0, t1, token) == walk_rates(policy_maker, token, 0, t1)
+
+
+def test_unscheduled_token(policy_maker, token2):
+    assert (
+        policy_maker.integral_between(0, policy_maker.first_epoch_time() + 20 * WEEK, token2) == 0
+    )
+
+
+def test_invalid_span(policy_maker, token):
+    with brownie.reverts("dev: invalid span"):
+        policy_maker.integral_between(2, 1, token)
+
+
+def test_new_token_after_many_epochs(policy_maker, accounts, chain, token2):
+    chain.sleep(530 * WEEK)
+    chain.mine()
+    start = policy_maker.current_epoch() + 1
+    assert start > 520
+
+    policy_maker.set_rewards_starting_at(start, token2, [REWARD] * 10, {"from": accounts[0]})
+    policy_maker.set_rewards_at(start + 12, token2, 2 * REWARD, {"from": accounts[0]})
+
+    assert policy_maker.scheduled_epochs(token2) == start + 13
+    t1 = policy_maker.epoch_start_time(start + 15)
+    assert policy_maker.integral_between(0, t1, token2) == 12 * (REWARD // WEEK * WEEK)
+
+
+def test_idle_token_carries_total(policy_maker, accounts, chain, token):
+    first = policy_maker.first_epoch_time()
+    before = policy_maker.integral_between(0, first + 20 * WEEK, token)
+
+    chain.sleep(600 * WEEK)
+    chain.mine()
+    start = policy_maker.current_epoch() + 1
+    policy_maker.set_rewards_starting_at(start + 5, token, [REWARD] * 10, {"from": accounts[0]})
+    # starts inside the skipped epochs, which then end there
+    policy_maker.set_rewards_at(start, token, 2 * REWARD, {"from": accounts[0]})
+
+    assert policy_maker.integral_between(0, policy_maker.epoch_start_time(start), token) == before
+    t1 = policy_maker.epoch_start_time(start + 20)
+    for t0 in (first + 30 * WEEK, policy_maker.epoch_start_time(start - 300) + 4321):
+        assert policy_maker.integral_between(t0, t1, token) == walk_rates(
+            policy_maker, token, t0, t1
+        )
+    assert policy_maker.integral_between(0, t1, token) == before + 12 * (REWARD // WEEK * WEEK)
@@ -0,0 +1,84 @@
+import brownie
+import pytest
+from brownie import ZERO_ADDRESS
+
+WEEK = 86400 * 7
+MAX_TOKENS = 10
+MAX_EPOCHS = 52
+
+
+@pytest.fixture(scope="module")
+def policy_maker(RewardPolicyMakerV2, accounts):
+    yield RewardPolicyMakerV2.deploy(WEEK, accounts[0], {"from": accounts[0]})
+
+
+def pad_schedule(tokens, rewards):
+    tokens = tokens + [ZERO_ADDRESS] * (MAX_TOKENS - len(tokens))
+    rewards = [row + [0] * (MAX_EPOCHS - len(row)) for row in rewards]
+    rewards += [[0] * MAX_EPOCHS] * (MAX_TOKENS - len(rewards))
+    return tokens, rewards
+
+
+def test_year_for_several_tokens(
+    RewardPolicyMakerV2, policy_maker, accounts, token, token2, coin_a
+):
+    single = RewardPolicyMakerV2.deploy(WEEK, accounts[0], {"from": accounts[0]})
+    start = policy_maker.current_epoch() + 1
+    coins = [token, token2, coin_a]
+    rewards = [
+        [10 ** 18 * (i + 1) + j * 10 ** 15 for j in range(MAX_EPOCHS)] for i in range(len(coins))
+    ]
+
+    policy_maker.set_rewards_schedule(
+        start, MAX_EPOCHS, *pad_schedule(coins, rewards), {"from": accounts[0]}
+    )
+    for coin, row in zip(coins, rewards):
+        for j, reward in enumerate(row):
+            single.set_rewards_at(start + j, coin, reward, {"from": accounts[0]})
+
+    end = policy_maker.epoch_start_time(start + MAX_EPOCHS + 1)
+    for coin, row in zip(coins, rewards):
+        assert policy_maker.scheduled_epochs(coin) == start + MAX_EPOCHS
+        for j in (0, 1, 25, MAX_EPOCHS - 1):
+            assert policy_maker.rewards(coin, start + j) == row[j]
+        assert policy_maker.integral_between(0, end, coin) == single.integral_between(0, end, coin)
+
+
+def test_partial_schedule_overwrites(policy_maker, accounts, token):
+    start = policy_maker.current_epoch() + 1
+    policy_maker.set_rewards_schedule(
+        start, 10, *pad_schedule([token], [[10 ** 18] * 10]), {"from": accounts[0]}
+    )
+    policy_maker.set_rewards_schedule(
+        start + 2, 3, *pad_schedule([token], [[2 * 10 ** 18] * 3]), {"from": accounts[0]}
+    )
+
+    assert [policy_maker.rewards(token, start + i) for i in range(11)] == [10 ** 18] * 2 + [
+        2 * 10 ** 18
+    ] * 3 + [10 ** 18] * 5 + [0]
+    end = policy_maker.epoch_start_time(start + 10)
+    expected = sum(policy_maker.rewards(token, start + i) // WEEK * WEEK for i in range(10))
+    assert policy_maker.integral_between(0, end, token) == expected
+
+
+def test_admin_only(policy_maker, accounts, token):
+    start = policy_maker.current_epoch() + 1
+    with brownie.reverts("dev: admin only"):
+        policy_maker.set_rewards_schedule(
+            start, 1, *pad_schedule([token], [[1]]), {"from": accounts[1]}
+        )
+
+
+def test_past_epoch(policy_maker, accounts, token):
+    with brownie.reverts("dev: can only modify future rewards"):
+        policy_maker.set_rewards_schedule(
+            policy_maker.current_epoch(), 1, *pad_schedule([token], [[1]]), {"from": accounts[0]}
+        )
+
+
+def test_too_many_epochs(policy_maker, accounts, token):
+    start = policy_maker.current_epoch() + 1
+    with brownie.reverts("dev: too many epochs"):
+        policy_maker.set_rewards_schedule(
+            start, MAX_EPOCHS + 1, *pad_schedule([token], [[1]]), {"from": accounts[0]}
+        )
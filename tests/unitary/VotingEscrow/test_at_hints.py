@@ -0,0 +1,57 @@
+import pytest
+
+WEEK = 86400 * 7
+YEAR = 86400 * 365
+
+
+@pytest.fixture(scope="module", autouse=True)
+def history(accounts, chain, token, voting_escrow):
+    blocks = []
+    for acct in accounts[:2]:
+        token.mint(acct, 10 ** 22)
+        token.approve(voting_escrow, 10 ** 22, {"from": acct})
+
+    voting_escrow.create_lock(10 ** 21, chain.time() + YEAR, {"from": accounts[0]})
+    for i in range(4):
+        chain.sleep(WEEK + 1234)
+        voting_escrow.increase_amount(10 ** 20, {"from": accounts[0]})
+        chain.mine(3)
+        blocks.append(chain.height)
+        if i == 1:
+            voting_escrow.create_lock(10 ** 21, chain.time() + 2 * YEAR, {"from": accounts[1]})
+    chain.mine()
+    return blocks
+
+
+def last_epoch_at(get_point, max_epoch, block):
+    return max(i for i in range(max_epoch + 1) if get_point(i)[3] <= block)
+
+
+@pytest.mark.parametrize("idx", range(4))
+def test_hints_match_search(accounts, voting_escrow, history, idx):
+    block = history[idx]
+    max_epoch = voting_escrow.epoch()
+    epoch = last_epoch_at(voting_escrow.point_history, max_epoch, block)
+    assert voting_escrow.totalSupplyAtHint(block, epoch) == voting_escrow.totalSupplyAt(block)
+
+    for acct in accounts[:2]:
+        user_max = voting_escrow.user_point_epoch(acct)
+        user_epoch = last_epoch_at(
+            lambda i: voting_escrow.user_point_history(acct, i), user_max, block
+        )
+        assert voting_escrow.balanceOfAtHint(
+            acct, block, user_epoch, epoch
+        ) == voting_escrow.balanceOfAt(acct, block)
+
+
+@pytest.mark.parametrize("idx", range(4))
+def test_wrong_hints_fall_back(accounts, voting_escrow, history, idx):
+    block = history[idx]
+    max_epoch = voting_escrow.epoch()
+    expected_supply = voting_escrow.totalSupplyAt(block)
+    for hint in (0, 1, max_epoch, max_epoch + 5, 2 ** 255):
+        assert voting_escrow.totalSupplyAtHint(block, hint) == expected_supply
+        for acct in accounts[:2]:
+            assert voting_escrow.balanceOfAtHint(
+                acct, block, hint, hint
+            ) == voting_escrow.balanceOfAt(acct, block)
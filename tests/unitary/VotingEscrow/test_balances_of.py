@@ -0,0 +1,85 @@
+import brownie
+import pytest
+from brownie import ZERO_ADDRESS
+
+WEEK = 86400 * 7
+YEAR = 86400 * 365
+BATCH = 100
+
+
+def pad(values, filler=ZERO_ADDRESS):
+    return values + [filler] * (BATCH - len(values))
+
+
+@pytest.fixture(scope="module", autouse=True)
+def setup(accounts, token, voting_escrow, mirrored_voting_escrow, chain):
+    now = chain.time()
+    for i, acct in enumerate(accounts[1:5]):
+        token.mint(acct, 10 ** 21, {"from": accounts[0]})
+        token.approve(voting_escrow, 10 ** 21, {"from": acct})
+        voting_escrow.create_lock(10 ** 20 * (i + 1), now + (i + 1) * 10 * WEEK, {"from": acct})
+
+    mirrored_voting_escrow.set_mirror_whitelist(accounts[0], True, {"from": accounts[0]})
+    mirrored_voting_escrow.mirror_lock(
+        accounts[2], 250, 0, 10 ** 21, now + YEAR, {"from": accounts[0]}
+    )
+    mirrored_voting_escrow.mirror_lock(
+        accounts[5], 250, 0, 2 * 10 ** 21, now + 2 * YEAR, {"from": accounts[0]}
+    )
+
+
+def test_balances_of(accounts, voting_escrow, chain):
+    users = accounts[1:6]
+    t = chain.time() + 3 * WEEK
+
+    balances = voting_escrow.balancesOf(pad(users), t)
+
+    assert balances[:5] == [voting_escrow.balanceOf(acct, t) for acct in users]
+    assert balances[5:] == [0] * (BATCH - 5)
+
+
+def test_balances_of_current_time(accounts, voting_escrow, chain):
+    chain.sleep(WEEK)
+    chain.mine()
+
+    balances = voting_escrow.balancesOf(pad(accounts[1:5]))
+
+    assert balances[:4] == [voting_escrow.balanceOf(acct) for acct in accounts[1:5]]
+
+
+def test_locked_of(accounts, voting_escrow):
+    locks = voting_escrow.lockedOf(pad(accounts[1:6]))
+
+    assert locks[:5] == [list(voting_escrow.locked(acct)) for acct in accounts[1:6]]
+    assert locks[4] == [0, 0]
+
+
+def test_list_ends_at_empty_address(accounts, voting_escrow):
+    users = pad([accounts[1], ZERO_ADDRESS, accounts[2]])
+
+    assert voting_escrow.balancesOf(users)[2] == 0
+    assert voting_escrow.lockedOf(users)[2] == [0, 0]
+
+
+def test_mirrored_balances_of(accounts, mirrored_voting_escrow, chain):
+    users = accounts[1:6]
+    t = chain.time() + 3 * WEEK
+
+    balances = mirrored_voting_escrow.balancesOf(pad(users), t)
+
+    assert balances[:5] == [mirrored_voting_escrow.balanceOf(acct, t) for acct in users]
+    assert balances[1] > balances[0]
+
+
+def test_mirrored_locked_of(accounts, mirrored_voting_escrow):
+    locks = mirrored_voting_escrow.lockedOf(pad(accounts[1:6]), 250, 0)
+
+    assert locks[:5] == [
+        list(mirrored_voting_escrow.mirrored_locks(acct, 250, 0)) for acct in accounts[1:6]
+    ]
+    assert locks[4][0] == 2 * 10 ** 21
+
+
+def test_mirrored_locked_of_local_chain(accounts, mirrored_voting_escrow):
+    with brownie.reverts("dev: local locks are not mirrored"):
+        mirrored_voting_escrow.lockedOf(pad(accounts[1:2]), 0, 0)
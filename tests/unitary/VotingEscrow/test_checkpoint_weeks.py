@@ -0,0 +1,84 @@
+WEEK = 86400 * 7
+YEAR = 86400 * 365
+
+
+def test_checkpoint_weeks(accounts, chain, token, voting_escrow):
+    token.mint(accounts[0], 10 ** 21)
+    token.approve(voting_escrow, 10 ** 21, {"from": accounts[0]})
+    voting_escrow.create_lock(10 ** 21, chain.time() + YEAR, {"from": accounts[0]})
+    epoch = voting_escrow.epoch()
+    assert voting_escrow.pending_weeks() == 0
+
+    chain.sleep(10 * WEEK)
+    chain.mine()
+    supply = voting_escrow.totalSupply()
+    assert voting_escrow.pending_weeks() == 10
+
+    voting_escrow.checkpoint_weeks(4, {"from": accounts[1]})
+    assert voting_escrow.pending_weeks() == 6
+    assert voting_escrow.epoch() == epoch + 4
+    assert voting_escrow.point_history(epoch + 4)[2] % WEEK == 0
+
+    voting_escrow.checkpoint_weeks(100, {"from": accounts[1]})
+    assert voting_escrow.pending_weeks() == 0
+    assert voting_escrow.epoch() == epoch + 10
+    assert voting_escrow.totalSupply(chain.time()) == supply
+
+    # users only pay for the current point afterwards
+    voting_escrow.checkpoint({"from": accounts[1]})
+    assert voting_escrow.epoch() == epoch + 11
+    assert voting_escrow.totalSupply() == voting_escrow.balanceOf(accounts[0])
+
+
+def test_checkpoint_weeks_no_history(accounts, voting_escrow, mirrored_voting_escrow):
+    for escrow in (voting_escrow, mirrored_voting_escrow):
+        escrow.checkpoint_weeks(10, {"from": accounts[0]})
+        assert escrow.pending_weeks() == 0
+
+
+def test_mirrored_checkpoint_weeks(accounts, chain, mirrored_voting_escrow):
+    mirrored_voting_escrow.set_mirror_whitelist(accounts[0], True, {"from": accounts[0]})
+    mirrored_voting_escrow.mirror_lock(
+        accounts[1], 250, 0, 10 ** 21, chain.time() + YEAR, {"from": accounts[0]}
+    )
+    epoch = mirrored_voting_escrow.mirrored_epoch()
+
+    chain.sleep(7 * WEEK)
+    chain.mine()
+    supply = mirrored_voting_escrow.total_mirrored_supply()
+    assert mirrored_voting_escrow.pending_weeks() == 7
+
+    mirrored_voting_escrow.checkpoint_weeks(3, {"from": accounts[1]})
+    assert mirrored_voting_escrow.pending_weeks() == 4
+    assert mirrored_voting_escrow.mirrored_epoch() == epoch + 3
+
+    mirrored_voting_escrow.checkpoint_weeks(4, {"from": accounts[1]})
+    assert mirrored_voting_escrow.pending_weeks() == 0
+    assert mirrored_voting_escrow.total_mirrored_supply(chain.time()) == supply
+
+    mirrored_voting_escrow.mirror_lock(
+        accounts[1], 250, 0, 10 ** 21, chain.time() + YEAR, {"from": accounts[0]}
+    )
+    assert (
+        mirrored_voting_escrow.total_mirrored_supply()
+        == mirrored_voting_escrow.mirrored_balance_of(accounts[1], chain.time())
+    )
+
+
+def test_pending_weeks_at_boundary(accounts, chain, token, voting_escrow, mirrored_voting_escrow):
+    token.mint(accounts[0], 10 ** 21)
+    token.approve(voting_escrow, 10 ** 21, {"from": accounts[0]})
+    voting_escrow.create_lock(10 ** 21, chain.time() + YEAR, {"from": accounts[0]})
+    mirrored_voting_escrow.set_mirror_whitelist(accounts[0], True, {"from": accounts[0]})
+    mirrored_voting_escrow.mirror_lock(
+        accounts[1], 250, 0, 10 ** 21, chain.time() + YEAR, {"from": accounts[0]}
+    )
+
+    boundary = (chain.time() // WEEK + 3) * WEEK
+    chain.mine(timestamp=boundary)
+
+    # the boundary at the current time is not recorded by `checkpoint_weeks`
+    for escrow in (voting_escrow, mirrored_voting_escrow):
+        assert escrow.pending_weeks() == 2
+        escrow.checkpoint_weeks(100, {"from": accounts[1]})
+        assert escrow.pending_weeks() == 0
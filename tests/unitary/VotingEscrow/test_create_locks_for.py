@@ -0,0 +1,120 @@
+import brownie
+import pytest
+from brownie import ZERO_ADDRESS
+
+WEEK = 86400 * 7
+YEAR = 86400 * 365
+BATCH = 32
+
+
+def pad(values, filler=0):
+    return values + [filler] * (BATCH - len(values))
+
+
+@pytest.fixture(scope="module", autouse=True)
+def setup(voting_escrow, lock_creator, token, accounts):
+    lock_creator.add_to_whitelist(accounts[0], {"from": accounts[0]})
+    token.mint(accounts[0], 10 ** 24, {"from": accounts[0]})
+    token.approve(voting_escrow, 2 ** 256 - 1, {"from": accounts[0]})
+
+
+def test_batch_matches_single_calls(
+    VotingEscrowV2, voting_escrow, lock_creator, token, chain, accounts
+):
+    single = VotingEscrowV2.deploy(
+        token,
+        "Voting-escrowed HND",
+        "veHND",
+        "veHND_0.99",
+        accounts[0],
+        ZERO_ADDRESS,
+        lock_creator,
+        {"from": accounts[0]},
+    )
+    token.approve(single, 2 ** 256 - 1, {"from": accounts[0]})
+
+    now = chain.time()
+    locks = [
+        (accounts[1], 10 ** 21, now + YEAR),
+        (accounts[2], 2 * 10 ** 21, now + 2 * YEAR),
+        (accounts[3], 5 * 10 ** 20, now + 10 * WEEK),
+        (accounts[4], 10 ** 22, now + YEAR),
+    ]
+
+    chain.sleep(WEEK * 3)
+    for lock in locks:
+        single.create_lock_for(*lock, {"from": accounts[0]})
+    columns = list(zip(*locks))
+    balance_before = token.balanceOf(accounts[0])
+    voting_escrow.create_locks_for(
+        pad(list(columns[0]), ZERO_ADDRESS),
+        pad(list(columns[1])),
+        pad(list(columns[2])),
+        {"from": accounts[0]},
+    )
+
+    total = sum(columns[1])
+    assert token.balanceOf(accounts[0]) == balance_before - total
+    assert voting_escrow.supply() == total
+    for addr, _, end in locks:
+        assert voting_escrow.locked(addr) == single.locked(addr)
+        assert voting_escrow.locked__end(addr) == end // WEEK * WEEK
+
+    for _ in range(5):
+        chain.sleep(WEEK * 5)
+        chain.mine()
+        assert voting_escrow.totalSupply() == single.totalSupply()
+        for addr, _, _ in locks:
+            assert voting_escrow.balanceOf(addr) == single.balanceOf(addr)
+
+
+def test_single_global_checkpoint(voting_escrow, chain, accounts):
+    end = chain.time() + YEAR
+
+    voting_escrow.create_locks_for(
+        pad(accounts[1:4], ZERO_ADDRESS), pad([10 ** 21] * 3), pad([end] * 3), {"from": accounts[0]}
+    )
+
+    assert voting_escrow.epoch() == 1
+    for acct in accounts[1:4]:
+        assert voting_escrow.user_point_epoch(acct) == 1
+    assert voting_escrow.totalSupply() == sum(
+        voting_escrow.balanceOf(acct) for acct in accounts[1:4]
+    )
+
+
+def test_batch_stops_at_empty_address(voting_escrow, chain, accounts):
+    end = chain.time() + YEAR
+
+    voting_escrow.create_locks_for(
+        pad([accounts[1], ZERO_ADDRESS, accounts[2]], ZERO_ADDRESS),
+        pad([10 ** 21] * 3),
+        pad([end] * 3),
+        {"from": accounts[0]},
+    )
+
+    assert voting_escrow.locked(accounts[1])[0] == 10 ** 21
+    assert voting_escrow.locked(accounts[2]) == (0, 0)
+    assert voting_escrow.supply() == 10 ** 21
+
+
+def test_duplicate_address(voting_escrow, chain, accounts):
+    end = chain.time() + YEAR
+
+    with brownie.reverts("Withdraw old tokens first"):
+        voting_escrow.create_locks_for(
+            pad([accounts[1], accounts[1]], ZERO_ADDRESS),
+            pad([10 ** 21] * 2),
+            pad([end] * 2),
+            {"from": accounts[0]},
+        )
+
+
+def test_only_lock_creator(voting_escrow, chain, accounts):
+    with brownie.reverts("Lock creator not allowed"):
+        voting_escrow.create_locks_for(
+            pad([accounts[2]], ZERO_ADDRESS),
+            pad([10 ** 21]),
+            pad([chain.time() + YEAR]),
+            {"from": accounts[1]},
+        )
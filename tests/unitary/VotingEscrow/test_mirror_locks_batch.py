@@ -0,0 +1,112 @@
+import brownie
+from brownie import ZERO_ADDRESS
+
+WEEK = 86400 * 7
+YEAR = 86400 * 365
+BATCH = 32
+
+
+def pad(values, filler=0):
+    return values + [filler] * (BATCH - len(values))
+
+
+def test_batch_matches_single_calls(
+    MirroredVotingEscrow, mirrored_voting_escrow, voting_escrow, chain, accounts
+):
+    single = MirroredVotingEscrow.deploy(
+        accounts[0],
+        voting_escrow,
+        "Mirrored Voting-escrowed HND",
+        "mveHND",
+        "mveHND_0.99",
+        {"from": accounts[0]},
+    )
+    for escrow in (single, mirrored_voting_escrow):
+        escrow.set_mirror_whitelist(accounts[0], True, {"from": accounts[0]})
+
+    now = chain.time()
+    locks = [
+        (accounts[1], 250, 0, 10 ** 21, now + YEAR),
+        (accounts[1], 250, 1, 2 * 10 ** 21, now + 2 * YEAR),
+        (accounts[2], 1, 0, 5 * 10 ** 20, now + 10 * WEEK),
+        (accounts[1], 10, 0, 10 ** 22, now + 3 * YEAR),
+    ]
+
+    chain.sleep(WEEK * 3)
+    for lock in locks:
+        single.mirror_lock(*lock, {"from": accounts[0]})
+    columns = list(zip(*locks))
+    mirrored_voting_escrow.mirror_locks(
+        pad(list(columns[0]), ZERO_ADDRESS),
+        pad(list(columns[1])),
+        pad(list(columns[2])),
+        pad(list(columns[3])),
+        pad(list(columns[4])),
+        {"from": accounts[0]},
+    )
+
+    assert mirrored_voting_escrow.mirrored_chains_count() == 3
+    for i in range(3):
+        assert mirrored_voting_escrow.mirrored_chains(i) == single.mirrored_chains(i)
+
+    for _ in range(5):
+        chain.sleep(WEEK * 5)
+        chain.mine()
+        t = chain.time()
+        assert mirrored_voting_escrow.total_mirrored_supply(t) == single.total_mirrored_supply(t)
+        for acct in accounts[1:3]:
+            assert mirrored_voting_escrow.mirrored_balance_of(
+                acct, t
+            ) == single.mirrored_balance_of(acct, t)
+
+
+def test_batch_single_global_checkpoint(mirrored_voting_escrow, chain, accounts):
+    mirrored_voting_escrow.set_mirror_whitelist(accounts[0], True, {"from": accounts[0]})
+    end = chain.time() + YEAR
+
+    mirrored_voting_escrow.mirror_locks(
+        pad([accounts[1], accounts[2], accounts[3]], ZERO_ADDRESS),
+        pad([250, 250, 250]),
+        pad([0, 0, 0]),
+        pad([10 ** 21] * 3),
+        pad([end] * 3),
+        {"from": accounts[0]},
+    )
+
+    assert mirrored_voting_escrow.mirrored_epoch() == 1
+    assert mirrored_voting_escrow.mirrored_locks(accounts[3], 250, 0) == (
+        10 ** 21,
+        end // WEEK * WEEK,
+    )
+
+
+def test_batch_stops_at_empty_user(mirrored_voting_escrow, chain, accounts):
+    mirrored_voting_escrow.set_mirror_whitelist(accounts[0], True, {"from": accounts[0]})
+    end = chain.time() + YEAR
+
+    mirrored_voting_escrow.mirror_locks(
+        pad([accounts[1], ZERO_ADDRESS, accounts[2]], ZERO_ADDRESS),
+        pad([250] * 3),
+        pad([0] * 3),
+        pad([10 ** 21] * 3),
+        pad([end] * 3),
+        {"from": accounts[0]},
+    )
+
+    assert mirrored_voting_escrow.mirrored_locks(accounts[1], 250, 0) == (
+        10 ** 21,
+        end // WEEK * WEEK,
+    )
+    assert mirrored_voting_escrow.mirrored_locks(accounts[2], 250, 0) == (0, 0)
+
+
+def test_batch_only_whitelisted(mirrored_voting_escrow, accounts):
+    with brownie.reverts():
+        mirrored_voting_escrow.mirror_locks(
+            pad([accounts[1]], ZERO_ADDRESS),
+            pad([250]),
+            pad([0]),
+            pad([1]),
+            pad([1]),
+            {"from": accounts[1]},
+        )
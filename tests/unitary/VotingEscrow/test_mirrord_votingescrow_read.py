@@ -1,5 +1,6 @@
 import brownie
 
+WEEK = 86400 * 7
 YEAR = 86400 * 365
 
 def test_nearest_locked__end(mirrored_voting_escrow, chain, accounts):
@@ -11,4 +12,5 @@ def test_nearest_locked__end(mirrored_voting_escrow, chain, accounts):
     mirrored_voting_escrow.mirror_lock(accounts[0], 250, 0, lock_amount, lock_end, {"from": accounts[0]})
     mirrored_voting_escrow.mirror_lock(accounts[0], 1, 0, lock_amount, lock_end + YEAR, {"from": accounts[0]})
 
-    assert lock_end == mirrored_voting_escrow.nearest_locked__end(accounts[0])
\ No newline at end of file
+    # mirrored lock ends are rounded down to weeks
+    assert lock_end // WEEK * WEEK == mirrored_voting_escrow.nearest_locked__end(accounts[0])
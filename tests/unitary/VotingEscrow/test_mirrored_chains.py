@@ -0,0 +1,42 @@
+import pytest
+
+YEAR = 86400 * 365
+
+
+@pytest.fixture(scope="module", autouse=True)
+def setup(mirrored_voting_escrow, accounts):
+    mirrored_voting_escrow.set_mirror_whitelist(accounts[0], True, {"from": accounts[0]})
+
+
+def test_chain_index(mirrored_voting_escrow, chain, accounts):
+    end = chain.time() + YEAR
+    for chain_id in (250, 1, 10):
+        mirrored_voting_escrow.mirror_lock(
+            accounts[1], chain_id, 0, 10 ** 21, end, {"from": accounts[0]}
+        )
+
+    assert mirrored_voting_escrow.mirrored_chains_count() == 3
+    assert mirrored_voting_escrow.mirrored_chain_index(250) == 1
+    assert mirrored_voting_escrow.mirrored_chain_index(1) == 2
+    assert mirrored_voting_escrow.mirrored_chain_index(10) == 3
+    assert mirrored_voting_escrow.mirrored_chain_index(137) == 0
+
+
+def test_escrow_count_only_grows(mirrored_voting_escrow, chain, accounts):
+    end = chain.time() + YEAR
+    mirrored_voting_escrow.mirror_lock(accounts[1], 250, 2, 10 ** 21, end, {"from": accounts[0]})
+    mirrored_voting_escrow.mirror_lock(accounts[2], 250, 0, 10 ** 21, end, {"from": accounts[0]})
+
+    assert mirrored_voting_escrow.mirrored_chains_count() == 1
+    assert mirrored_voting_escrow.mirrored_chains(0) == (250, 3)
+
+
+def test_get_mirrored_chains(mirrored_voting_escrow, chain, accounts):
+    end = chain.time() + YEAR
+    mirrored_voting_escrow.mirror_lock(accounts[1], 250, 0, 10 ** 21, end, {"from": accounts[0]})
+    mirrored_voting_escrow.mirror_lock(accounts[1], 1, 1, 10 ** 21, end, {"from": accounts[0]})
+    mirrored_voting_escrow.mirror_lock(accounts[2], 250, 3, 10 ** 21, end, {"from": accounts[0]})
+
+    chains = mirrored_voting_escrow.get_mirrored_chains()
+
+    assert chains[:3] == [[250, 4], [1, 2], [0, 0]]
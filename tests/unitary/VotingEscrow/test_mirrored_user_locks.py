@@ -0,0 +1,49 @@
+import pytest
+
+YEAR = 86400 * 365
+
+
+@pytest.fixture(scope="module", autouse=True)
+def setup(mirrored_voting_escrow, accounts):
+    mirrored_voting_escrow.set_mirror_whitelist(accounts[0], True, {"from": accounts[0]})
+
+
+def user_locks(mirrored_voting_escrow, user):
+    count = mirrored_voting_escrow.mirrored_user_lock_count(user)
+    return sorted(tuple(mirrored_voting_escrow.mirrored_user_locks(user, i)) for i in range(count))
+
+
+def test_locks_are_listed_once(mirrored_voting_escrow, chain, accounts):
+    end = chain.time() + YEAR
+    mirrored_voting_escrow.mirror_lock(accounts[1], 250, 0, 10 ** 21, end, {"from": accounts[0]})
+    mirrored_voting_escrow.mirror_lock(accounts[1], 1, 2, 10 ** 21, end, {"from": accounts[0]})
+    mirrored_voting_escrow.mirror_lock(
+        accounts[1], 250, 0, 2 * 10 ** 21, end + YEAR, {"from": accounts[0]}
+    )
+    mirrored_voting_escrow.mirror_lock(accounts[2], 10, 0, 10 ** 21, end, {"from": accounts[0]})
+
+    assert user_locks(mirrored_voting_escrow, accounts[1]) == [(1, 2), (250, 0)]
+    assert user_locks(mirrored_voting_escrow, accounts[2]) == [(10, 0)]
+    assert user_locks(mirrored_voting_escrow, accounts[3]) == []
+
+
+def test_withdrawn_lock_is_removed(mirrored_voting_escrow, chain, accounts):
+    end = chain.time() + YEAR
+    for chain_id in (250, 1, 10):
+        mirrored_voting_escrow.mirror_lock(
+            accounts[1], chain_id, 0, 10 ** 21, end, {"from": accounts[0]}
+        )
+
+    mirrored_voting_escrow.mirror_lock(accounts[1], 250, 0, 0, 0, {"from": accounts[0]})
+    assert user_locks(mirrored_voting_escrow, accounts[1]) == [(1, 0), (10, 0)]
+
+    mirrored_voting_escrow.mirror_lock(accounts[1], 10, 0, 0, 0, {"from": accounts[0]})
+    assert user_locks(mirrored_voting_escrow, accounts[1]) == [(1, 0)]
+
+    # a removed lock can come back
+    mirrored_voting_escrow.mirror_lock(accounts[1], 250, 0, 10 ** 21, end, {"from": accounts[0]})
+    assert user_locks(mirrored_voting_escrow, accounts[1]) == [(1, 0), (250, 0)]
+
+    mirrored_voting_escrow.mirror_lock(accounts[1], 1, 0, 0, 0, {"from": accounts[0]})
+    mirrored_voting_escrow.mirror_lock(accounts[1], 250, 0, 0, 0, {"from": accounts[0]})
+    assert user_locks(mirrored_voting_escrow, accounts[1]) == []
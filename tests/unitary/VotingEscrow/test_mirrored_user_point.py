@@ -0,0 +1,114 @@
+import pytest
+
+WEEK = 86400 * 7
+YEAR = 86400 * 365
+
+LOCKS = [(250, 0), (250, 1), (1, 0), (10, 2)]
+
+
+@pytest.fixture(scope="module", autouse=True)
+def setup(mirrored_voting_escrow, accounts):
+    mirrored_voting_escrow.set_mirror_whitelist(accounts[0], True, {"from": accounts[0]})
+
+
+def escrow_balances_sum(mirrored_voting_escrow, user, t):
+    total = 0
+    for chain_id, escrow_id in LOCKS:
+        epoch = mirrored_voting_escrow.user_point_epoch(user, chain_id, escrow_id)
+        if epoch == 0:
+            continue
+        bias, slope, ts, _ = mirrored_voting_escrow.mirrored_user_point_history(
+            user, chain_id, escrow_id, epoch
+        )
+        total += max(bias - slope * (t - ts), 0)
+    return total
+
+
+def test_balance_matches_per_escrow_sum(mirrored_voting_escrow, chain, accounts):
+    user = accounts[1]
+    start = chain.time() // WEEK * WEEK
+    for i, (chain_id, escrow_id) in enumerate(LOCKS):
+        mirrored_voting_escrow.mirror_lock(
+            user,
+            chain_id,
+            escrow_id,
+            10 ** 21 * (i + 1),
+            start + (i + 1) * 11 * WEEK,
+            {"from": accounts[0]},
+        )
+
+    for _ in range(100):
+        chain.sleep(WEEK // 2 + 17)
+        chain.mine()
+        t = chain.time()
+        assert mirrored_voting_escrow.mirrored_balance_of(user, t) == escrow_balances_sum(
+            mirrored_voting_escrow, user, t
+        )
+
+    assert mirrored_voting_escrow.mirrored_balance_of(user, chain.time()) == 0
+
+
+def test_relock_updates_combined_point(mirrored_voting_escrow, chain, accounts):
+    user = accounts[1]
+    now = chain.time()
+    for chain_id, escrow_id in LOCKS:
+        mirrored_voting_escrow.mirror_lock(
+            user, chain_id, escrow_id, 10 ** 21, now + YEAR, {"from": accounts[0]}
+        )
+
+    chain.sleep(3 * WEEK + 100)
+    now = chain.time()
+    # extend one lock, shorten another and drop a third one
+    mirrored_voting_escrow.mirror_lock(
+        user, 250, 0, 2 * 10 ** 21, now + 2 * YEAR, {"from": accounts[0]}
+    )
+    mirrored_voting_escrow.mirror_lock(
+        user, 250, 1, 10 ** 21, now + 5 * WEEK + 3, {"from": accounts[0]}
+    )
+    mirrored_voting_escrow.mirror_lock(user, 1, 0, 0, 0, {"from": accounts[0]})
+
+    for i in range(1, 110):
+        for t in ((now // WEEK + i) * WEEK, now + i * WEEK):
+            assert mirrored_voting_escrow.mirrored_balance_of(user, t) == escrow_balances_sum(
+                mirrored_voting_escrow, user, t
+            )
+
+
+def test_unaligned_end_rounded_down(mirrored_voting_escrow, chain, accounts):
+    user = accounts[1]
+    now = chain.time()
+    end = (now // WEEK + 5) * WEEK
+    mirrored_voting_escrow.mirror_lock(
+        user, 250, 0, 10 ** 21, end + 3 * 86400, {"from": accounts[0]}
+    )
+    mirrored_voting_escrow.mirror_lock(user, 1, 0, 10 ** 21, now + YEAR, {"from": accounts[0]})
+
+    assert mirrored_voting_escrow.locked__end(user, 250, 0) == end
+    # the rounded lock is over for the whole rest of its week
+    for t in (end - 1, end, end + 86400, end + 3 * 86400, end + WEEK):
+        assert mirrored_voting_escrow.mirrored_balance_of(user, t) == escrow_balances_sum(
+            mirrored_voting_escrow, user, t
+        )
+
+
+def test_balance_after_expiry(mirrored_voting_escrow, chain, accounts):
+    user = accounts[1]
+    mirrored_voting_escrow.mirror_lock(
+        user, 250, 0, 10 ** 21, chain.time() + 2 * WEEK, {"from": accounts[0]}
+    )
+
+    chain.sleep(3 * WEEK)
+    chain.mine()
+    assert mirrored_voting_escrow.mirrored_balance_of(user, chain.time()) == 0
+
+    # relocking after expiry starts again from the new lock only
+    mirrored_voting_escrow.mirror_lock(
+        user, 250, 0, 10 ** 21, chain.time() + YEAR, {"from": accounts[0]}
+    )
+    t = chain.time()
+    assert mirrored_voting_escrow.mirrored_balance_of(user, t) == escrow_balances_sum(
+        mirrored_voting_escrow, user, t
+    )
+    assert mirrored_voting_escrow.balanceOf(user) == mirrored_voting_escrow.mirrored_balance_of(
+        user, t
+    )
@@ -0,0 +1,45 @@
+WEEK = 86400 * 7
+YEAR = 86400 * 365
+MAXTIME = 4 * YEAR
+
+
+def test_user_point_history(accounts, chain, token, voting_escrow):
+    token.mint(accounts[0], 10 ** 21)
+    token.approve(voting_escrow, 10 ** 21, {"from": accounts[0]})
+    tx = voting_escrow.create_lock(10 ** 21, chain.time() + YEAR, {"from": accounts[0]})
+    end = voting_escrow.locked__end(accounts[0])
+
+    slope = 10 ** 21 // MAXTIME
+    expected = (slope * (end - tx.timestamp), slope, tx.timestamp, tx.block_number)
+    assert voting_escrow.user_point_history(accounts[0], 1) == expected
+    assert voting_escrow.user_point_history__ts(accounts[0], 1) == tx.timestamp
+    assert voting_escrow.get_last_user_slope(accounts[0]) == slope
+    assert voting_escrow.user_point_history(accounts[0], 2) == (0, 0, 0, 0)
+
+
+def test_point_history(accounts, chain, token, voting_escrow):
+    token.mint(accounts[0], 10 ** 21)
+    token.approve(voting_escrow, 10 ** 21, {"from": accounts[0]})
+    tx = voting_escrow.create_lock(10 ** 21, chain.time() + YEAR, {"from": accounts[0]})
+
+    epoch = voting_escrow.epoch()
+    bias, slope, ts, blk = voting_escrow.point_history(epoch)
+    assert (bias, slope, ts, blk) == voting_escrow.user_point_history(accounts[0], 1)
+    assert voting_escrow.totalSupply(ts) == bias
+
+    bias_0, _, ts_0, _ = voting_escrow.point_history(epoch)
+    chain.sleep(3 * WEEK)
+    tx = voting_escrow.checkpoint({"from": accounts[1]})
+    assert voting_escrow.epoch() == epoch + 4
+
+    # week boundaries are recorded with an extrapolated block number
+    for i in range(1, 4):
+        bias, slope, ts, blk = voting_escrow.point_history(epoch + i)
+        assert ts % WEEK == 0
+        assert blk <= tx.block_number
+        assert bias == bias_0 - slope * (ts - ts_0)
+
+    assert voting_escrow.point_history(epoch + 4)[2:] == (tx.timestamp, tx.block_number)
+    assert voting_escrow.totalSupplyAt(tx.block_number) == voting_escrow.balanceOfAt(
+        accounts[0], tx.block_number
+    )
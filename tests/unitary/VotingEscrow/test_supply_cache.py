@@ -0,0 +1,77 @@
+import pytest
+
+YEAR = 86400 * 365
+
+
+@pytest.fixture(scope="module", autouse=True)
+def setup(accounts, token, voting_escrow, mirrored_voting_escrow, chain):
+    token.mint(accounts[1], 10 ** 21, {"from": accounts[0]})
+    token.approve(voting_escrow, 10 ** 21, {"from": accounts[1]})
+    voting_escrow.create_lock(10 ** 21, chain.time() + YEAR, {"from": accounts[1]})
+
+    mirrored_voting_escrow.set_mirror_whitelist(accounts[0], True, {"from": accounts[0]})
+    mirrored_voting_escrow.mirror_lock(
+        accounts[2], 250, 0, 10 ** 21, chain.time() + 2 * YEAR, {"from": accounts[0]}
+    )
+
+
+def test_write_caches_supply(accounts, mirrored_voting_escrow):
+    tx = mirrored_voting_escrow.total_supply_write({"from": accounts[3]})
+
+    mirrored = mirrored_voting_escrow.total_mirrored_supply(tx.timestamp)
+    assert mirrored_voting_escrow.mirrored_supply_cache() == mirrored
+    assert mirrored_voting_escrow.mirrored_supply_cache_block() == tx.block_number
+    assert tx.return_value == mirrored_voting_escrow.totalSupply(tx.timestamp)
+
+
+def test_cache_expires_with_block(accounts, chain, mirrored_voting_escrow, voting_escrow):
+    mirrored_voting_escrow.total_supply_write({"from": accounts[3]})
+    cached = mirrored_voting_escrow.totalSupply()
+
+    chain.sleep(86400)
+    mirrored_voting_escrow.mirror_lock(
+        accounts[3], 250, 0, 10 ** 22, chain.time() + YEAR, {"from": accounts[0]}
+    )
+    chain.mine()
+
+    t = chain.time()
+    total = mirrored_voting_escrow.totalSupply()
+    assert total > cached
+    assert total == voting_escrow.totalSupply(t) + mirrored_voting_escrow.total_mirrored_supply(t)
+
+
+def test_gauge_fills_cache(accounts, gauge_v5, mirrored_voting_escrow, mock_lp_token):
+    mock_lp_token.approve(gauge_v5, 10 ** 21, {"from": accounts[0]})
+    tx = gauge_v5.deposit(10 ** 21, {"from": accounts[0]})
+
+    assert mirrored_voting_escrow.mirrored_supply_cache_block() == tx.block_number
+    mirrored = mirrored_voting_escrow.total_mirrored_supply(tx.timestamp)
+    assert mirrored_voting_escrow.mirrored_supply_cache() == mirrored
+
+
+def test_local_lock_in_same_block(
+    accounts,
+    chain,
+    SameBlockLocker,
+    mirrored_voting_escrow,
+    voting_escrow,
+    smart_wallet_checker,
+    token,
+):
+    locker = SameBlockLocker.deploy({"from": accounts[0]})
+    smart_wallet_checker.add_to_whitelist(locker, {"from": accounts[0]})
+    token.mint(locker, 10 ** 21, {"from": accounts[0]})
+
+    tx = locker.lock_between_reads(
+        mirrored_voting_escrow,
+        voting_escrow,
+        token,
+        10 ** 21,
+        chain.time() + YEAR,
+        {"from": accounts[0]},
+    )
+    before, after = tx.return_value
+
+    assert after > before
+    assert after == mirrored_voting_escrow.totalSupply(tx.timestamp)
+    assert mirrored_voting_escrow.mirrored_supply_cache_block() == tx.block_number
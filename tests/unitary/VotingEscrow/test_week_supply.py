@@ -0,0 +1,76 @@
+import pytest
+
+WEEK = 86400 * 7
+YEAR = 86400 * 365
+
+
+@pytest.fixture(scope="module", autouse=True)
+def setup(accounts, token, voting_escrow, mirrored_voting_escrow):
+    for acct in accounts[:3]:
+        token.mint(acct, 10 ** 22)
+        token.approve(voting_escrow, 10 ** 22, {"from": acct})
+    mirrored_voting_escrow.set_mirror_whitelist(accounts[0], True, {"from": accounts[0]})
+
+
+def test_week_supply_matches_projection(accounts, chain, voting_escrow):
+    voting_escrow.create_lock(10 ** 21, chain.time() + 3 * WEEK, {"from": accounts[0]})
+    chain.sleep(WEEK)
+    voting_escrow.create_lock(2 * 10 ** 21, chain.time() + YEAR, {"from": accounts[1]})
+
+    week = (chain.time() // WEEK + 1) * WEEK
+    projected = [voting_escrow.totalSupply(week + i * WEEK) for i in range(6)]
+
+    chain.sleep(7 * WEEK)
+    voting_escrow.checkpoint({"from": accounts[2]})
+
+    for i in range(6):
+        assert voting_escrow.week_supply(week + i * WEEK) == projected[i]
+        assert voting_escrow.totalSupply(week + i * WEEK) == projected[i]
+
+    # the first lock has expired by then, only the second one is left
+    assert projected[5] == voting_escrow.balanceOf(accounts[1], week + 5 * WEEK)
+
+
+def test_week_supply_before_locks(accounts, chain, voting_escrow):
+    week = (chain.time() // WEEK) * WEEK
+    voting_escrow.create_lock(10 ** 21, chain.time() + YEAR, {"from": accounts[0]})
+    chain.sleep(2 * WEEK)
+    voting_escrow.checkpoint({"from": accounts[2]})
+
+    assert voting_escrow.totalSupply(week) == 0
+    assert voting_escrow.totalSupply(week + WEEK) == voting_escrow.week_supply(week + WEEK) > 0
+
+
+def test_checkpoint_weeks_records_supply(accounts, chain, voting_escrow):
+    voting_escrow.create_lock(10 ** 21, chain.time() + YEAR, {"from": accounts[0]})
+    week = (chain.time() // WEEK + 1) * WEEK
+    projected = [voting_escrow.totalSupply(week + i * WEEK) for i in range(4)]
+
+    chain.sleep(5 * WEEK)
+    chain.mine()
+    voting_escrow.checkpoint_weeks(4, {"from": accounts[2]})
+
+    assert [voting_escrow.week_supply(week + i * WEEK) for i in range(4)] == projected
+
+
+def test_mirrored_week_supply(accounts, chain, voting_escrow, mirrored_voting_escrow):
+    voting_escrow.create_lock(10 ** 21, chain.time() + YEAR, {"from": accounts[0]})
+    mirrored_voting_escrow.mirror_lock(
+        accounts[1], 250, 0, 10 ** 21, chain.time() + 2 * WEEK, {"from": accounts[0]}
+    )
+    mirrored_voting_escrow.mirror_lock(
+        accounts[2], 250, 0, 10 ** 21, chain.time() + YEAR, {"from": accounts[0]}
+    )
+
+    week = (chain.time() // WEEK + 1) * WEEK
+    mirrored = [mirrored_voting_escrow.total_mirrored_supply(week + i * WEEK) for i in range(4)]
+    total = [mirrored_voting_escrow.totalSupply(week + i * WEEK) for i in range(4)]
+
+    chain.sleep(5 * WEEK)
+    for escrow in (voting_escrow, mirrored_voting_escrow):
+        escrow.checkpoint({"from": accounts[2]})
+
+    for i in range(4):
+        assert mirrored_voting_escrow.mirrored_week_supply(week + i * WEEK) == mirrored[i]
+        assert mirrored_voting_escrow.total_mirrored_supply(week + i * WEEK) == mirrored[i]
+        assert mirrored_voting_escrow.totalSupply(week + i * WEEK) == total[i]
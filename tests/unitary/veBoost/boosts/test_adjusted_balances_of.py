@@ -0,0 +1,30 @@
+from brownie import ZERO_ADDRESS
+
+BATCH = 100
+
+
+def pad(values, filler=ZERO_ADDRESS):
+    return values + [filler] * (BATCH - len(values))
+
+
+def test_adjusted_balances_of(
+    alice, bob, charlie, expire_time, lock_alice, lock_bob, veboost_delegation, veboost_proxy
+):
+    veboost_delegation.create_boost(alice, charlie, 5_000, 0, expire_time, 0, {"from": alice})
+    accounts = [alice, bob, charlie]
+
+    balances = veboost_proxy.adjusted_balances_of(pad(accounts))
+
+    assert balances[:3] == [veboost_proxy.adjusted_balance_of(acct) for acct in accounts]
+    assert balances[2] > 0
+    assert balances[3:] == [0] * (BATCH - 3)
+
+
+def test_adjusted_balances_without_delegation(
+    alice, bob, lock_alice, mirrored_voting_escrow, veboost_proxy
+):
+    veboost_proxy.kill_delegation({"from": alice})
+
+    balances = veboost_proxy.adjusted_balances_of(pad([alice, bob]))
+
+    assert balances[:2] == [mirrored_voting_escrow.balanceOf(alice), 0]
@@ -0,0 +1,167 @@
+import math
+
+import brownie
+import pytest
+from brownie import ZERO_ADDRESS
+
+DAY = 86400
+WEEK = DAY * 7
+BATCH = 32
+
+
+pytestmark = pytest.mark.usefixtures("lock_alice")
+
+
+def pad(values, filler=0):
+    return values + [filler] * (BATCH - len(values))
+
+
+def test_create_boosts_share_delegable_boost(
+    alice, bob, charlie, dave, expire_time, veboost_delegation
+):
+    receivers = [bob, charlie, dave]
+    percentages = [2_000, 3_000, 5_000]
+    veboost_delegation.create_boosts(
+        alice,
+        pad(receivers, ZERO_ADDRESS),
+        pad(percentages),
+        pad([0] * 3),
+        pad([expire_time] * 3),
+        pad([0, 1, 2]),
+        {"from": alice},
+    )
+
+    values = [
+        veboost_delegation.token_boost(veboost_delegation.get_token_id(alice, i)) for i in range(3)
+    ]
+    for value, pct in zip(values, percentages):
+        assert math.isclose(value, values[2] * pct / 5_000, rel_tol=1e-6)
+    assert veboost_delegation.adjusted_balance_of(alice) < sum(values) // 10 ** 6
+    for receiver, value in zip(receivers, values):
+        assert veboost_delegation.received_boost(receiver) == value
+
+
+def test_create_boosts_over_full_delegation(alice, bob, charlie, expire_time, veboost_delegation):
+    with brownie.reverts(dev_revert_msg="dev: percentage must be less than 10_000 bps"):
+        veboost_delegation.create_boosts(
+            alice,
+            pad([bob, charlie], ZERO_ADDRESS),
+            pad([6_000, 5_000]),
+            pad([0, 0]),
+            pad([expire_time] * 2),
+            pad([0, 1]),
+            {"from": alice},
+        )
+
+
+def test_create_boosts_only_delegator_or_operator(
+    alice, bob, charlie, expire_time, veboost_delegation
+):
+    args = (pad([charlie], ZERO_ADDRESS), pad([1_000]), pad([0]), pad([expire_time]), pad([0]))
+    with brownie.reverts(dev_revert_msg="dev: only delegator or operator"):
+        veboost_delegation.create_boosts(alice, *args, {"from": bob})
+
+    veboost_delegation.setApprovalForAll(bob, True, {"from": alice})
+    veboost_delegation.create_boosts(alice, *args, {"from": bob})
+    assert veboost_delegation.ownerOf(veboost_delegation.get_token_id(alice, 0)) == charlie
+
+
+def test_extend_boosts(alice, bob, charlie, chain, expire_time, veboost_delegation):
+    for i, receiver in enumerate([bob, charlie]):
+        veboost_delegation.create_boost(alice, receiver, 2_000, 0, expire_time, i, {"from": alice})
+    tokens = [veboost_delegation.get_token_id(alice, i) for i in range(2)]
+
+    chain.sleep(WEEK)
+    veboost_delegation.extend_boosts(
+        pad(tokens),
+        pad([4_000, 6_000]),
+        pad([expire_time + WEEK] * 2),
+        pad([0, 0]),
+        {"from": alice},
+    )
+
+    values = [veboost_delegation.token_boost(token) for token in tokens]
+    assert math.isclose(values[0] * 6_000, values[1] * 4_000, rel_tol=1e-6)
+    # every percentage is taken of the boost delegable once the whole batch is burned
+    assert veboost_delegation.adjusted_balance_of(alice) < sum(values) // 10 ** 6
+    assert [veboost_delegation.token_expiry(token) for token in tokens] == [expire_time + WEEK] * 2
+
+
+def test_extend_boosts_cannot_reduce_value(alice, bob, charlie, expire_time, veboost_delegation):
+    for i, receiver in enumerate([bob, charlie]):
+        veboost_delegation.create_boost(alice, receiver, 2_500, 0, expire_time, i, {"from": alice})
+    tokens = [veboost_delegation.get_token_id(alice, i) for i in range(2)]
+
+    with brownie.reverts(dev_revert_msg="dev: cannot reduce value of boost"):
+        veboost_delegation.extend_boosts(
+            pad(tokens), pad([1_000, 9_000]), pad([expire_time] * 2), pad([0, 0]), {"from": alice}
+        )
+
+
+def test_extend_boosts_sorted_token_ids(alice, bob, expire_time, veboost_delegation):
+    veboost_delegation.create_boost(alice, bob, 2_000, 0, expire_time, 0, {"from": alice})
+    token = veboost_delegation.get_token_id(alice, 0)
+
+    with brownie.reverts(dev_revert_msg="dev: token ids must be sorted"):
+        veboost_delegation.extend_boosts(
+            pad([token, token]),
+            pad([1_000, 9_000]),
+            pad([expire_time] * 2),
+            pad([0, 0]),
+            {"from": alice},
+        )
+
+
+def test_extend_boosts_single_delegator(
+    alice, bob, charlie, expire_time, lock_bob, veboost_delegation
+):
+    veboost_delegation.create_boost(alice, charlie, 2_000, 0, expire_time, 0, {"from": alice})
+    veboost_delegation.create_boost(bob, charlie, 2_000, 0, expire_time, 0, {"from": bob})
+    veboost_delegation.setApprovalForAll(alice, True, {"from": bob})
+    tokens = sorted(
+        [veboost_delegation.get_token_id(alice, 0), veboost_delegation.get_token_id(bob, 0)]
+    )
+
+    with brownie.reverts(dev_revert_msg="dev: boosts of multiple delegators"):
+        veboost_delegation.extend_boosts(
+            pad(tokens), pad([3_000, 3_000]), pad([expire_time] * 2), pad([0, 0]), {"from": alice}
+        )
+
+
+def test_extend_boosts_outstanding_negative_boosts(
+    alice, bob, charlie, chain, expire_time, veboost_delegation
+):
+    veboost_delegation.create_boost(alice, bob, 2_000, 0, expire_time, 0, {"from": alice})
+    veboost_delegation.create_boost(
+        alice, charlie, 2_000, 0, expire_time - WEEK, 1, {"from": alice}
+    )
+    chain.mine(timestamp=expire_time - WEEK + 1)
+
+    token = veboost_delegation.get_token_id(alice, 0)
+    with brownie.reverts(dev_revert_msg="dev: negative outstanding boosts"):
+        veboost_delegation.extend_boosts(
+            pad([token]), pad([5_000]), pad([expire_time + WEEK]), pad([0]), {"from": alice}
+        )
+
+    # extending the expired boost with the batch settles it
+    tokens = [token, veboost_delegation.get_token_id(alice, 1)]
+    veboost_delegation.extend_boosts(
+        pad(tokens),
+        pad([5_000, 5_000]),
+        pad([expire_time + WEEK] * 2),
+        pad([0, 0]),
+        {"from": alice},
+    )
+    assert veboost_delegation.token_boost(tokens[1]) > 0
+
+
+def test_cancel_boosts(alice, bob, expire_time, veboost_delegation):
+    for i in range(3):
+        veboost_delegation.create_boost(alice, bob, 1_000, 0, expire_time, i, {"from": alice})
+    tokens = [veboost_delegation.get_token_id(alice, i) for i in range(3)]
+
+    veboost_delegation.cancel_boosts(pad(tokens[:2]), {"from": bob})
+
+    assert [veboost_delegation.token_boost(token) for token in tokens[:2]] == [0, 0]
+    assert veboost_delegation.token_boost(tokens[2]) > 0
+    assert veboost_delegation.received_boost(bob) == veboost_delegation.token_boost(tokens[2])
@@ -0,0 +1,67 @@
+import brownie
+import pytest
+
+DAY = 86400
+WEEK = DAY * 7
+
+pytestmark = pytest.mark.usefixtures("lock_alice")
+
+
+def expiry_week_set(veboost_delegation, account, expire_time):
+    week = expire_time // WEEK
+    return (veboost_delegation.expiry_weeks(account, week // 256) >> (week % 256)) & 1 == 1
+
+
+def test_bitmap_follows_expiries(alice, bob, chain, veboost_delegation):
+    now = chain.time() // WEEK * WEEK
+    expiries = [now + 2 * WEEK, now + 2 * WEEK, now + 30 * WEEK, now + 180 * WEEK]
+    for i, expire_time in enumerate(expiries):
+        veboost_delegation.create_boost(alice, bob, 1_000, 0, expire_time, i, {"from": alice})
+
+    for expire_time in expiries:
+        assert expiry_week_set(veboost_delegation, alice, expire_time)
+
+    # the week stays flagged while another boost expires in it
+    veboost_delegation.cancel_boost(veboost_delegation.get_token_id(alice, 0), {"from": bob})
+    assert expiry_week_set(veboost_delegation, alice, expiries[0])
+
+    veboost_delegation.cancel_boost(veboost_delegation.get_token_id(alice, 1), {"from": bob})
+    assert not expiry_week_set(veboost_delegation, alice, expiries[0])
+    assert veboost_delegation.account_expiries(alice, expiries[0]) == 0
+
+
+@pytest.mark.parametrize("gap_weeks", [1, 3, 150, 190])
+def test_cancel_next_expiry_moves_to_following(
+    alice, bob, charlie, chain, veboost_delegation, gap_weeks
+):
+    now = chain.time() // WEEK * WEEK
+    first = now + 2 * WEEK
+    veboost_delegation.create_boost(alice, bob, 1_000, 0, first, 0, {"from": alice})
+    veboost_delegation.create_boost(
+        alice, charlie, 1_000, 0, first + gap_weeks * WEEK, 1, {"from": alice}
+    )
+
+    veboost_delegation.cancel_boost(veboost_delegation.get_token_id(alice, 0), {"from": bob})
+
+    # the cancelled boost no longer counts as a negative boost in circulation
+    chain.mine(timestamp=first + 1)
+    assert veboost_delegation.adjusted_balance_of(alice) > 0
+    veboost_delegation.create_boost(alice, bob, 1_000, 0, first + 10 * WEEK, 2, {"from": alice})
+
+    # and the remaining one is picked up once it expires
+    chain.mine(timestamp=first + gap_weeks * WEEK + 1)
+    with brownie.reverts(dev_revert_msg="dev: negative boost token is in circulation"):
+        veboost_delegation.create_boost(alice, bob, 1_000, 0, first + 60 * WEEK, 3, {"from": alice})
+
+
+def test_cancel_long_dated_boost(alice, bob, chain, veboost_delegation):
+    now = chain.time() // WEEK * WEEK
+    veboost_delegation.create_boost(alice, bob, 1_000, 0, now + 150 * WEEK, 0, {"from": alice})
+    veboost_delegation.create_boost(alice, bob, 1_000, 0, now + 200 * WEEK, 1, {"from": alice})
+
+    veboost_delegation.cancel_boost(veboost_delegation.get_token_id(alice, 0), {"from": bob})
+    veboost_delegation.cancel_boost(veboost_delegation.get_token_id(alice, 1), {"from": bob})
+
+    assert veboost_delegation.delegated_boost(alice) == 0
+    chain.mine(timestamp=now + 201 * WEEK)
+    assert veboost_delegation.adjusted_balance_of(alice) > 0
@@ -0,0 +1,73 @@
+import pytest
+
+DAY = 86400
+WEEK = DAY * 7
+
+pytestmark = pytest.mark.usefixtures("lock_alice")
+
+
+def token_values(veboost_delegation, alice, ids):
+    return [veboost_delegation.token_boost(veboost_delegation.get_token_id(alice, i)) for i in ids]
+
+
+def test_expired_boost_is_not_over_penalized(alice, bob, chain, veboost_delegation, voting_escrow):
+    now = chain.time() // WEEK * WEEK
+    veboost_delegation.create_boost(alice, bob, 5_000, 0, now + 2 * WEEK, 0, {"from": alice})
+    veboost_delegation.create_boost(alice, bob, 2_000, 0, now + 10 * WEEK, 1, {"from": alice})
+
+    chain.mine(timestamp=now + 3 * WEEK + 100)
+    expired, active = token_values(veboost_delegation, alice, [0, 1])
+    assert expired < 0 < active
+
+    adjusted = veboost_delegation.adjusted_balance_of(alice)
+    assert adjusted > 0
+    assert adjusted == voting_escrow.balanceOf(alice) - active + expired
+    assert veboost_delegation.adjusted_balance_of(bob) == voting_escrow.balanceOf(bob) + max(
+        active + expired, 0
+    )
+
+
+def test_settle_expired(alice, bob, chain, veboost_delegation):
+    now = chain.time() // WEEK * WEEK
+    for i in range(4):
+        veboost_delegation.create_boost(
+            alice, bob, 1_000, 0, now + (i + 2) * WEEK, i, {"from": alice}
+        )
+
+    chain.mine(timestamp=now + 4 * WEEK + 100)
+    before = veboost_delegation.adjusted_balance_of(alice)
+
+    veboost_delegation.settle_expired(alice, {"from": bob})
+
+    assert veboost_delegation.settled_time(alice) == now + 4 * WEEK
+    assert veboost_delegation.expired_delegated(alice) == sum(
+        veboost_delegation.delegated_expiries(alice, now + (i + 2) * WEEK) for i in range(3)
+    )
+    assert veboost_delegation.adjusted_balance_of(alice) == before
+
+
+def test_cancel_settled_boost(alice, bob, chain, veboost_delegation, voting_escrow):
+    now = chain.time() // WEEK * WEEK
+    veboost_delegation.create_boost(alice, bob, 5_000, 0, now + 2 * WEEK, 0, {"from": alice})
+    veboost_delegation.create_boost(alice, bob, 2_000, 0, now + 10 * WEEK, 1, {"from": alice})
+
+    chain.mine(timestamp=now + 3 * WEEK)
+    veboost_delegation.settle_expired(alice, {"from": alice})
+    assert veboost_delegation.expired_delegated(alice) != 0
+
+    veboost_delegation.cancel_boost(veboost_delegation.get_token_id(alice, 0), {"from": bob})
+
+    assert veboost_delegation.expired_delegated(alice) == 0
+    active = token_values(veboost_delegation, alice, [1])[0]
+    assert veboost_delegation.adjusted_balance_of(alice) == voting_escrow.balanceOf(alice) - active
+
+
+def test_cancel_unsettled_boost(alice, bob, chain, veboost_delegation, voting_escrow):
+    now = chain.time() // WEEK * WEEK
+    veboost_delegation.create_boost(alice, bob, 5_000, 0, now + 2 * WEEK, 0, {"from": alice})
+
+    chain.mine(timestamp=now + 3 * WEEK)
+    veboost_delegation.cancel_boost(veboost_delegation.get_token_id(alice, 0), {"from": bob})
+
+    assert veboost_delegation.delegated_expiries(alice, now + 2 * WEEK) == 0
+    assert veboost_delegation.adjusted_balance_of(alice) == voting_escrow.balanceOf(alice)